@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the impact pipeline, using synthetic county weather.
+
+Each run generates a synthetic NetCDF of daily temperatures, with the
+fips, lat, lon and time variables that
+effect_bundle.call_with_generator expects, and passes it through the
+same stages as a real impact: reading the NetCDF, calling a
+make_generator for every county, writing effect files, packing the
+bundle tar, aggregating it to states and the nation, and extracting
+year-window results.  Response curves are stub functions, standing in
+for the models from remote.view_model, so no data paths or network
+access are needed.
+
+Each stage is reported with its time, throughput in county-years per
+second, and the peak RSS of the process so far.  Reports are saved as
+baselines under benchmark/baselines/, keyed by the git commit, and
+compared to the most recent earlier baseline with the same size, so
+regressions show up across commits.
+
+Run as:
+  python -m <package>.benchmark.pipeline [--counties N] [--years N]
+"""
+__author__ = "James Rising"
+__maintainer__ = "James Rising"
+__email__ = "jrising@berkeley.edu"
+
+__status__ = "Production"
+__version__ = "$Revision$"
+# $Source$
+
+import os, time, json, resource, tempfile, shutil, subprocess, argparse
+import numpy as np
+try:
+    # this is required to write the synthetic weather, but we can wait to fail
+    from netCDF4 import Dataset
+except:
+    pass
+
+from ..iam import effect_bundle, weather
+from ..extract import results
+
+# Path to this directory, for accessing relative file data
+scriptdirpath = os.path.dirname(os.path.realpath(__file__))
+
+# Baselines are saved here, as <commit>-<counties>x<years>.json
+baselinedir = os.path.join(scriptdirpath, 'baselines')
+
+# Stages, in the order they are run
+stages = ['ncdf-read', 'generator', 'write-effect-file', 'tar', 'aggregate-tar', 'extract']
+
+# A run is flagged as a regression if a stage is this much slower than the baseline
+regression_tolerance = 1.2
+
+### Synthetic inputs
+
+def make_synthetic_ncdf(filename, counties=100, years=20, year0=2000, seed=0):
+    """Write a NetCDF of daily temperatures (in K), as [days x counties].
+    Days are listed in yyyyddd form, with 365 days per year.
+    """
+    random = np.random.RandomState(seed)
+
+    # Counties are given FIPS codes within 50 states
+    fipses = [(1 + ii % 50) * 1000 + 1 + 2 * (ii // 50) for ii in range(counties)]
+    times = [year * 1000 + day for year in range(year0, year0 + years) for day in range(365)]
+
+    # Seasonal cycle plus noise, warmer to the south
+    lats = random.uniform(25, 49, counties)
+    lons = random.uniform(-124, -67, counties)
+    seasonal = 12 * np.sin(2 * np.pi * (np.arange(len(times)) % 365) / 365. - np.pi / 2)
+    tas = 273.15 + 35 - .6 * lats[np.newaxis, :] + seasonal[:, np.newaxis] + random.normal(0, 4, (len(times), counties))
+
+    rootgrp = Dataset(filename, 'w', format='NETCDF4')
+    rootgrp.createDimension('time', len(times))
+    rootgrp.createDimension('fips', counties)
+
+    rootgrp.createVariable('time', 'i4', ('time',))[:] = times
+    rootgrp.createVariable('fips', 'i4', ('fips',))[:] = fipses
+    rootgrp.createVariable('lat', 'f4', ('fips',))[:] = lats
+    rootgrp.createVariable('lon', 'f4', ('fips',))[:] = lons
+    rootgrp.createVariable('tas', 'f4', ('time', 'fips'))[:, :] = tas
+    rootgrp.close()
+
+class StubCurve(object):
+    """Stands in for a response curve from remote.view_model: a
+    quadratic response to daily temperature (in C), per day.
+    """
+
+    def __init__(self, optimum=20., scale=1e-4):
+        self.optimum = optimum
+        self.scale = scale
+
+    def __call__(self, temps):
+        return self.scale * (temps - self.optimum)**2
+
+def make_stub_generator(curve):
+    """Make-generator summing the curve over each year's days, as
+    daily.make_daily_yearlydaybins does with a remote model.
+    """
+
+    def generate(fips, yyyyddd, temps, **kw):
+        if fips == effect_bundle.FIPS_COMPLETE:
+            return
+
+        for (year, temps) in weather.yearly_daily_ncdf(yyyyddd, temps):
+            result = np.sum(curve(temps - 273.15))
+
+            if not np.isnan(result):
+                yield (year, result)
+
+    return generate
+
+### Measurement
+
+def peak_rss():
+    """Peak resident set size of this process so far, in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+
+class StageTimer(object):
+    """Collects the time, throughput and peak RSS of each stage."""
+
+    def __init__(self, countyyears):
+        self.countyyears = countyyears
+        self.report = {} # {stage: {seconds, countyyears_per_sec, peak_rss_mb}}
+
+    def run(self, stage, func, *args, **kw):
+        """Call func(*args, **kw), recording it as stage; returns its result."""
+        start = time.time()
+        result = func(*args, **kw)
+        seconds = time.time() - start
+
+        self.report[stage] = dict(seconds=seconds, countyyears_per_sec=self.countyyears / seconds if seconds > 0 else float('inf'), peak_rss_mb=peak_rss())
+        print "%-18s %8.3f s %12.1f county-years/s %8.1f MB" % (stage, seconds, self.report[stage]['countyyears_per_sec'], self.report[stage]['peak_rss_mb'])
+
+        return result
+
+### Stages
+
+def read_ncdf(filename):
+    """Read the NetCDF as call_with_generator does; returns (rootgrp, weather)."""
+    rootgrp = Dataset(filename, 'r+', format='NETCDF4')
+    return (rootgrp, rootgrp.variables['tas'][:, :])
+
+def consume_generators(rootgrp, weather, make_generator):
+    """Call make_generator for every county, discarding the results."""
+    times = rootgrp.variables['time'][:]
+    counties = rootgrp.variables['fips'][:]
+
+    for ii in range(len(counties)):
+        for yearresult in make_generator(effect_bundle.canonical_fips(counties[ii]), times, weather[:, ii]):
+            pass
+
+def write_effect_files(name, ncdf, make_generator):
+    """Write an effect file for every county, into the directory <name>."""
+    os.mkdir(name)
+
+    def write_csv(name, fips, generator):
+        effect_bundle.write_effect_file(name, fips, generator, "fraction")
+
+    effect_bundle.call_with_generator(name, ncdf, 'tas', make_generator, write_csv)
+
+def pack_tar(name):
+    """Pack the effect files into <name>.tar.gz, as make_tar_ncdf does."""
+    os.system("tar -czf " + name + ".tar.gz " + name)
+    shutil.rmtree(name)
+
+def aggregate(name):
+    """Aggregate the bundle to states and to the nation."""
+    effect_bundle.aggregate_tar(name, targetdir='.')
+    effect_bundle.aggregate_tar(name, targetdir='.', get_region=True)
+
+def extract(name, yearses):
+    """Read the year-window means of every state, as the extract scripts do."""
+    os.mkdir('extract')
+    os.system("tar -xzf " + name + "-state.tar.gz -C extract")
+
+    means = {}
+    for filename in os.listdir(os.path.join('extract', name + '-state')):
+        with open(os.path.join('extract', name + '-state', filename)) as fp:
+            means[filename[0:-4]] = [np.mean(values) for values in results.get_yearses(fp, yearses)]
+
+    shutil.rmtree('extract')
+    return means
+
+def run(counties=100, years=20, year0=2000):
+    """Run every stage once; returns the report."""
+    # Everything happens in a private scratch directory
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='benchmark-')
+    os.chdir(workdir)
+
+    try:
+        make_synthetic_ncdf('synthetic.nc', counties, years, year0)
+        make_generator = make_stub_generator(StubCurve())
+
+        timer = StageTimer(counties * years)
+        (rootgrp, weather) = timer.run('ncdf-read', read_ncdf, 'synthetic.nc')
+        timer.run('generator', consume_generators, rootgrp, weather, make_generator)
+        rootgrp.close()
+
+        timer.run('write-effect-file', write_effect_files, 'benchmark', 'synthetic.nc', make_generator)
+        timer.run('tar', pack_tar, 'benchmark')
+        timer.run('aggregate-tar', aggregate, 'benchmark')
+        timer.run('extract', extract, 'benchmark', [(year0, year0 + years / 2 - 1), (year0 + years / 2, year0 + years - 1)])
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir)
+
+    return dict(counties=counties, years=years, commit=current_commit(), created=time.time(), stages=timer.report)
+
+### Baselines
+
+def current_commit():
+    """The short hash of the current git commit, or 'unknown'."""
+    try:
+        with open(os.devnull, 'w') as devnull:
+            return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=scriptdirpath, stderr=devnull).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def save_baseline(report):
+    """Save a report as the baseline for its commit and size."""
+    if not os.path.exists(baselinedir):
+        os.mkdir(baselinedir)
+
+    filename = "%s-%dx%d.json" % (report['commit'], report['counties'], report['years'])
+    with open(os.path.join(baselinedir, filename), 'w') as fp:
+        json.dump(report, fp, indent=2, sort_keys=True)
+
+def load_baseline(counties, years, exclude_commit=None):
+    """Load the most recent baseline of this size, from another commit; None if there is none."""
+    if not os.path.exists(baselinedir):
+        return None
+
+    latest = None
+    for filename in os.listdir(baselinedir):
+        if not filename.endswith("-%dx%d.json" % (counties, years)):
+            continue
+
+        with open(os.path.join(baselinedir, filename)) as fp:
+            report = json.load(fp)
+
+        if report['commit'] == exclude_commit:
+            continue
+        if latest is None or report['created'] > latest['created']:
+            latest = report
+
+    return latest
+
+def compare(report, baseline):
+    """Print the change in each stage since the baseline; returns the list of regressed stages."""
+    regressed = []
+
+    print "Compared to", baseline['commit']
+    for stage in stages:
+        if stage not in baseline['stages'] or stage not in report['stages']:
+            continue
+
+        ratio = report['stages'][stage]['seconds'] / max(baseline['stages'][stage]['seconds'], 1e-9)
+        flag = ''
+        if ratio > regression_tolerance:
+            regressed.append(stage)
+            flag = 'REGRESSION'
+
+        print "%-18s %6.2fx %s" % (stage, ratio, flag)
+
+    return regressed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the impact pipeline with synthetic county weather')
+    parser.add_argument('--counties', type=int, default=100, help='number of synthetic counties')
+    parser.add_argument('--years', type=int, default=20, help='number of synthetic years')
+    parser.add_argument('--no-save', action='store_true', help='do not save this run as a baseline')
+    args = parser.parse_args()
+
+    report = run(args.counties, args.years)
+
+    baseline = load_baseline(args.counties, args.years, exclude_commit=report['commit'])
+    if baseline is not None:
+        compare(report, baseline)
+
+    if not args.no_save:
+        save_baseline(report)
@@ -14,13 +14,49 @@ GAMSDIR = {
 	'rcp45':'/mnt/superBlock02B/coastal/',
 	'rcp26':'/mnt/superBlock01/coastal/'}
 
+#	Number of Monte Carlo runs simulated together, as [year x run] arrays
+RUN_BLOCK = 500
+
 if not os.path.isdir(MC_DIR):
 	os.mkdir(MC_DIR)
 
+#	The simulation runs on [year x run] arrays, but reproduces the arithmetic of the 
+#	original scalar loop exactly, so that its output files are unchanged:
+
+def fsum(values):
+	'''math.fsum of a list of numbers or, elementwise, of arrays'''
+	if len(values) <= 2:
+		#	one correctly rounded addition is exact, like fsum
+		return 0.0 + sum(values)
+	shape = np.broadcast(*values).shape
+	if shape == ():
+		return math.fsum(values)
+	return np.array(map(math.fsum,zip(*[np.broadcast_to(v,shape).ravel() for v in values]))).reshape(shape)
+
+def maxzero(values,valuesint=False):
+	'''elementwise max(values,0), and where that is the int 0 rather than a float'''
+	isint = (0 > values) | valuesint
+	return np.where(0 > values,0.,values), isint
+
+def positive(values):
+	'''elementwise max(0,values)'''
+	return np.where(values > 0,values,0.)
+
+def fsumrows(values,rowranges,divisor=1):
+	'''lists of math.fsum(values[rows])/divisor for each run (column), for each set of rows'''
+	return [[math.fsum(col)/divisor for col in values[rows].T.tolist()] for rows in rowranges]
+
+def formatvalues(values,isint=None):
+	'''values as '{i}'.format would write them, with '0' where isint'''
+	strings = map(str,values.tolist())
+	if isint is not None:
+		strings = [('0' if i else st) for st,i in zip(strings,isint.tolist())]
+	return strings
+
 class LSLProjection(object):
-  '''
-  Reads LSLprojMC files into numpy arrays column-by-column and provides an interpolated interface to individual Monte-Carlo samples
-  '''
+	'''
+	Reads LSLprojMC files into numpy arrays, once per file, and provides an interpolated interface to individual Monte-Carlo samples
+	'''
 
 	@classmethod
 	def getGaugeByID(cls,gaugeID,rcp):
@@ -30,12 +66,19 @@ class LSLProjection(object):
 		self.filename = filename
 		self.numProjections = numProjections
 		self.years = np.loadtxt(self.filename,dtype=int,delimiter='\t',skiprows=1,usecols=(0,))
+		self.data = None
+	def getData(self):
+		'''returns projected LSL[ft] as a [year x run] array, reading the file on first use'''
+		if self.data is None:
+			#	load projected LSL -- AND CONVERT TO FEET --
+			self.data = np.loadtxt(self.filename,dtype=float,delimiter='\t',skiprows=1,ndmin=2)[:,1:]*mm_to_ft
+		return self.data
 	def getProjectionByID(self,ID):
 		'''returns a scipy.interpolate.interp1d object linearly interpolating LSL[ft] as a function of year'''
-		#	load projected LSL -- AND CONVERT TO FEET --
-		raw = np.loadtxt(self.filename,dtype=float,delimiter='\t',skiprows=1,usecols=(ID+1,))*mm_to_ft
-
-		return interpolate.interp1d(self.years,np.array(raw))
+		return interpolate.interp1d(self.years,np.array(self.getData()[:,ID]))
+	def getProjectionsByID(self,IDs,years):
+		'''returns LSL[ft] in each of years for each of the runs IDs, as a [year x run] array'''
+		return interpolate.interp1d(self.years,self.getData()[:,IDs],axis=0)(years)
 	def getProjection(self):
 		'''yields the next scipy.interpolate.interp1d object in the (ordered) list of runs'''
 		for proj in range(self.numProjections):
@@ -74,14 +117,14 @@ class Impact(object):
 			#	Find damages with potential activity changes
 			activDamage = 0
 			if self.state+'_coast' in self.__dict__[damageType]:
-				activDamage += math.fsum([self.__dict__[damageType][self.state+'_coast'][m][category](lsl) 
+				activDamage += fsum([self.__dict__[damageType][self.state+'_coast'][m][category](lsl) 
 						for m in self.__dict__[damageType][self.state+'_coast'].keys()])/len(self.__dict__[damageType][self.state+'_coast'].keys())
 			if self.state+'_inland' in self.__dict__[damageType]:
-				activDamage += math.fsum([self.__dict__[damageType][self.state+'_inland'][m][category](lsl) 
+				activDamage += fsum([self.__dict__[damageType][self.state+'_inland'][m][category](lsl) 
 						for m in self.__dict__[damageType][self.state+'_inland'].keys()])/len(self.__dict__[damageType][self.state+'_inland'].keys())
 
-			#	Linearly combine the two given the year
-			damage = histDamage + float(year-2010)/(2100-2010) * (activDamage-histDamage)
+			#	Linearly combine the two given the year (or an array of years)
+			damage = histDamage + np.asarray(year-2010,dtype=float)/(2100-2010) * (activDamage-histDamage)
 
 		else:
 			raise OSError('damageType {t} not recognized'.format(t=damageType))
@@ -168,6 +211,17 @@ class OutputData(object):
 			self.periodFiles['USA'] = WriteFile(MC_DIR,rcp,hurr,'USA',self.txttps,'20yr')
 			self.yearlyFiles['USA'] = WriteFile(MC_DIR,rcp,hurr,'USA',self.txtyrs,'annual')
 
+	def writeruns(self,reg,inund,direct,bi):
+		'''
+		write the period and yearly rows of a region for a block of runs, 
+		given [year x run] arrays of damages over self.allyears
+		'''
+		total = direct + bi
+		for files,periods,ranges,divisor in [(self.periodFiles,self.tps,self.tpranges,20),(self.yearlyFiles,self.yrs,self.yrranges,1)]:
+			rows = [[self.allyears.index(yr) for yr in ranges[tp]] for tp in periods]
+			columns = sum([fsumrows(values,rows,divisor) for values in [inund,direct,bi,total]],[])
+			files[reg].writeoutdata(''.join([','.join(map(str,row))+'\n' for row in zip(*columns)]))
+
 class GamsFile(object):
 	def __init__(self,gmsdir,rcp,hurr,mcrun,yearset,regset):
 		self.gmsdir		=	gmsdir
@@ -197,6 +251,12 @@ class GamsFile(object):
 		with open(self.filepaths[2],'a') as wfile:
 			wfile.write('{st}.{y} {i}\n'.format(st=state,y=year,i=bi))
 
+	def postyears(self,state,years,inund,direct,bi):
+		'''post a list of years at once, with each value already formatted'''
+		for fp,values in zip(self.filepaths,[inund,direct,bi]):
+			with open(fp,'a') as wfile:
+				wfile.write(''.join(['{st}.{y} {i}\n'.format(st=state,y=year,i=v) for year,v in zip(years,values)]))
+
 	def close(self):
 		gdxes = []
 		for fp in self.filepaths:
@@ -250,120 +310,86 @@ def main(args):
 	#plotdata()
 	#return
 
-	for run in range(iterstart,iterations):
+	years = np.array(outdata.allyears)
 
-		if histograms:
+	for blockstart in range(iterstart,iterations,RUN_BLOCK):
+		runs = range(blockstart,min(blockstart+RUN_BLOCK,iterations))
 
-			natInund = {y:0 for y in outdata.allyears}
-			natDirect = {y:0 for y in outdata.allyears}
-			natBI = {y:0 for y in outdata.allyears}
-			natInundInc = {y:0 for y in outdata.allyears}
+		if histograms:
 
-			ncaInund = {nca:{y:0 for y in outdata.allyears} for nca in data.ncaRegs.keys()}
-			ncaDirect = {nca:{y:0 for y in outdata.allyears} for nca in data.ncaRegs.keys()}
-			ncaBI = {nca:{y:0 for y in outdata.allyears} for nca in data.ncaRegs.keys()}
-			ncaInundInc = {nca:{y:0 for y in outdata.allyears} for nca in data.ncaRegs.keys()}
+			natInund = np.zeros((len(years),len(runs)))
+			natDirect = np.zeros((len(years),len(runs)))
+			natBI = np.zeros((len(years),len(runs)))
 
-		if gamsfiles:
+			ncaInund = {nca:np.zeros((len(years),len(runs))) for nca in data.ncaRegs.keys()}
+			ncaDirect = {nca:np.zeros((len(years),len(runs))) for nca in data.ncaRegs.keys()}
+			ncaBI = {nca:np.zeros((len(years),len(runs))) for nca in data.ncaRegs.keys()}
 
-			gamsfile = GamsFile(GAMSDIR[args.rcp],rcp,hurr,run,outdata.allyears,sorted(data.state_station_map.keys()))
+		#	GAMS values by state, in the order they are posted
+		gamsposts = []
 
 		for gauge in data.station_map:
-			lsl = data.proj[gauge].getProjectionByID(run)
-			lsl2010 = lsl(2010)	#	Index year for Sea level used in CALIBRATING damage curve is 2010
+			#	LSL[ft] above 2010 (constrained to be positive), as [year x run]
+			lsl = data.proj[gauge].getProjectionsByID(runs,years)
+			lsl = positive(lsl - lsl[0])
+
 			for state in data.station_map[gauge]:
-				stInund = {}
-				stInundInc = {}
-				if histograms:
-					stDirect = {}
-					stBI = {}
 
-				inund2010, direct2010, bi2010 = data.impacts[state].alldamage(max(0,lsl(2010)-lsl2010),hurr,2010)
-				inund2011, direct2011, bi2011 = data.impacts[state].alldamage(max(0,lsl(2011)-lsl2010),hurr,2011)
+				#	Get impacts from state damage curve corresponding to sea level in state
+				damages = data.impacts[state].alldamage(lsl,hurr,years[:,np.newaxis])
+				i,d,b = [np.broadcast_to(np.asarray(dmg,dtype=float),lsl.shape) for dmg in damages]
 
-				maxInundLev = 0
-				gamsInundLev = 0
+				#	Damages are the int 0 where a state has no damage curves
+				iint,dint,bint = [isinstance(dmg,(int,long)) for dmg in damages]
 
-				for yr in outdata.allyears:
+				if gamsfiles:
+					#	Running maximum of inundation above 2011, as max(x,level) from an int 0
+					gamsInundLev = np.zeros((len(years),len(runs)))
+					gamsInundInt = np.zeros((len(years),len(runs)),dtype=bool)
+					level, levelint = np.zeros(len(runs)), np.ones(len(runs),dtype=bool)
+					for y in range(len(years)):
+						keep = level > (i[y] - i[1])
+						level, levelint = np.where(keep,level,i[y] - i[1]), np.where(keep,levelint,iint)
+						gamsInundLev[y], gamsInundInt[y] = level, levelint
 
-					#	Get impacts from state damage curve corresponding to sea level in state (constrained to be positive)
-					i,d,b = data.impacts[state].alldamage(max(0,lsl(yr)-lsl2010),hurr,yr)
+					gamsDirect, gamsDirectInt = maxzero(d - d[1],dint)
+					gamsBI, gamsBIInt = maxzero(b - b[1],bint)
+					gamsposts.append((state,gamsInundLev[1:],gamsInundInt[1:],gamsDirect[1:],gamsDirectInt[1:],gamsBI[1:],gamsBIInt[1:]))
 
-					# if yr%20 == 0:
-					# 	print(state,gauge,yr,lsl(yr)-lsl2010,i,d,b)
+				if histograms:
 
 					#	Tabulate state data.exposure below sea level (inundation losses)
-					stInund[yr] = max(i - inund2010,0)
-					stInundInc[yr] = max(0,stInund[yr] - maxInundLev)
-					maxInundLev = max(maxInundLev,stInund[yr])
-
-					gamsInundLev = max((i-inund2011),gamsInundLev)
-
-					if gamsfiles and yr >= 2011:
-						gamsfile.post(state,yr,gamsInundLev,max(d-direct2011,0),max(b-bi2011,0))
-
-					if histograms:
-
-						#	Tabulate direct and BI costs, and discount by inundated property
-						stDirect[yr] = max(d - direct2010,0)*max(0,data.exposure[state]-stInund[yr])/data.exposure[state]
-						stBI[yr] = max(b - bi2010,0)*max(0,data.exposure[state]-stInund[yr])/data.exposure[state]
-						
+					stInund = maxzero(i - i[0])[0]
 
-						natInund[yr] += stInund[yr]
-						natDirect[yr] += stDirect[yr]
-						natBI[yr] += stBI[yr]
-						natInundInc[yr] += stInundInc[yr]
+					#	Tabulate direct and BI costs, and discount by inundated property
+					stDirect = maxzero(d - d[0])[0]*positive(data.exposure[state]-stInund)/data.exposure[state]
+					stBI = maxzero(b - b[0])[0]*positive(data.exposure[state]-stInund)/data.exposure[state]
 
-						ncaInund[data.getNCAreg[state]][yr] += stInund[yr]
-						ncaDirect[data.getNCAreg[state]][yr] += stDirect[yr]
-						ncaBI[data.getNCAreg[state]][yr] += stBI[yr]
-						ncaInundInc[data.getNCAreg[state]][yr] += stInundInc[yr]
+					natInund += stInund
+					natDirect += stDirect
+					natBI += stBI
 
-				if histograms:
-
-					outdata.periodFiles[state].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-							IN=','.join(['{i}'.format(i=(math.fsum([float(stInund[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-							DI=','.join(['{i}'.format(i=(math.fsum([float(stDirect[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-							BI=','.join(['{i}'.format(i=(math.fsum([float(stBI[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-							TOT=','.join(['{i}'.format(i=(math.fsum([float(stDirect[yr]+stBI[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps])))
+					ncaInund[data.getNCAreg[state]] += stInund
+					ncaDirect[data.getNCAreg[state]] += stDirect
+					ncaBI[data.getNCAreg[state]] += stBI
 
-					outdata.yearlyFiles[state].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-							IN=','.join(['{i}'.format(i=(math.fsum([float(stInund[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-							DI=','.join(['{i}'.format(i=(math.fsum([float(stDirect[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-							BI=','.join(['{i}'.format(i=(math.fsum([float(stBI[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-							TOT=','.join(['{i}'.format(i=(math.fsum([float(stDirect[yr]+stBI[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs])))
+					outdata.writeruns(state,stInund,stDirect,stBI)
 
 		if gamsfiles:
-			gamsfile.close()
+
+			for j,run in enumerate(runs):
+				gamsfile = GamsFile(GAMSDIR[args.rcp],rcp,hurr,run,outdata.allyears,sorted(data.state_station_map.keys()))
+				for state,inund,inundint,direct,directint,bi,biint in gamsposts:
+					gamsfile.postyears(state,outdata.allyears[1:],
+						formatvalues(inund[:,j],inundint[:,j]),formatvalues(direct[:,j],directint[:,j]),formatvalues(bi[:,j],biint[:,j]))
+				gamsfile.close()
 
 		if histograms:
 
 			for nca in data.ncaRegs.keys():
+				outdata.writeruns(nca,ncaInund[nca],ncaDirect[nca],ncaBI[nca])
 
-				outdata.periodFiles[nca].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-					IN=','.join(['{i}'.format(i=(math.fsum([float(ncaInund[nca][yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-					DI=','.join(['{i}'.format(i=(math.fsum([float(ncaDirect[nca][yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-					BI=','.join(['{i}'.format(i=(math.fsum([float(ncaBI[nca][yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-					TOT=','.join(['{i}'.format(i=(math.fsum([float(ncaDirect[nca][yr]+ncaBI[nca][yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps])))
-
-				outdata.yearlyFiles[nca].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-					IN=','.join(['{i}'.format(i=(math.fsum([float(ncaInund[nca][yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-					DI=','.join(['{i}'.format(i=(math.fsum([float(ncaDirect[nca][yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-					BI=','.join(['{i}'.format(i=(math.fsum([float(ncaBI[nca][yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-					TOT=','.join(['{i}'.format(i=(math.fsum([float(ncaDirect[nca][yr]+ncaBI[nca][yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs])))
-
-	
-			outdata.periodFiles['USA'].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-				IN=','.join(['{i}'.format(i=(math.fsum([float(natInund[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-				DI=','.join(['{i}'.format(i=(math.fsum([float(natDirect[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-				BI=','.join(['{i}'.format(i=(math.fsum([float(natBI[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps]),
-				TOT=','.join(['{i}'.format(i=(math.fsum([float(natDirect[yr]+natBI[yr]) for yr in outdata.tpranges[tp]])/20)) for tp in outdata.tps])))
-
-			outdata.yearlyFiles['USA'].writeoutdata('{IN},{DI},{BI},{TOT}\n'.format(
-				IN=','.join(['{i}'.format(i=(math.fsum([float(natInund[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-				DI=','.join(['{i}'.format(i=(math.fsum([float(natDirect[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-				BI=','.join(['{i}'.format(i=(math.fsum([float(natBI[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs]),
-				TOT=','.join(['{i}'.format(i=(math.fsum([float(natDirect[yr]+natBI[yr]) for yr in outdata.yrranges[tp]]))) for tp in outdata.yrs])))
+			outdata.writeruns('USA',natInund,natDirect,natBI)
 
 
 
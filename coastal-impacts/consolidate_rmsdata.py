@@ -1,8 +1,15 @@
 '''
 Utility for consolidating RMS Hurricane damage directories into a single CSV
+
+With --store, consolidates all RMS storm data into the single binary 
+store read by lib.rms.StormDatabase.load_store instead:
+
+	python consolidate_rmsdata.py data/RMSData/Historical
+	python consolidate_rmsdata.py --store [data/RMSData]
 '''
 
 import sys, os, re, pandas as pd
+from lib import rms
 
 def get_all_data(directory):
 	
@@ -40,8 +47,14 @@ def main(directory):
 	newfpath = os.path.join(writedir, os.path.basename(os.path.normpath(directory)) + '.csv')
 	write_data(data, newfpath)
 
+def build_store(directory):
+	rms.StormDatabase.consolidate(directory)
+	print('Wrote ' + rms.STORM_STORE)
+
 if __name__ == "__main__":
-	if len(sys.argv) > 0:
+	if len(sys.argv) > 1 and sys.argv[1] == '--store':
+		build_store(sys.argv[2] if len(sys.argv) > 2 else rms.DEFAULT_RMS_DATA)
+	elif len(sys.argv) > 1:
 		main(sys.argv[1])
 	else:
 		print('Read directory path required. Aborting...')
\ No newline at end of file
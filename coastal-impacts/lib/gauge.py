@@ -19,6 +19,10 @@ HEADER = [(r, q)  for r in ('rcp85','rcp45','rcp26') for q in [0.001,0.005,0.01,
 LSL_GAUGEDIR = 'data/NorthAmerica'
 LSL_QUANTS = 'data/NorthAmerica/NorthAmerica_LSLproj_full_allquants.tsv'
 
+# Yearly Monte Carlo LSLs, as a [gauge x rcp x year x draw] array, within LSL_GAUGEDIR
+LSL_MC_CACHE = 'LSLprojMC_yearly_{unit}.npy'
+LSL_MC_PATTERN = re.compile(r'LSLprojMC_(?P<gID>[0-9]+)_(?P<rcp>rcp(26|45|60|85))\.tsv')
+
 
 def set_index_levels(index, level, levels, inplace=False):
 	before = [index.levels[i].tolist() for i, lev in enumerate(index.names) if i < index.names.index(level)]
@@ -180,6 +184,133 @@ class GaugeDatabase(object):
 		data.columns.names = ['YEAR']
 		return data
 
+	@staticmethod
+	def _interpolate_yearly_array(knots, data, years=np.arange(2010, 2101)):
+		'''
+		Interpolate [knots x ...] LSLs, relative to 2010, to yearly values
+
+		Returns a [years x ...] array, identical to _interpolate_yearly_lsl 
+		(np.interp on each series), but computed for all series at once.
+		'''
+		knots = np.asarray(knots, dtype=np.float64)
+		data = data - data[np.nonzero(knots == 2010)[0][0]]
+
+		# Find the bracketing knots for each year, as np.interp does
+		j = np.searchsorted(knots, years, side='right') - 1
+		jj = np.minimum(j, len(knots) - 2)
+
+		x0 = knots[jj].reshape((-1,) + (1,) * (data.ndim - 1))
+		x1 = knots[jj + 1].reshape(x0.shape)
+		xx = np.asarray(years, dtype=np.float64).reshape(x0.shape)
+		y0, y1 = data[jj], data[jj + 1]
+
+		with np.errstate(divide='ignore', invalid='ignore'):
+			slope = (y1 - y0) / (x1 - x0)
+			result = slope * (xx - x0) + y0
+
+		# Years on a knot take its value exactly
+		onknot = (x0 == xx) | (j >= len(knots) - 1).reshape(x0.shape)
+		return np.where(onknot, data[np.minimum(j, len(knots) - 1)], result)
+
+	@classmethod
+	def build_montecarlo_cache(cls, directory=LSL_GAUGEDIR, unit='mm', include=None, years=np.arange(2010, 2101)):
+		'''
+		Convert the Monte Carlo gauge projections into a memory-mappable array
+
+		Reads each LSLprojMC_<gauge>_<rcp>.tsv file once, converts it to unit, 
+		interpolates it to yearly values relative to 2010, and writes all of 
+		them to a [gauge x rcp x year x draw] array in directory/LSL_MC_CACHE. 
+		The gauges, rcps, years, included gauges, and source files and their 
+		modification times are written alongside, in <cache>.index.npz. 
+		Missing gauge/rcp combinations are NaN.
+
+		By default, includes the gauges in STATE_STATION_MAP.
+		'''
+
+		include = cls._montecarlo_include(include)
+		sources = cls._montecarlo_sources(directory, include)
+
+		gauges = sorted(set([g for g, r in sources.keys()]))
+		rcps = sorted(set([r for g, r in sources.keys()]))
+
+		cachefile = os.path.join(directory, LSL_MC_CACHE.format(unit=unit))
+		cache = None
+
+		for (gauge_id, rcp), filepath in sorted(sources.items()):
+			gauge = cls._get_montecarlo_gauge(filepath, gauge_id, rcp, draws=cls._count_draws(filepath))
+			assert gauge.unit in cls.STANDARDIZE, "Gauge {} LSL unit {} not recognized. Check unit definitions.".format(gauge.gauge_id, gauge.unit)
+
+			if cache is None:
+				cache = np.lib.format.open_memmap(cachefile, mode='w+', dtype=np.float64, shape=(len(gauges), len(rcps), len(years), gauge.data.shape[1]))
+				cache[:] = np.nan
+
+			data = gauge.data * cls.STANDARDIZE[gauge.unit] / cls.STANDARDIZE[unit]
+			cache[gauges.index(gauge_id), rcps.index(rcp)] = cls._interpolate_yearly_array(data.index.values, data.values, years)
+
+		cache.flush()
+		del cache
+
+		np.savez(cachefile + '.index.npz', gauges=gauges, rcps=rcps, years=years, include=include,
+			sources=[sources[key] for key in sorted(sources.keys())],
+			mtimes=[os.path.getmtime(sources[key]) for key in sorted(sources.keys())])
+
+	@staticmethod
+	def _count_draws(filepath):
+		''' Number of draw columns in a Monte Carlo gauge file '''
+		with open(filepath, 'r') as lslfile:
+			next(lslfile)
+			return np.arange(len(next(lslfile).rstrip('\n').split('\t')) - 1)
+
+	@classmethod
+	def _montecarlo_include(cls, include=None):
+		''' Sorted array of the gauge IDs to include (default: the gauges in STATE_STATION_MAP) '''
+		if include is None:
+			include = cls.STATE_STATION_MAP.values()
+		return np.array(sorted(set(include)), dtype=int)
+
+	@staticmethod
+	def _montecarlo_sources(directory, include):
+		''' Monte Carlo gauge files in directory for the gauges in include, by (gauge ID, rcp) '''
+		sources = {}
+		for f in sorted(os.listdir(directory)):
+			match = re.search(LSL_MC_PATTERN, f)
+			if match and int(match.group('gID')) in include:
+				sources[(int(match.group('gID')), match.group('rcp'))] = os.path.join(directory, f)
+		return sources
+
+	@classmethod
+	def _read_montecarlo_cache(cls, directory=LSL_GAUGEDIR, unit='mm', include=None, years=np.arange(2010, 2101)):
+		'''
+		Open the cache written by build_montecarlo_cache, without reading it
+
+		Returns (array, index), or (None, None) if there is no cache, or it 
+		was built with different include or years settings, or the source 
+		files have been added, removed, or changed since it was built.
+		'''
+
+		cachefile = os.path.join(directory, LSL_MC_CACHE.format(unit=unit))
+		if not (os.path.exists(cachefile) and os.path.exists(cachefile + '.index.npz')):
+			return None, None
+
+		include = cls._montecarlo_include(include)
+		sources = cls._montecarlo_sources(directory, include)
+
+		try:
+			index = dict(np.load(cachefile + '.index.npz'))
+			current = (
+				np.array_equal(index['include'], include) and
+				np.array_equal(index['years'], years) and
+				list(index['sources']) == [sources[key] for key in sorted(sources.keys())] and
+				all(os.path.getmtime(source) == mtime for source, mtime in zip(index['sources'], index['mtimes'])))
+		except (IOError, OSError, KeyError, ValueError):
+			current = False
+
+		if not current:
+			print('Monte Carlo LSL cache {} is out of date; reading source files'.format(cachefile))
+			return None, None
+
+		return np.load(cachefile, mmap_mode='r'), index
+
 	@classmethod
 	def _reindex_gauge_data_to_states(cls, data, gauge_index = 'GAUGE'):
 		data = cls._deepstack(data)
@@ -191,7 +322,7 @@ class GaugeDatabase(object):
 
 	@classmethod
 	def _get_all_montecarlo_gauges(cls, directory=LSL_GAUGEDIR, include=None, draws = np.arange(10000)):
-		pattern = re.compile(r'LSLprojMC_(?P<gID>[0-9]+)_(?P<rcp>rcp(26|45|60|85))\.tsv')
+		pattern = LSL_MC_PATTERN
 		
 		new_gauges = {}
 
@@ -220,7 +351,20 @@ class GaugeDatabase(object):
 
 	# INSTANCE METHODS
 	
-	def load_montecarlo_lsls(self, directory=LSL_GAUGEDIR, draws=np.arange(10000)):
+	def load_montecarlo_lsls(self, directory=LSL_GAUGEDIR, draws=np.arange(10000), cache=True):
+		'''
+		Load yearly Monte Carlo LSLs by state for the given draws
+
+		Reads from the array written by build_montecarlo_cache, if it is 
+		available and up to date, and from the source files otherwise.
+		'''
+
+		if cache:
+			lsls, index = self._read_montecarlo_cache(directory, self.unit)
+			if lsls is not None:
+				self.mc_data = self._get_cached_montecarlo_lsls(lsls, index, draws)
+				return
+
 		state_gauges = set(self.STATE_STATION_MAP.values())
 		
 		gauges = {}
@@ -244,6 +388,34 @@ class GaugeDatabase(object):
 
 		self.mc_data = mc_data.unstack('DRAW')
 
+	def _get_cached_montecarlo_lsls(self, lsls, index, draws):
+		''' Format cached LSLs as load_montecarlo_lsls does: (RCP, YEAR, STATE) by DRAW '''
+
+		if (not isinstance(draws, Iterable)) or (hasattr(draws, 'shape') and len(draws.shape) == 0):
+			draws = np.array([draws])
+		draws = np.sort(np.array(draws))
+
+		# A contiguous range of draws is read as a slice of the memory map
+		if len(draws) > 0 and (np.diff(draws) == 1).all():
+			drawslice = slice(draws[0], draws[-1] + 1)
+		else:
+			drawslice = draws
+
+		gauges = list(index['gauges'])
+		rows = [gauges.index(self.STATE_STATION_MAP[st]) if self.STATE_STATION_MAP[st] in gauges else None for st in self.STATES]
+
+		# Assemble [rcp x year x state x draw]
+		values = np.empty((len(index['rcps']), len(index['years']), len(self.STATES), len(draws)))
+		for i, row in enumerate(rows):
+			values[:, :, i, :] = lsls[row][:, :, drawslice] if row is not None else np.nan
+
+		mc_data = pd.DataFrame(
+			values.reshape((-1, len(draws))),
+			index=pd.MultiIndex.from_product([list(index['rcps']), list(index['years']), self.STATES], names=['RCP','YEAR','STATE']),
+			columns=pd.Index(draws, name='DRAW'))
+
+		return mc_data.dropna(how='all')
+
 	def load_median_lsls(self, filepath=LSL_QUANTS):
 		median_data = {}
 
@@ -272,17 +444,9 @@ class GaugeDatabase(object):
 		Format LSL values used by RMS for diagnostics run
 		'''
 
-		# Gather RMS LSL data from exposure dataset
-		lsls = []
-
-		for coast in ['east','west']:
-			exposure = rms.Exposure(coast=coast)
-			exposure.read()
-			exposure.convert()
-			lsls.append(exposure.data.xs(50, level='MSL.Q').xs('ALL', level='LOB')[['LSL']])
-
-		# Format LSL data into a pd.Series object
-		rms_data = pd.concat(lsls, axis=0)['LSL']
+		# Gather RMS LSL data from exposure dataset, as a pd.Series object
+		exposure, _ = rms.Exposure.load_all('mm')
+		rms_data = exposure.xs(50, level='MSL.Q').xs('ALL', level='LOB')['LSL']
 
 		# Fill in missing states according to coastline
 		data_states = rms_data.index.get_level_values('STATE').unique()
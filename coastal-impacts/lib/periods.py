@@ -0,0 +1,214 @@
+'''
+Summarizes coastal damages by period, one block of draws at a time
+
+Damages from simulation.CoastRun are changes from the first (2010)
+year of each damage series, summed across damage rows and averaged
+over the years of each period. These are linear in the damages, so they
+are computed as a sparse [group x damage] matrix applied to each block
+of draws, and only the per-draw group values are kept. Quantiles across
+draws are then exact, computed from the group values on disk.
+
+Usage:
+
+	[1] summary = PeriodSummary(index, postprocess_groups(index))
+	[2] for values in blocks:                           # [damage x draw] arrays
+	...     summary.add(values)
+	[3] summary.quantiles('storm', [0.05, 0.5, 0.95])   # groups by quantile
+	[4] summary.close()
+'''
+
+
+import os, tempfile
+import pandas as pd, numpy as np, scipy.sparse as sparse
+
+# Number of values read at once when computing quantiles
+BLOCK_VALUES = 2**25
+
+# Quantiles across draws reported by summarize
+QUANTILES = [0.05, 0.167, 0.5, 0.833, 0.95]
+
+# Storm types included in storm damages
+STORMS = ['historical', 'climatological', 'noreaster']
+
+# NCA regions, from the NCA Final Report, Page 370, Table 1
+NCA_REGIONS = {
+	'NEA': ['CT', 'DE', 'ME', 'MD', 'MA', 'NH', 'NJ', 'NY', 'PA', 'RI', 'VT', 'WV', 'DC'],
+	'SEA': ['AL', 'AR', 'FL', 'GA', 'KY', 'LA', 'MS', 'NC', 'SC', 'TN', 'VA'],
+	'MWE': ['IL', 'IN', 'IA', 'MI', 'MN', 'MO', 'OH', 'WI'],
+	'GPL': ['KS', 'MT', 'NE', 'ND', 'OK', 'SD', 'TX', 'WY'],
+	'NWE': ['ID', 'OR', 'WA'],
+	'SWE': ['AZ', 'CA', 'CO', 'NV', 'NM', 'UT'],
+	'ALK': ['AK'],
+	'HWI': ['HI']}
+
+
+def period_label(year):
+	''' The 20-year period of CoastRun.postprocess containing year, or "None" '''
+	if year < 2020 or year > 2099:
+		return "None"
+	return '{} to {}'.format(((year-2020)//20*20+2020), ((year-2020)//20*20+2039))
+
+
+def base_rows(index, year_level='YEAR'):
+	'''
+	Position of the first row of each row's damage series
+
+	Series are the rows sharing all index levels except year_level. The
+	index must be sorted, so that each series begins with its first year.
+	'''
+
+	keys = index.droplevel(year_level)
+	codes, _ = pd.factorize(keys)
+	return np.unique(codes, return_index=True)[1][codes]
+
+
+def groups_matrix(nrows, rows, labels, years, names, groups=None):
+	'''
+	Build a sparse [group x damage] matrix of period means
+
+	Damage row rows[i] contributes to the group labels[i] (a tuple) in
+	year years[i]. Each group is the mean, over its years, of the sum of
+	its rows in each year. Returns the group index (the sorted labels,
+	unless groups is given) and the matrix.
+	'''
+
+	if groups is None:
+		groups = pd.MultiIndex.from_tuples(sorted(set(labels)), names=names)
+	positions = groups.get_indexer(pd.MultiIndex.from_tuples(labels, names=names))
+
+	years_counted = pd.DataFrame({'group': positions, 'year': years}).drop_duplicates()
+	nyears = np.bincount(years_counted['group'].values, minlength=len(groups)).astype(float)
+
+	matrix = sparse.csr_matrix((1. / nyears[positions], (positions, rows)), shape=(len(groups), nrows))
+	return groups, matrix
+
+
+def postprocess_groups(index):
+	'''
+	Groups of CoastRun.postprocess: storm and inundation damages, summed
+	across states and sectors, by 20-year period
+
+	Returns {'storm': (groups, matrix), 'inundation': (groups, matrix)}.
+	'''
+
+	names = [c for c in index.names if c not in ['STORM', 'SECTOR', 'STATE', 'YEAR']]
+	storm = index.get_level_values('STORM')
+	years = index.get_level_values('YEAR').values
+	periods = np.array([period_label(y) for y in range(years.min(), years.max() + 1)])[years - years.min()]
+
+	results = {}
+	for name, selected in [('storm', np.in1d(storm, STORMS)), ('inundation', storm == 'inundation')]:
+		rows = np.nonzero(selected & (periods != "None"))[0]
+		labels = zip(*([index.get_level_values(c)[rows] for c in names] + [periods[rows]]))
+		results[name] = groups_matrix(len(index), rows, labels, years[rows], names + ['PERIOD'])
+
+	return results
+
+
+class DrawStore(object):
+	'''
+	Append-only [draw x group] values, kept in a temporary file
+
+	Quantiles across draws are exact, as np.percentile on each group, but
+	only a block of groups is read into memory at once.
+	'''
+
+	def __init__(self, ngroups, directory=None):
+		self.ngroups = ngroups
+		self.ndraws = 0
+
+		fd, self.filepath = tempfile.mkstemp(suffix='.f8', dir=directory)
+		self.fp = os.fdopen(fd, 'wb')
+
+	def append(self, values):
+		''' Add a [group x draw] block of values '''
+		np.ascontiguousarray(values.T, dtype=np.float64).tofile(self.fp)
+		self.ndraws += values.shape[1]
+
+	def read(self, groups=slice(None)):
+		''' Return a [draw x group] array for the given groups '''
+		self.fp.flush()
+		if self.ndraws == 0:
+			return np.empty((0, self.ngroups))[:, groups]
+		return np.array(np.memmap(self.filepath, dtype=np.float64, mode='r', shape=(self.ndraws, self.ngroups))[:, groups])
+
+	def percentiles(self, pp):
+		''' Return a [group x percentile] array, for percentiles pp in [0, 100] '''
+
+		results = np.empty((self.ngroups, len(pp)))
+		block = max(1, BLOCK_VALUES // max(1, self.ndraws))
+
+		for g in range(0, self.ngroups, block):
+			results[g:g+block] = np.percentile(self.read(slice(g, g+block)), pp, axis=0).T
+
+		return results
+
+	def close(self):
+		self.fp.close()
+		os.remove(self.filepath)
+
+
+class PeriodSummary(object):
+	'''
+	Accumulates period means of damage changes for blocks of draws
+
+	groups is {name: (group index, matrix)}, as from postprocess_groups.
+	Blocks of [damage x draw] values are passed to add; NaN damages are
+	skipped, as in pandas sums.
+	'''
+
+	def __init__(self, index, groups, directory=None):
+		self.base = base_rows(index)
+		self.groups = groups
+		self.stores = {name: DrawStore(len(groups[name][0]), directory) for name in groups}
+		self.draws = []
+
+	def add(self, values, draws=None):
+		''' Add a [damage x draw] block of values, for the given draw labels '''
+
+		changes = values - values[self.base]
+		changes[np.isnan(changes)] = 0
+
+		for name, (groups, matrix) in self.groups.items():
+			self.stores[name].append(matrix.dot(changes))
+
+		self.draws.extend(draws if draws is not None else range(len(self.draws), len(self.draws) + values.shape[1]))
+
+	def means(self, name):
+		''' Return a DataFrame of the per-draw means of a set of groups '''
+		return pd.DataFrame(self.stores[name].read().T, index=self.groups[name][0], columns=pd.Index(self.draws, name='DRAW'))
+
+	def quantiles(self, name, qs):
+		''' Return a DataFrame of the quantiles qs (in [0, 1]) across draws of a set of groups '''
+		return pd.DataFrame(self.stores[name].percentiles(np.array(qs) * 100), index=self.groups[name][0], columns=qs)
+
+	def percentiles(self, name, pp):
+		''' Return a DataFrame of the percentiles pp (in [0, 100]) across draws of a set of groups '''
+		return pd.DataFrame(self.stores[name].percentiles(pp), index=self.groups[name][0], columns=pp)
+
+	def close(self):
+		for store in self.stores.values():
+			store.close()
+
+
+def summarize(index, blocks, directory=None):
+	'''
+	Summarize damages as in CoastRun.postprocess, from blocks of draws
+
+	blocks yields (draws, values) for [damage x draw] values on the sorted
+	damage index. Returns (storm, exposure) DataFrames by period: the
+	QUANTILES across draws, or the draw's means if there is only one.
+	'''
+
+	summary = PeriodSummary(index, postprocess_groups(index), directory)
+
+	try:
+		for draws, values in blocks:
+			summary.add(values, draws)
+
+		if len(summary.draws) > 1:
+			return summary.quantiles('storm', QUANTILES), summary.quantiles('inundation', QUANTILES)
+		return summary.means('storm'), summary.means('inundation')
+
+	finally:
+		summary.close()
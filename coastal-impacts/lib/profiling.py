@@ -0,0 +1,102 @@
+'''
+Per-stage timing and memory accounting for coastal runs
+
+Each stage of a run records its wall time, the resident set size (RSS)
+of the process before and after it, and the peak RSS of the process so
+far. Stages may add their own values, such as the number of draws or the
+size of the arrays they allocate. Reports are plain dictionaries, saved
+as JSON.
+
+Usage:
+
+	[1] profile = RunProfile('mc-0000-0100')
+	[2] with profile.stage('simulate') as record:
+	...     values = simulate()
+	...     record['array_mb'] = values.nbytes / MB
+	[3] print(profile.summary())
+	[4] profile.save('profile.json')
+'''
+
+
+import time, json, resource, contextlib
+
+MB = float(2**20)
+
+
+def current_rss():
+	''' Resident set size of this process in MB, or None where /proc is not available '''
+
+	try:
+		with open('/proc/self/statm', 'r') as statm:
+			pages = int(statm.read().split()[1])
+	except (IOError, OSError, IndexError, ValueError):
+		return None
+
+	return pages * resource.getpagesize() / MB
+
+
+def peak_rss():
+	''' Peak resident set size of this process so far, in MB '''
+	return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+
+
+class RunProfile(object):
+	'''
+	Records the time and memory of each stage of a run, in order
+	'''
+
+	def __init__(self, name=None):
+		self.name = name
+		self.created = time.time()
+		self.stages = []
+
+	@contextlib.contextmanager
+	def stage(self, name, **info):
+		'''
+		Time a stage of the run, yielding its record so that the stage can
+		add values to it. The record is kept even if the stage fails.
+		'''
+
+		record = dict(stage=name, rss_start_mb=current_rss(), **info)
+		start = time.time()
+
+		try:
+			yield record
+		finally:
+			record['seconds'] = time.time() - start
+			record['rss_end_mb'] = current_rss()
+			record['peak_rss_mb'] = peak_rss()
+			self.stages.append(record)
+
+	def get(self, name):
+		''' Return the records of all stages called name '''
+		return [record for record in self.stages if record['stage'] == name]
+
+	def seconds(self, *names):
+		''' Total time of the stages called names, or of all stages '''
+		return sum([record['seconds'] for record in self.stages if (not names) or record['stage'] in names])
+
+	def report(self):
+		return dict(
+			name=self.name,
+			created=self.created,
+			seconds=self.seconds(),
+			peak_rss_mb=peak_rss(),
+			stages=self.stages)
+
+	def summary(self):
+		''' Format the stages as a table, one line per stage '''
+
+		lines = ['{:<22} {:>10} {:>12} {:>12}'.format('stage', 'seconds', 'rss (MB)', 'peak (MB)')]
+		for record in self.stages:
+			rss = record['rss_end_mb']
+			lines.append('{:<22} {:>10.3f} {:>12} {:>12.1f}'.format(
+				record['stage'], record['seconds'], '{:.1f}'.format(rss) if rss is not None else '-', record['peak_rss_mb']))
+
+		return '\n'.join(lines)
+
+	def save(self, filepath):
+		''' Write the report as JSON '''
+
+		with open(filepath, 'w') as fp:
+			json.dump(self.report(), fp, indent=2, sort_keys=True)
@@ -5,15 +5,110 @@ Proecss RMS storm data for the slimpacts package
 
 import pandas as pd, numpy as np
 import re
-import os, traceback
+import os, traceback, cPickle, hashlib
 
 DEFAULT_RMS_DATA = 'data/RMSData'
 DEFAULT_NOREASTER_FILE = 'noreaster/WinterStorm_Noreaster_LossEstimates_20140321.tsv'
+DEFAULT_HISTORICAL_DIR = 'Historical'
+DEFAULT_VALUE_AT_RISK_FILE = 'data/RMSData/valueAtRisk.csv'
+
+# Climatological hurricane runs read by StormDatabase.consolidate, by name
+CLIMATOLOGY_DIRS = {
+	'rcp45': '45_Climatology',
+	'rcp85': '85_update/CMIP5.RCP8.5.MEAN.B.v2.Climatology-2014-05-22'}
+
+# All storm loss curves, written by StormDatabase.consolidate
+STORM_STORE = 'data/RMSData/StormDatabase.npz'
+
+# Converted exposure and value-at-risk tables, keyed by source file hashes
+EXPOSURE_CACHE = 'data/RMSData/ExposureBelow_{unit}.npz'
+VALUE_AT_RISK_CACHE = 'data/RMSData/valueAtRisk.npz'
 
 coastline = {st:st for st in ['HI','AK','OR','WA','CA','TX','LA','MS','AL','ME','MA','NH','RI','CT','NY','NJ','DE','MD','DC','VA','NC','SC','GA','FL','PA']}
 coastline['WV'] = 'VA'
 coastline['VT'] = 'NH'
 
+
+def file_hash(filepath):
+	''' SHA-1 digest of a file's contents '''
+
+	digest = hashlib.sha1()
+	with open(filepath, 'rb') as f:
+		for block in iter(lambda: f.read(2**20), b''):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def read_cache(cachefile, sources):
+	'''
+	Load the arrays saved by write_cache, as a dict
+
+	Returns None if there is no cache, or if it was written from other 
+	source files or any source file's contents have changed since.
+	'''
+
+	if not os.path.exists(cachefile):
+		return None
+
+	cache = dict(np.load(cachefile))
+	if cache['sources'].tolist() != list(sources) or cache['hashes'].tolist() != [file_hash(s) for s in sources]:
+		print('Cache {} is out of date; reading source files'.format(cachefile))
+		return None
+
+	return cache
+
+
+def write_cache(cachefile, sources, **arrays):
+	''' Save arrays to a .npz cache, with the hashes of the source files they were computed from '''
+
+	# Write to a temporary file first, so a cache is never partial
+	try:
+		with open(cachefile + '.tmp', 'wb') as fp:
+			np.savez(fp, sources=np.array(sources), hashes=np.array([file_hash(s) for s in sources]), **arrays)
+		os.rename(cachefile + '.tmp', cachefile)
+	except (IOError, OSError), e:
+		print('Cache {} not written: {}'.format(cachefile, e))
+
+
+def index_arrays(index, prefix=''):
+	''' Arrays of the names and values of the levels of a (Multi)Index, for write_cache '''
+
+	arrays = {prefix + 'names': np.array(index.names)}
+	for i, name in enumerate(index.names):
+		arrays['{}level_{}'.format(prefix, i)] = np.array(index.get_level_values(i).tolist())
+	return arrays
+
+
+def index_from_arrays(arrays, prefix=''):
+	''' Rebuild an index saved with index_arrays '''
+
+	names = arrays[prefix + 'names'].tolist()
+	levels = [arrays['{}level_{}'.format(prefix, i)].tolist() for i in range(len(names))]
+	return pd.MultiIndex.from_arrays(levels, names=names)
+
+
+def load_value_at_risk(filepath=DEFAULT_VALUE_AT_RISK_FILE, cache=VALUE_AT_RISK_CACHE):
+	'''
+	Total building and contents value at risk by state, as a Series
+
+	Read from cache if it is up to date with filepath, and written to it 
+	otherwise. Pass cache=None to always read filepath.
+	'''
+
+	if cache is not None:
+		arrays = read_cache(cache, [filepath])
+		if arrays is not None:
+			return pd.Series(arrays['values'], index=pd.Index(arrays['level_0'].tolist(), name='STATE'))
+
+	risk = pd.read_csv(filepath, index_col=[0,1], header=[0,1]).stack()
+	state_risk = risk[['BUILDING','CONTENTS']].sum(axis=1).sum(level='STATE')
+
+	if cache is not None:
+		write_cache(cache, [filepath], values=state_risk.values, **index_arrays(state_risk.index))
+
+	return state_risk
+
+
 class HurricaneFile(object):
 	'''
 	Reads in an RMS hurricane damage projection file
@@ -123,17 +218,7 @@ class HurricaneSet(object):
 
 		self.data = pd.DataFrame([])
 
-		ee = Exposure('data/RMSData/EastCoastExposureBelow.tsv')
-		ee.read()
-		ee.convert('mm')
-		we = Exposure('data/RMSData/WestCoastExposureBelow.tsv')
-		we.read()
-		we.convert('mm')
-
-		assert ee.unit == we.unit, 'Different units found for East Coast and West Coast LSL measures. Align units.'
-
-
-		exposure = pd.concat([ee.data, we.data], axis=0)
+		exposure, _ = Exposure.load_all('mm')
 
 		for f in os.listdir(self.directory):
 			if not re.search(HurricaneFile.HURRICANE_PARSER, f):
@@ -251,16 +336,7 @@ class NoreasterFile(object):
 
 		# Get LSL data and add to index
 
-		ee = Exposure('data/RMSData/EastCoastExposureBelow.tsv')
-		ee.read()
-		ee.convert('mm')
-		we = Exposure('data/RMSData/WestCoastExposureBelow.tsv')
-		we.read()
-		we.convert('mm')
-
-		assert ee.unit == we.unit, 'Different units found for East Coast and West Coast LSL measures. Align units.'
-
-		exposure = pd.concat([ee.data, we.data], axis=0)
+		exposure, _ = Exposure.load_all('mm')
 
 		# Drop noreaster data for states with no storm gauge (assume unaffected by sea level rise)
 		data = data.iloc[np.in1d(data.index.get_level_values('STATE'), coastline.keys()), :]
@@ -380,27 +456,254 @@ class Exposure(object):
 			missing = [(st,lob) for st in self.COASTS[self.coast] for lob in self.LOBS if not (st, lob) in self.exposure[sl].index]
 			self.exposure[sl] = self.exposure[sl].append(pd.Series([dummy_interpolator for _ in missing], index=pd.MultiIndex.from_tuples(missing)))
 
+	def interpolators(self):
+		'''
+		Exposure below each SL_MEAS as a function of LSL, by STATE and LOB
+
+		Returns {sl: StormInterpolator}, equivalent to the functions of 
+		interpolate, with zero exposure for the coast's missing groups.
+		'''
+
+		exposure_data = self.data.set_index('LSL', append=True)
+		exposure_data = exposure_data[['ExposureMSL','ExposureMHHW']].fillna(0)
+		exposure_data = exposure_data.reset_index(['YEAR','MSL.Q'], drop=True)
+		exposure_data.index = exposure_data.index.reorder_levels(['STATE','LOB','LSL'])
+
+		interpolators = {}
+
+		for sl in self.SL_MEAS:
+			data = exposure_data['Exposure{}'.format(sl)]
+			missing = [(st,lob) for st in self.COASTS[self.coast] for lob in self.LOBS if not (st, lob) in data.index.droplevel('LSL')]
+			dummy = pd.Series(0., index=pd.MultiIndex.from_tuples([(st, lob, lsl) for st, lob in missing for lsl in [-10,10]], names=data.index.names))
+			interpolators[sl] = StormInterpolator(data.append(dummy).sort_index(), levels=['STATE','LOB'])
+
+		return interpolators
+
+	@classmethod
+	def load_all(cls, unit='mm', cache=EXPOSURE_CACHE):
+		'''
+		Read, convert, and interpolate the exposure files of both coasts
+
+		Returns the converted data of both coasts, as in Exposure.data, and 
+		{sl: StormInterpolator} of exposure below, as from interpolators. 
+		Both are read from cache (formatted with unit) if it is up to date 
+		with the exposure files, and written to it otherwise. Pass 
+		cache=None to always read the exposure files.
+		'''
+
+		sources = [cls.DEFAULT_EXPOSURE_FILES[coast] for coast in sorted(cls.DEFAULT_EXPOSURE_FILES.keys())]
+
+		if cache is not None:
+			cache = cache.format(unit=unit)
+			arrays = read_cache(cache, sources)
+			if arrays is not None:
+				data = pd.DataFrame(arrays['data_values'], index=index_from_arrays(arrays, 'data_'), columns=arrays['data_columns'].tolist())
+				return data, {sl: StormInterpolator.from_arrays(arrays, sl + '_') for sl in cls.SL_MEAS}
+
+		coasts = []
+		for coast in sorted(cls.DEFAULT_EXPOSURE_FILES.keys()):
+			exp = cls(coast=coast)
+			exp.read()
+			exp.convert(unit)
+			coasts.append(exp)
+
+		assert all(list(exp.data.columns) == list(coasts[0].data.columns) for exp in coasts), 'Different columns found for East Coast and West Coast exposure. Align units.'
+
+		data = pd.concat([exp.data for exp in coasts], axis=0)
+		coast_interpolators = [exp.interpolators() for exp in coasts]
+		interpolators = {sl: StormInterpolator.concat([interp[sl] for interp in coast_interpolators]) for sl in cls.SL_MEAS}
+
+		if cache is not None:
+			arrays = index_arrays(data.index, 'data_')
+			arrays.update(data_values=data.values.astype(np.float64), data_columns=np.array(list(data.columns)))
+			for sl in cls.SL_MEAS:
+				arrays.update(interpolators[sl].to_arrays(sl + '_'))
+			write_cache(cache, sources, **arrays)
+
+		return data, interpolators
+
+
+
+class StormInterpolator(object):
+	'''
+	Damage as a piecewise-linear function of LSL, for each storm damage group
+
+	Knots and values for every (STATE, COASTALFLAG, SECTOR) group are stacked 
+	into [groups x knots] arrays, padded with infinite knots. Evaluating a 
+	group is identical to np.interp over its knots, but all groups are 
+	evaluated at once, and the object can be pickled. Exposure.interpolators 
+	uses the same layout for exposure below sea level, by STATE and LOB.
+
+	Usage:
+
+		[1] interp = StormInterpolator(data)
+		[2] interp.index
+		MultiIndex(levels=[[u'AL', ...], [0, 1], [u'BI', u'DIRECT']], ...)
+
+		[3] interp(lsl)                     # lsl is [groups x draws x years]
+		[4] interp(lsl, interp.locate('FL')) # lsl is [FL groups x ...]
+	'''
+
+	def __init__(self, data, levels=['STATE','COASTALFLAG','SECTOR']):
+		''' Initialize from a sorted Series (or one-column DataFrame) indexed by levels and LSL '''
+
+		if len(data.shape) > 1:
+			data = data.iloc[:,0]
+
+		groups = data.groupby(level=levels, sort=True)
+		self.index = pd.MultiIndex.from_tuples([name for name, _ in groups], names=levels)
+
+		self.counts = np.array([len(group) for _, group in groups])
+		width = max(2, self.counts.max())
+
+		# Pad each group with infinite knots, repeating its last value
+		self.knots = np.empty((len(self.counts), width))
+		self.knots.fill(np.inf)
+		self.values = np.zeros((len(self.counts), width))
+
+		for i, (_, group) in enumerate(groups):
+			self.knots[i, :self.counts[i]] = group.index.get_level_values('LSL').values
+			self.values[i, :self.counts[i]] = group.values
+			self.values[i, self.counts[i]:] = group.values[-1]
+
+	@classmethod
+	def from_arrays(cls, arrays, prefix=''):
+		''' Rebuild an interpolator saved with to_arrays '''
+
+		interp = cls.__new__(cls)
+		interp.index = index_from_arrays(arrays, prefix)
+		interp.knots = arrays[prefix + 'knots']
+		interp.values = arrays[prefix + 'values']
+		interp.counts = arrays[prefix + 'counts']
+		return interp
+
+	@classmethod
+	def concat(cls, interpolators):
+		''' Combine interpolators with distinct groups, sorting the groups '''
+
+		width = max(interp.knots.shape[1] for interp in interpolators)
+
+		def pad(values, fill):
+			padding = np.empty((values.shape[0], width - values.shape[1]))
+			padding[:] = fill
+			return np.concatenate([values, padding], axis=1)
+
+		interp = cls.__new__(cls)
+		index = interpolators[0].index.append([i.index for i in interpolators[1:]])
+		order = np.argsort(index.values)
+
+		interp.index = pd.MultiIndex.from_tuples(index[order].tolist(), names=index.names)
+		# Pad each group with infinite knots, repeating its last value
+		interp.knots = np.concatenate([pad(i.knots, np.inf) for i in interpolators], axis=0)[order]
+		interp.values = np.concatenate([pad(i.values, i.values[:, -1:]) for i in interpolators], axis=0)[order]
+		interp.counts = np.concatenate([i.counts for i in interpolators])[order]
+		return interp
+
+	def to_arrays(self, prefix=''):
+		''' Arrays of the groups, knots and values of this interpolator, for write_cache '''
+
+		arrays = index_arrays(self.index, prefix)
+		arrays.update({prefix + 'knots': self.knots, prefix + 'values': self.values, prefix + 'counts': self.counts})
+		return arrays
+
+	def __len__(self):
+		return len(self.index)
+
+	def locate(self, state):
+		''' Return the positions of all groups for a state '''
+		return np.nonzero(self.index.get_level_values('STATE') == state)[0]
+
+	def __call__(self, lsl, groups=None):
+		'''
+		Evaluate damages at lsl, an array whose first axis matches groups
+
+		groups are positions in self.index (all groups by default). The 
+		result has the shape of lsl.
+		'''
+
+		if groups is None:
+			groups = np.arange(len(self.index))
+		groups = np.asarray(groups)
+
+		lsl = np.asarray(lsl, dtype=np.float64)
+		x = lsl.reshape((len(groups), -1))
+
+		knots = self.knots[groups]
+		values = self.values[groups]
+		counts = self.counts[groups][:, np.newaxis]
+		rows = np.arange(len(groups))[:, np.newaxis]
+
+		# Find the last knot at or below each point, as np.interp does
+		j = np.zeros(x.shape, dtype=int) - 1
+		with np.errstate(invalid='ignore'):
+			for k in range(knots.shape[1]):
+				j += (knots[:, k:k+1] <= x)
+
+		# Interpolate within the bracketing segment
+		jj = np.minimum(np.maximum(j, 0), np.maximum(counts - 2, 0))
+		x0, x1 = knots[rows, jj], knots[rows, jj + 1]
+		y0, y1 = values[rows, jj], values[rows, jj + 1]
+
+		with np.errstate(divide='ignore', invalid='ignore'):
+			slope = (y1 - y0) / (x1 - x0)
+			interior = slope * (x - x0) + y0
+			interior = np.where(np.isnan(interior), slope * (x - x1) + y1, interior)
+
+		last = values[rows, counts - 1]
+		result = np.where(j < 0, values[:, :1], np.where(j >= counts - 1, last, np.where(x0 == x, y0, interior)))
+
+		# np.interp returns NaN for NaN, except for a single knot
+		result = np.where(np.isnan(x) & (counts > 1), np.nan, result)
+
+		return result.reshape(lsl.shape)
+
+	def apply_state(self, state, lsl):
+		''' Evaluate all groups of a state at a Series of LSLs, as a DataFrame of groups by lsl.index '''
+
+		groups = self.locate(state)
+		damages = self(np.tile(lsl.values, (len(groups), 1)), groups)
+
+		index = self.index[groups].droplevel('STATE')
+		return pd.DataFrame(damages, index=index, columns=lsl.index)
+
+	def to_series(self):
+		''' Return a Series of interpolating functions of LSL, one per group '''
+
+		def make_interpolator(i):
+			return lambda lsl: np.interp(lsl, self.knots[i, :self.counts[i]], self.values[i, :self.counts[i]])
+
+		return pd.Series([make_interpolator(i) for i in range(len(self.index))], index=self.index)
+
 
 
 class StormDatabase(object):
 	'''
 	Read in all RMS storm damage files and adjust Climatology estimates for phase-in
 
+	Interpolators are StormInterpolator objects, indexed by STATE, 
+	COASTALFLAG, and SECTOR.
+
 	Usage:
 
 		[1] db = StormDatabase()
 		[2] db.add_historical()
-		[3] db.historical.loc[('ALL','FL',1,'TOTAL','total')]
-		<function <lambda> at 0x0000000000000000>
+		[3] fl = db.historical.locate('FL')
 		
-		[4] db.historical.loc[('ALL','FL',1,'TOTAL','total')](500)
-		19207013219.051346
+		[4] db.historical(np.array([[500]] * len(fl)), fl)
 		
-		[5] db.historical.loc[('ALL','FL',1,'TOTAL','total')](np.arange(0,1000,100))
-		array([  1.28822663e+10,   1.36922779e+10,   1.46080328e+10,
-		         1.61752378e+10,   1.78289241e+10,   1.92070132e+10,
-		         2.07314345e+10,   2.22885991e+10,   2.40252953e+10,
-		         2.58686233e+10])
+		[5] db.historical.to_series().loc[('FL',1,'DIRECT')](np.arange(0,1000,100))
+
+		[6] db.save('storms.pkl')
+		[7] db = StormDatabase.load('storms.pkl')
+
+	To read the RMS files once, consolidate them into STORM_STORE, a 
+	single .npz file of the source tables and interpolator arrays of every 
+	storm type. Groups are sorted by state, so each state's loss curves 
+	are contiguous rows. load_store reads it back in one read, if no 
+	source file has changed:
+
+		[8] db = StormDatabase.consolidate()
+		[9] db = StormDatabase.load_store()
 
 	'''
 
@@ -412,7 +715,7 @@ class StormDatabase(object):
 		self.climatological = {}
 		self.clim_adjusted = {}
 
-	def add_historical(self, hist_dir='Historical'):
+	def add_historical(self, hist_dir=DEFAULT_HISTORICAL_DIR):
 		'''
 		Read all historical hurricane files and create interpolator Series
 
@@ -440,7 +743,7 @@ class StormDatabase(object):
 		if (not self._read_historical):
 			raise ValueError('Read historical estimates before adding climatological data')
 
-		if not ((hasattr(self.historical, 'shape')) and (len(self.historical) > 0)):
+		if not len(self.historical) > 0:
 			raise ValueError('Historical estimates not read correctly')
 
 		clim = HurricaneSet(os.path.join(self.directory, clim_dir))
@@ -475,10 +778,97 @@ class StormDatabase(object):
 
 		self.noreaster = self.get_interpolator(self.noreaster_source)
 
-	def get_interpolator(self, data):
+	def save(self, filepath):
+		''' Pickle this database, with its interpolators, for reuse '''
+		with open(filepath, 'wb') as f:
+			cPickle.dump(self, f, cPickle.HIGHEST_PROTOCOL)
 
-		def enforce_monotonic_increase(data):
-		  return data.groupby(level=['STATE','COASTALFLAG','SECTOR']).apply(lambda x: x.where(x.diff().fillna(0)>=0, np.nan))
+	@staticmethod
+	def load(filepath):
+		''' Load a database pickled with save '''
+		with open(filepath, 'rb') as f:
+			return cPickle.load(f)
+
+	@staticmethod
+	def source_files(directory=DEFAULT_RMS_DATA, clim_dirs=CLIMATOLOGY_DIRS):
+		''' All files read by consolidate, in a fixed order '''
+
+		sources = []
+
+		for subdir in [DEFAULT_HISTORICAL_DIR] + [clim_dirs[name] for name in sorted(clim_dirs.keys())]:
+			subdir = os.path.join(directory, subdir)
+			sources.extend(sorted([os.path.normpath(os.path.join(subdir, f)) for f in os.listdir(subdir) if re.search(HurricaneFile.HURRICANE_PARSER, f)]))
+
+		sources.append(os.path.join(directory, DEFAULT_NOREASTER_FILE))
+		sources.extend([Exposure.DEFAULT_EXPOSURE_FILES[coast] for coast in sorted(Exposure.DEFAULT_EXPOSURE_FILES.keys())])
+
+		return sources
+
+	@classmethod
+	def consolidate(cls, directory=DEFAULT_RMS_DATA, filepath=STORM_STORE, clim_dirs=CLIMATOLOGY_DIRS):
+		'''
+		Read all historical, noreaster and climatological storm files, 
+		and save them to a store at filepath for load_store
+
+		Returns the database.
+		'''
+
+		db = cls(directory)
+		db.add_historical()
+		db.add_noreaster()
+		for name in sorted(clim_dirs.keys()):
+			db.add_climatological(name=name, clim_dir=clim_dirs[name])
+
+		arrays = {'climatological': np.array(sorted(clim_dirs.keys()))}
+
+		tables = [('historical', db.hist_source, db.historical), ('noreaster', db.noreaster_source, db.noreaster)]
+		tables += [('clim_' + name, db.clim_source[name], db.clim_adjusted[name]) for name in sorted(clim_dirs.keys())]
+
+		for name, source, interp in tables:
+			arrays.update(index_arrays(source.index, name + '_source_'))
+			arrays[name + '_source_values'] = source.values
+			arrays[name + '_source_columns'] = np.array(list(source.columns))
+			arrays.update(interp.to_arrays(name + '_'))
+
+		write_cache(filepath, cls.source_files(directory, clim_dirs), **arrays)
+
+		return db
+
+	@classmethod
+	def load_store(cls, directory=DEFAULT_RMS_DATA, filepath=STORM_STORE, clim_dirs=CLIMATOLOGY_DIRS):
+		'''
+		Load a database saved by consolidate
+
+		Returns None if there is no store, or if it is out of date with the 
+		storm and exposure files in directory.
+		'''
+
+		arrays = read_cache(filepath, cls.source_files(directory, clim_dirs))
+		if arrays is None or arrays['climatological'].tolist() != sorted(clim_dirs.keys()):
+			return None
+
+		def source(name):
+			index = index_from_arrays(arrays, name + '_source_')
+			return pd.DataFrame(arrays[name + '_source_values'], index=index, columns=arrays[name + '_source_columns'].tolist())
+
+		db = cls(directory)
+		db.hist_source = source('historical')
+		db.historical = StormInterpolator.from_arrays(arrays, 'historical_')
+		db._read_historical = True
+
+		db.noreaster_source = source('noreaster')
+		db.noreaster = StormInterpolator.from_arrays(arrays, 'noreaster_')
+
+		# As after add_climatological, which does not build unadjusted interpolators
+		db.climatological = {}
+
+		for name in sorted(clim_dirs.keys()):
+			db.clim_source[name] = source('clim_' + name)
+			db.clim_adjusted[name] = StormInterpolator.from_arrays(arrays, 'clim_{}_'.format(name))
+
+		return db
+
+	def get_interpolator(self, data):
 
 		# interpolate to fill missing points:
 		# data[data == 0] = np.nan
@@ -486,11 +876,12 @@ class StormDatabase(object):
 		data.reset_index(['YEAR','QUANTILE'], drop=True, inplace=True)
 		data = data.sort_index()
 
-		data = enforce_monotonic_increase(data)
-
-		while np.isnan(data.values).any():
-		  data = data.dropna()
-		  data = enforce_monotonic_increase(data)
+		# Enforce a monotonic increase in damages with LSL, by dropping each 
+		# point below the running maximum of its group (equivalent to 
+		# repeatedly dropping points below their predecessor)
+		data = data.dropna()
+		values = data if len(data.shape) == 1 else data.iloc[:,0]
+		data = data[(values >= values.groupby(level=['STATE','COASTALFLAG','SECTOR']).cummax()).values]
 		
 		def fill_df(df):
 			if len(df.dropna()) < 2:
@@ -502,9 +893,26 @@ class StormDatabase(object):
 		data = data.fillna(0)
 
 		# create interpolating function of LSL
-		interp = lambda g: (lambda x: np.interp(x, g.index.get_level_values('LSL').values, g.values if len(g.shape) == 1 else g.iloc[:,0].values))
-		interpolated = data.sort_index().groupby(level=['STATE','COASTALFLAG','SECTOR']).apply(interp)
-		return interpolated
+		return StormInterpolator(data.sort_index())
+
+	def unique_historical(self):
+		'''
+		Historical VALUE Series, with rows repeated in the historical files dropped
+
+		Raises a ValueError if a row is repeated with different values, as 
+		these cannot be matched to climatological rows.
+		'''
+
+		hist = self.hist_source['VALUE']
+		if hist.index.is_unique:
+			return hist
+
+		hist = hist.to_frame().reset_index().drop_duplicates().set_index(hist.index.names)['VALUE']
+		if not hist.index.is_unique:
+			conflicts = hist.index[hist.index.duplicated()].unique()
+			raise ValueError('Historical storm data has {} rows with conflicting values, e.g. {}'.format(len(conflicts), list(conflicts[:3])))
+
+		return hist
 
 	def adjust_climatological(self, data):
 		'''
@@ -520,8 +928,14 @@ class StormDatabase(object):
 
 		data = data.copy()
 		
-		scalefactor = (1.0 / (((data.index.get_level_values('YEAR').values) - 2010).astype('float64') / (2100 - 2010)))
+		with np.errstate(divide='ignore', invalid='ignore'):
+			scalefactor = (1.0 / (((data.index.get_level_values('YEAR').values) - 2010).astype('float64') / (2100 - 2010)))
 		scalefactor[np.isinf(scalefactor) | np.isnan(scalefactor)] = 0
-		data['VALUE'] = (data['VALUE'] - self.hist_source['VALUE']) * scalefactor + self.hist_source['VALUE']
+
+		# Match historical values to each row once, rather than aligning Series
+		hist_source = self.unique_historical()
+		positions = hist_source.index.get_indexer(data.index)
+		hist = np.where(positions >= 0, hist_source.values[positions], np.nan)
+		data['VALUE'] = (data['VALUE'].values - hist) * scalefactor + hist
 
 		return data
\ No newline at end of file
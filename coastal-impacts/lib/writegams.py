@@ -1,9 +1,25 @@
 '''
 Provides utilities for writing pandas data to GAMS GDX files
+
+PyGDX requires the GAMS python API. So does GDXBatch, unless it is asked 
+to write GAMS source files declaring the same data (use_gams=False), as for 
+testing on machines without a GAMS install.
 '''
 
 import os
-import gams
+import numpy as np
+from collections import OrderedDict
+
+try:
+	import gams
+except ImportError:
+	gams = None
+
+def require_gams():
+	''' Raise an ImportError if the GAMS python API is not installed '''
+	if gams is None:
+		raise ImportError('The GAMS python API is required to write GDX files. Use GDXBatch(use_gams=False) to write GAMS source (.gms) files instead.')
+
 
 class PyGDX(object):
 	EXISTS_OPTS = ['update','replace','validate','error']
@@ -160,4 +176,199 @@ class PyGDX(object):
 
 
 	def series_to_param(self, name, series, explanatory_text='', exists='update', domain=None, set_exists=None, set_text=None):
-		return self.dataframe_to_param(name, series, explanatory_text, exists, domain, set_exists, set_text)
\ No newline at end of file
+		return self.dataframe_to_param(name, series, explanatory_text, exists, domain, set_exists, set_text)
+
+
+class GDXBatch(object):
+	'''
+	Sets and parameters for a batch of GDX files, held in memory and written in one pass
+
+	Sets are shared by every file in the batch. Parameter records are added 
+	as arrays, for a given file, and are checked against their domain sets 
+	as they are added. write() writes each file once, in a single export; 
+	write_merged() writes one GDX for the whole batch, in which each 
+	parameter has a leading dimension naming the file its records were 
+	added for, as in the output of gdxmerge.
+
+	With use_gams=False, GAMS source (.gms) files are written in place of 
+	GDX files, without the GAMS python API. These declare the same symbols 
+	and records, and compile to the GDX with, e.g.:
+
+		gams coastal_rcp85_hist_MSL_0.gms gdx=coastal_rcp85_hist_MSL_0.gdx
+
+	Otherwise the GAMS python API is required, and an ImportError is raised 
+	if it is not installed, rather than writing files the model cannot load.
+
+	Example usage:
+
+		batch = GDXBatch()
+		batch.add_set('tp', range(2011, 2101), 'Time periods in the model')
+		batch.add_parameter('out/file_0.gdx', 'impact', [years], values, ['tp'])
+		batch.write()
+	'''
+
+	def __init__(self, use_gams=True):
+		if use_gams:
+			require_gams()
+
+		self.use_gams = use_gams
+		self.sets = OrderedDict()
+		self.parameters = OrderedDict()
+		self.ws = None
+
+
+	def clear(self):
+		''' Remove every parameter record, keeping the sets '''
+		self.parameters = OrderedDict()
+
+	def add_set(self, name, values, explanatory_text=''):
+		self.sets[name] = ([str(v) for v in values], explanatory_text)
+
+	def add_parameter(self, filepath, name, keys, values, domain, explanatory_text=''):
+		'''
+		Add records of a parameter to the file filepath
+
+		keys is a list of arrays of labels, one for each set in domain, and 
+		values is a matching array of values. Labels are written as str.
+		'''
+
+		keys = [np.array([str(k) for k in level], dtype=object) for level in keys]
+		values = np.asarray(values, dtype=np.float64)
+
+		if len(keys) != len(domain):
+			raise ValueError("Length of domain must equal number of key levels")
+
+		for level, setname in zip(keys, domain):
+			if setname == '*':
+				continue
+			missing = set(level) - set(self.sets[setname][0])
+			if len(missing) > 0:
+				raise ValueError('Parameter "{}" has labels not in set "{}": {}'.format(name, setname, sorted(missing)[:10]))
+
+		parameter = self.parameters.setdefault(name, (list(domain), OrderedDict()))
+		if parameter[0] != list(domain):
+			raise ValueError('Parameter "{}" already has domain {}'.format(name, parameter[0]))
+
+		text, records = parameter[1].setdefault(filepath, (explanatory_text, []))
+		records.append((keys, values))
+
+	def filepaths(self):
+		''' Files with parameter records, in the order they were added '''
+		return list(OrderedDict.fromkeys([f for domain, files in self.parameters.values() for f in files]))
+
+	@staticmethod
+	def _concat(records):
+		keys = [np.concatenate([k[i] for k, v in records]) for i in range(len(records[0][0]))]
+		return keys, np.concatenate([v for k, v in records])
+
+	def write(self, use_gams=None):
+		'''
+		Write each file of the batch; returns the paths written
+		'''
+
+		written = []
+
+		for filepath in self.filepaths():
+			parameters = [
+				(name, domain, files[filepath][0]) + self._concat(files[filepath][1])
+				for name, (domain, files) in self.parameters.items() if filepath in files]
+
+			written.append(self._write(filepath, self.sets, parameters, use_gams))
+
+		return written
+
+	def write_merged(self, filepath, setname='Merged_set_1', use_gams=None):
+		'''
+		Write the whole batch to one file; returns the path written
+
+		Parameters gain a leading dimension, setname, labelled by the name 
+		of each file (without extension).
+		'''
+
+		filepaths = self.filepaths()
+		labels = [os.path.splitext(os.path.basename(f))[0] for f in filepaths]
+
+		sets = OrderedDict([(setname, (labels, 'Files merged into {}'.format(os.path.basename(filepath))))] + self.sets.items())
+
+		parameters = []
+		for name, (domain, files) in self.parameters.items():
+			records = []
+			for f, label in zip(filepaths, labels):
+				if f in files:
+					for keys, values in files[f][1]:
+						records.append(([np.array([label] * len(values), dtype=object)] + keys, values))
+
+			parameters.append((name, [setname] + domain, files.values()[0][0]) + self._concat(records))
+
+		return self._write(filepath, sets, parameters, use_gams)
+
+	def _write(self, filepath, sets, parameters, use_gams=None):
+		if use_gams is None:
+			use_gams = self.use_gams
+
+		if use_gams:
+			require_gams()
+		else:
+			filepath = os.path.splitext(filepath)[0] + '.gms'
+
+		if os.path.dirname(filepath) and not os.path.isdir(os.path.dirname(filepath)):
+			os.makedirs(os.path.dirname(filepath))
+
+		if use_gams:
+			self._write_gdx(filepath, sets, parameters)
+		else:
+			self._write_gms(filepath, sets, parameters)
+
+		return filepath
+
+	def _write_gdx(self, filepath, sets, parameters):
+		if self.ws is None:
+			self.ws = gams.GamsWorkspace()
+
+		db = self.ws.add_database()
+
+		symbols = {'*': '*'}
+		for name, (values, text) in sets.items():
+			symbols[name] = db.add_set(name, 1, text)
+			for val in values:
+				symbols[name].add_record((val,))
+
+		for name, domain, text, keys, values in parameters:
+			symb = db.add_parameter_dc(name, [symbols[s] for s in domain], text)
+			for rec, val in zip(zip(*keys), values.tolist()):
+				symb.add_record(list(rec)).value = val
+
+		db.export(os.path.abspath(os.path.expanduser(filepath)))
+
+	@staticmethod
+	def _gms_label(label):
+		return "'{}'".format(label) if "'" not in label else '"{}"'.format(label)
+
+	@staticmethod
+	def _gms_value(val):
+		# Zeros are written as 0, which GAMS drops on load, as it does those exported through the API
+		if np.isnan(val):
+			return 'NA'
+		elif np.isinf(val):
+			return '+INF' if val > 0 else '-INF'
+		elif val == 0:
+			return '0'
+		return repr(val)
+
+	def _write_gms(self, filepath, sets, parameters):
+		text = lambda t: '"{}"'.format(t.replace('"', "'"))
+
+		with open(filepath, 'w') as fp:
+			fp.write('$onempty\n')
+
+			for name, (values, explanatory_text) in sets.items():
+				fp.write('\nset {} {} /\n'.format(name, text(explanatory_text)))
+				fp.write(''.join(['{}\n'.format(self._gms_label(v)) for v in values]))
+				fp.write('/;\n')
+
+			for name, domain, explanatory_text, keys, values in parameters:
+				fp.write('\nparameter {}({}) {} /\n'.format(name, ','.join(domain), text(explanatory_text)))
+				fp.write(''.join([
+					'{} {}\n'.format('.'.join([self._gms_label(k) for k in rec]), self._gms_value(val))
+					for rec, val in zip(zip(*keys), values.tolist())]))
+				fp.write('/;\n')
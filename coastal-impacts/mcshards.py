@@ -0,0 +1,418 @@
+'''
+Sharded Monte Carlo driver for coastal damages
+
+Splits a range of LSL draws into shards and simulates them in a pool of
+local processes. Each shard appends its damages to a columnar file, one
+draw at a time, as they are computed, so no process holds more than a
+block of draws in memory. A failed or interrupted shard is resumed from
+its last complete draw when the run is repeated, and completed shards are
+skipped. Once every shard is done, merge stitches them together.
+
+Example usage:
+
+    python mcshards.py run 0 10000 outputs/mc_run/shards --shard-size 100
+    python mcshards.py merge outputs/mc_run/shards --csv outputs/mc_run/coastal-damages-raw-0000-10000.csv
+    python mcshards.py summarize outputs/mc_run/shards --storm outputs/mc_run/storm.csv
+
+Files in the output directory:
+
+    shards.json                         settings of the run
+    shards/draws-SSSS-EEEE.index.npz    damage index of the shard
+    shards/draws-SSSS-EEEE.f8           float64 damages, as [draw x damage]
+    shards/draws-SSSS-EEEE.found        bool flags of damages computed, as [draw x damage]
+    shards/draws-SSSS-EEEE.done         marks a complete shard
+    shards/draws-SSSS-EEEE.gdx          merged GAMS files of a block of draws, with --gams
+    shards/draws-SSSS-EEEE.gms          the same, as GAMS source, with --gams --gms
+    damages.npy                         merged float64 damages, as [draw x damage]
+    damages.index.npz                   damage index and draws of damages.npy
+
+Build the LSL draw cache (see README.md) before a large run, so each shard
+reads only its own draws.
+'''
+
+import pandas as pd
+import numpy as np
+import os
+import sys
+import json
+import traceback
+import multiprocessing
+import click
+
+import simulation
+from lib import periods, writegams
+
+# Number of values read or written at once by merge, export_csv and iter_blocks
+BLOCK_VALUES = 2**25
+
+# Each worker process loads storm, exposure and value-at-risk data once
+_base_run = None
+
+
+def shard_ranges(start, end, shard_size):
+    '''
+    Split draws [start, end) into (start, end) ranges of shard_size draws
+    '''
+
+    return [(s, min(s + shard_size, end)) for s in range(start, end, shard_size)]
+
+
+def shard_prefix(outdir, start, end):
+    return os.path.join(outdir, 'shards', 'draws-{:04}-{:04}'.format(start, end))
+
+
+def save_index(filepath, index, **arrays):
+    '''
+    Save a damage MultiIndex, and any other arrays, to a .npz file
+    '''
+
+    for i, name in enumerate(index.names):
+        arrays['level_{}'.format(i)] = np.array(index.get_level_values(name).tolist())
+
+    # Write to a temporary file first, so an index is never partial
+    with open(filepath + '.tmp', 'wb') as fp:
+        np.savez_compressed(fp, names=np.array(index.names), **arrays)
+    os.rename(filepath + '.tmp', filepath)
+
+
+def load_index(filepath):
+    '''
+    Load a damage MultiIndex saved by save_index
+
+    Returns the index and a dictionary of the other arrays in the file.
+    '''
+
+    data = dict(np.load(filepath))
+    names = data.pop('names').tolist()
+
+    levels = [data.pop('level_{}'.format(i)).tolist() for i in range(len(names))]
+    index = pd.MultiIndex.from_arrays(levels, names=names)
+
+    return index, data
+
+
+def _get_run(lsl_unit):
+    '''
+    Return a MonteCarlo run sharing this process's calibration data
+    '''
+
+    global _base_run
+
+    if _base_run is None:
+        _base_run = simulation.MonteCarlo(lsl_unit=lsl_unit)
+        _base_run._load_storm_data()
+        _base_run._prep_exposure()
+        _base_run._prep_value_at_risk()
+
+    return simulation.MonteCarlo(prev=_base_run)
+
+
+def _completed_draws(prefix):
+    '''
+    Count the draws completely written to a shard, truncating any partial draw
+    '''
+
+    if not os.path.exists(prefix + '.index.npz'):
+        for suffix in ['.f8', '.found']:
+            if os.path.exists(prefix + suffix):
+                os.remove(prefix + suffix)
+        return 0
+
+    index, _ = load_index(prefix + '.index.npz')
+    sizes = {'.f8': 8 * len(index), '.found': len(index)}
+
+    done = min([os.path.getsize(prefix + suffix) // size if os.path.exists(prefix + suffix) else 0 for suffix, size in sizes.items()])
+
+    for suffix, size in sizes.items():
+        if os.path.exists(prefix + suffix):
+            with open(prefix + suffix, 'r+b') as fp:
+                fp.truncate(done * size)
+
+    return done
+
+
+def run_shard(job):
+    '''
+    Simulate and write the damages for a shard of draws
+
+    job is (outdir, start, end, lsl_unit, gams). Draws already written 
+    by a previous attempt are not repeated. If gams is True, each block 
+    of draws' GAMS files are also written as one merged GDX, named by 
+    shard_prefix for the block's draws ('gms' writes GAMS source in 
+    place of the GDX). Returns ((start, end), error), 
+    where error is a traceback, or None if the shard is complete.
+    '''
+
+    outdir, start, end, lsl_unit, gams = job
+    prefix = shard_prefix(outdir, start, end)
+
+    if os.path.exists(prefix + '.done'):
+        return (start, end), None
+
+    try:
+        done = _completed_draws(prefix)
+
+        if start + done < end:
+            mc = _get_run(lsl_unit)
+            mc._load_gauge_data(draws=np.arange(start + done, end))
+
+            batch = writegams.GDXBatch(use_gams=(gams != 'gms')) if gams else False
+
+            with open(prefix + '.f8', 'ab') as valuefp, open(prefix + '.found', 'ab') as foundfp:
+                for index, draws, values, found in mc.iter_damages(gams=batch):
+                    if gams:
+                        batch.write_merged(shard_prefix(outdir, draws[0], draws[-1] + 1) + '.gdx')
+                        batch.clear()
+
+                    if os.path.exists(prefix + '.index.npz'):
+                        assert load_index(prefix + '.index.npz')[0].equals(index), "Damage index of {} has changed since it was started. Delete its files to re-run it.".format(prefix)
+                    else:
+                        save_index(prefix + '.index.npz', index)
+
+                    # Append each draw's damages in full before the next
+                    np.ascontiguousarray(values.T).tofile(valuefp)
+                    np.ascontiguousarray(found.T).tofile(foundfp)
+                    valuefp.flush()
+                    foundfp.flush()
+
+        open(prefix + '.done', 'w').close()
+        return (start, end), None
+
+    except Exception:
+        return (start, end), traceback.format_exc()
+
+
+def run_shards(start, end, outdir, shard_size=100, processes=None, lsl_unit='mm', gams=False):
+    '''
+    Simulate draws [start, end) in shards, in a pool of processes
+
+    Repeating a run with the same settings only simulates the draws not
+    yet written. If gams is True, GAMS files are also written for each 
+    block of draws (see run_shard), or GAMS source files if gams is 
+    'gms'. Returns the list of (start, end) shards that failed.
+    '''
+
+    # Fail before simulating anything if GDX files cannot be written
+    if gams and gams != 'gms':
+        writegams.require_gams()
+
+    settings = dict(start=start, end=end, shard_size=shard_size, lsl_unit=lsl_unit)
+
+    if not os.path.isdir(os.path.join(outdir, 'shards')):
+        os.makedirs(os.path.join(outdir, 'shards'))
+
+    if os.path.exists(os.path.join(outdir, 'shards.json')):
+        with open(os.path.join(outdir, 'shards.json'), 'r') as fp:
+            previous = json.load(fp)
+        if previous != settings:
+            raise ValueError('{} was started with different settings: {}'.format(outdir, previous))
+    else:
+        with open(os.path.join(outdir, 'shards.json'), 'w') as fp:
+            json.dump(settings, fp)
+
+    jobs = [(outdir, s, e, lsl_unit, gams) for s, e in shard_ranges(start, end, shard_size)]
+    failed = []
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        for (s, e), error in pool.imap_unordered(run_shard, jobs):
+            if error is None:
+                print('Shard {}-{} complete'.format(s, e))
+            else:
+                print('Shard {}-{} failed:\n{}'.format(s, e, error))
+                failed.append((s, e))
+    finally:
+        pool.close()
+        pool.join()
+
+    return sorted(failed)
+
+
+def _load_shards(outdir):
+    '''
+    Load the settings, shards and damage indexes of a complete run
+
+    Returns (settings, shards, prefixes, shard indexes, union index).
+    '''
+
+    with open(os.path.join(outdir, 'shards.json'), 'r') as fp:
+        settings = json.load(fp)
+
+    shards = shard_ranges(settings['start'], settings['end'], settings['shard_size'])
+    prefixes = [shard_prefix(outdir, s, e) for s, e in shards]
+
+    missing = ['{}-{}'.format(s, e) for (s, e), prefix in zip(shards, prefixes) if not os.path.exists(prefix + '.done')]
+    if len(missing) > 0:
+        raise ValueError('Shards not complete: {}. Re-run them first.'.format(', '.join(missing)))
+
+    indexes = [load_index(prefix + '.index.npz')[0] for prefix in prefixes]
+
+    index = indexes[0]
+    for other in indexes[1:]:
+        if not other.equals(index):
+            index = index.union(other)
+
+    return settings, shards, prefixes, indexes, index
+
+
+def iter_blocks(outdir, block_draws=None):
+    '''
+    Read the damages of complete shards, a block of draws at a time
+
+    Yields (draws, values), where values is a [damage x draw] array on the 
+    union of the shards' damage indexes, with NaN for damages a shard does 
+    not have. Blocks hold at most BLOCK_VALUES values, unless block_draws 
+    is given. Use merged_index(outdir) for the damage index.
+    '''
+
+    settings, shards, prefixes, indexes, index = _load_shards(outdir)
+
+    if block_draws is None:
+        block_draws = max(1, BLOCK_VALUES // len(index))
+
+    for (s, e), prefix, shard_index in zip(shards, prefixes, indexes):
+        positions = index.get_indexer(shard_index)
+        values = np.memmap(prefix + '.f8', dtype=np.float64, mode='r').reshape((-1, len(shard_index)))
+        assert values.shape[0] == e - s, 'Shard {}-{} has {} draws'.format(s, e, values.shape[0])
+
+        for d in range(0, values.shape[0], block_draws):
+            block = np.empty((len(index), min(block_draws, values.shape[0] - d)))
+            block.fill(np.nan)
+            block[positions] = values[d:d+block_draws].T
+            yield np.arange(s + d, s + d + block.shape[1]), block
+
+
+def merged_index(outdir):
+    '''
+    Return the damage index of the blocks from iter_blocks
+    '''
+
+    return _load_shards(outdir)[-1]
+
+
+def merge_shards(outdir):
+    '''
+    Stitch complete shards into damages.npy and damages.index.npz
+
+    Damages not found in any draw are dropped, as in CoastRun.run.
+    '''
+
+    settings, shards, prefixes, indexes, index = _load_shards(outdir)
+
+    # Find the damages computed in any draw
+    found_any = np.zeros(len(index), dtype=bool)
+    for prefix, shard_index in zip(prefixes, indexes):
+        positions = index.get_indexer(shard_index)
+        found = np.memmap(prefix + '.found', dtype=bool, mode='r').reshape((-1, len(shard_index)))
+
+        block = max(1, BLOCK_VALUES // len(shard_index))
+        for d in range(0, found.shape[0], block):
+            found_any[positions] |= found[d:d+block].any(axis=0)
+
+    keep = np.nonzero(found_any)[0]
+    columns = -np.ones(len(index), dtype=int)
+    columns[keep] = np.arange(len(keep))
+
+    draws = np.arange(settings['start'], settings['end'])
+    damages = np.lib.format.open_memmap(os.path.join(outdir, 'damages.npy'), mode='w+', dtype=np.float64, shape=(len(draws), len(keep)))
+
+    for (s, e), prefix, shard_index in zip(shards, prefixes, indexes):
+        shard_columns = columns[index.get_indexer(shard_index)]
+        valid = shard_columns >= 0
+
+        values = np.memmap(prefix + '.f8', dtype=np.float64, mode='r').reshape((-1, len(shard_index)))
+        assert values.shape[0] == e - s, 'Shard {}-{} has {} draws'.format(s, e, values.shape[0])
+
+        block = max(1, BLOCK_VALUES // len(shard_index))
+        for d in range(0, values.shape[0], block):
+            merged = np.empty((min(block, values.shape[0] - d), len(keep)))
+            merged.fill(np.nan)
+            merged[:, shard_columns[valid]] = values[d:d+block][:, valid]
+            damages[s - settings['start'] + d:s - settings['start'] + d + len(merged)] = merged
+
+    damages.flush()
+    del damages
+
+    save_index(os.path.join(outdir, 'damages.index.npz'), index[keep], draws=draws)
+
+
+def export_csv(outdir, filepath):
+    '''
+    Write merged damages as a CSV file, in the format of do_montecarlo
+    '''
+
+    index, data = load_index(os.path.join(outdir, 'damages.index.npz'))
+    damages = np.load(os.path.join(outdir, 'damages.npy'), mmap_mode='r')
+    columns = pd.Index(data['draws'], name='DRAW')
+
+    block = max(1, BLOCK_VALUES // len(columns))
+
+    with open(filepath, 'w') as fp:
+        for r in range(0, len(index), block):
+            pd.DataFrame(
+                damages[:, r:r+block].T,
+                index=index[r:r+block],
+                columns=columns).to_csv(fp, header=(r == 0))
+
+
+def summarize(outdir):
+    '''
+    Summarize the damages of complete shards by period, as in 
+    CoastRun.postprocess, without loading every draw at once
+
+    Returns (storm, exposure) DataFrames.
+    '''
+
+    return periods.summarize(merged_index(outdir), iter_blocks(outdir), directory=outdir)
+
+
+@click.group()
+def main():
+    pass
+
+
+@main.command()
+@click.argument('start', type=int)
+@click.argument('end', type=int)
+@click.argument('outdir')
+@click.option('--shard-size', type=int, default=100, help='draws per shard')
+@click.option('--processes', type=int, default=None, help='worker processes (default: one per CPU)')
+@click.option('--lsl-unit', default='mm', help='LSL unit')
+@click.option('--gams', is_flag=True, default=False, help='also write a merged GAMS GDX for each block of draws')
+@click.option('--gms', is_flag=True, default=False, help='with --gams, write GAMS source (.gms) in place of GDX, without the GAMS python API')
+def run(start, end, outdir, shard_size, processes, lsl_unit, gams, gms):
+    failed = run_shards(start, end, outdir, shard_size=shard_size, processes=processes, lsl_unit=lsl_unit, gams=('gms' if gms else True) if gams else False)
+
+    if len(failed) > 0:
+        print('{} shards failed; repeat this command to re-run them'.format(len(failed)))
+        sys.exit(1)
+
+
+@main.command()
+@click.argument('outdir')
+@click.option('--csv', 'csvpath', default=None, help='also write merged damages to this CSV file')
+def merge(outdir, csvpath):
+    merge_shards(outdir)
+
+    if csvpath is not None:
+        export_csv(outdir, csvpath)
+
+
+@main.command('summarize')
+@click.argument('outdir')
+@click.option('--storm', 'stormpath', default=None, help='write storm damages by period to this CSV file')
+@click.option('--exposure', 'exposurepath', default=None, help='write inundation damages by period to this CSV file')
+def summarize_command(outdir, stormpath, exposurepath):
+    storm, exposure = summarize(outdir)
+
+    print(storm)
+    print(exposure)
+
+    if stormpath is not None:
+        storm.to_csv(stormpath)
+    if exposurepath is not None:
+        exposure.to_csv(exposurepath)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,20 @@
-import numpy as np
+import numpy as np, pandas as pd
 import os, os.path, re, argparse
 
+import mcshards
+from lib import periods
+
 st_result_dir = 'outputs/mc_temp/'
 percent_results_dir = 'outputs/percentiles/'
 
 PER_TYPES = {'annual':[2030,2050,2100],'20yr':['{t}to{te}'.format(t=t,te=t+19) for t in range(2020,2100,20)]}
 conversion = {'20yr':'20yr','annual':'single'}
 
+DTYPES = ['IN','DI','BI','TOT']
+
+# Storm types of the direct and BI damages of each hurricane scenario, in mcshards.py outputs
+HURR_STORMS = {'hist':['historical','noreaster'],'proj':['climatological','noreaster']}
+
 def write_pct_file(inputfile,reg,rcp,hurr,pertype,regType):
 	for i,dtype in enumerate(['IN','DI','BI','TOT']):
 		for j,tperiod in enumerate(PER_TYPES[pertype]):
@@ -125,14 +133,111 @@ def main(rcp,hurr):
 			if not reg in read[per]:
 				print('  ***  WARNING: {st} {per} NOT READ  ***  '.format(st=reg,per=per))
 
-	
+
+
+def shard_groups(index,rcp,hurr,sl,regions):
+	'''
+	Groups of the percentile tables, for damages from mcshards.py
+
+	Damages are changes from 2010, summed over the states of each region, 
+	and averaged over the years of each period in PER_TYPES. regions maps 
+	region names to lists of states. Returns (group index, matrix), as 
+	periods.groups_matrix, with groups of (REGION, DTYPE, PERTYPE, PERIOD).
+	'''
+
+	names = ['REGION','DTYPE','PERTYPE','PERIOD']
+	groups = pd.MultiIndex.from_tuples(sorted([(rg,d,pt,str(t)) for rg in regions for d in DTYPES for pt in PER_TYPES for t in PER_TYPES[pt]]),names=names)
+
+	level = lambda name: index.get_level_values(name).values
+	years = level('YEAR')
+	states = level('STATE')
+	selected = (level('RCP')==rcp) & (level('SL_MEASURE')==sl) & (level('SCENARIO')==hurr)
+	storm = np.in1d(level('STORM'),HURR_STORMS[hurr])
+
+	dtypes = {
+		'IN': selected & (level('STORM')=='inundation'),
+		'DI': selected & storm & (level('SECTOR')=='DIRECT'),
+		'BI': selected & storm & (level('SECTOR')=='BI')}
+	dtypes['TOT'] = dtypes['DI'] | dtypes['BI']
+
+	#	Label each damage year with its period of each type, or ''
+	yearlabels = {
+		'20yr': lambda y: '{t}to{te}'.format(t=(y-2020)//20*20+2020,te=(y-2020)//20*20+2039) if 2020 <= y <= 2099 else '',
+		'annual': lambda y: str(y) if y in PER_TYPES['annual'] else ''}
+	uniqueyears, yearpos = np.unique(years,return_inverse=True)
+	pertypes = {pt:np.array([yearlabels[pt](y) for y in uniqueyears],dtype=object)[yearpos] for pt in PER_TYPES}
+
+	rows, labels = [], []
+	for rg in regions:
+		inregion = np.in1d(states,regions[rg])
+		for d in DTYPES:
+			for pt in PER_TYPES:
+				found = np.nonzero(dtypes[d] & inregion & (pertypes[pt]!=''))[0]
+				rows.append(found)
+				labels.extend([(rg,d,pt,t) for t in pertypes[pt][found]])
+
+	rows = np.concatenate(rows)
+	return periods.groups_matrix(len(index),rows,labels,years[rows],names,groups=groups)
+
+
+def main_shards(outdir,rcp,hurr,sl):
+	'''
+	Write percentile tables from the shards of mcshards.py, one block of 
+	draws at a time, rather than from the mc_temp files of MCrun.py
+	'''
+
+	if not os.path.isdir(percent_results_dir):
+		os.mkdir(percent_results_dir)
+
+	prep_outfiles(rcp,hurr)
+
+	index = mcshards.merged_index(outdir)
+	states = sorted(set(index.get_level_values('STATE')))
+
+	regions = {st:[st] for st in states}
+	regions.update({nca:sts for nca,sts in periods.NCA_REGIONS.items() if len(set(sts) & set(states)) > 0})
+	regions['USA'] = states
+
+	groups, matrix = shard_groups(index,rcp,hurr,sl,regions)
+	summary = periods.PeriodSummary(index,{'tables':(groups,matrix)},directory=outdir)
+
+	try:
+		for draws, values in mcshards.iter_blocks(outdir):
+			summary.add(values,draws)
+
+		print('{rcp} {hurr} {sl} results read with {n:>5} draws'.format(rcp=rcp,hurr=hurr,sl=sl,n=len(summary.draws)))
+		results = summary.percentiles('tables',range(1,100))
+
+	finally:
+		summary.close()
+
+	for regType, regs in [('STATE',states),('NCA',sorted([rg for rg in regions if rg in periods.NCA_REGIONS]))]:
+		for reg in regs + ['USA']:
+			for dtype in DTYPES:
+				for pertype in PER_TYPES.keys():
+					for tperiod in PER_TYPES[pertype]:
+						with open('{p}{rt}_{r}_{h}_{d}_{per}_{t}.csv'.format(rt=regType,r=rcp,h=hurr,p=percent_results_dir,d=dtype,per=conversion[pertype],t=tperiod),'a') as writefile:
+							writefile.write('{rg},{pct}\n'.format(rg=reg,pct=','.join([str(p) for p in results.loc[(reg,dtype,pertype,str(tperiod))].values])))
+
+	#	CHECK FOR COMPLETE READ
+
+	for reg in ['OR','WA','CA','TX','LA','MS','AL','ME','MA','NH','RI','CT','NY','NJ','DE','MD','DC','VA','NC','SC','GA','FL','PA','WV','VT']:
+		if not reg in states:
+			print('  ***  WARNING: {st} NOT READ  ***  '.format(st=reg))
+
+
 def arg():
 	parser = argparse.ArgumentParser(description='Compile statistics on Monte Carlo results')
 	parser.add_argument('-r','--rcp',type=str,default='rcp85',help='Set the RCP to run for this study')
 	parser.add_argument('-s','--hurr',type=str,default='hist',help='Set the hurricane scenario to run for this study')
+	parser.add_argument('-d','--shards',type=str,default=None,help='Read the draws of this mcshards.py output directory, rather than MCrun.py results')
+	parser.add_argument('-m','--sl-measure',type=str,default='MSL',help='Set the sea level measure of mcshards.py damages')
 	return parser.parse_args()
 
 
 if __name__=="__main__":
 	args = arg()
-	main(args.rcp,args.hurr)
+	if args.shards is not None:
+		main_shards(args.shards,args.rcp,args.hurr,args.sl_measure)
+	else:
+		main(args.rcp,args.hurr)
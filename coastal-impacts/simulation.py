@@ -10,9 +10,14 @@ import re
 import click
 from pandas import IndexSlice as idx
 
+from collections import OrderedDict
+
 from lib import (
     gauge,
-    rms)
+    periods,
+    profiling,
+    rms,
+    writegams)
 
 
 class CoastRun(object):
@@ -22,6 +27,12 @@ class CoastRun(object):
     Use through subclasses Median and MonteCarlo
     '''
 
+    # Number of LSL draws simulated at once
+    chunksize = 100
+
+    # GAMS export files, for each RCP, scenario, SL_MEASURE and draw
+    gams_filepath = 'output/gams/coastal_{rcp}_{scen}_{sl}_{draw}.gdx'
+
     def __init__(self, lsl_unit='mm', run_name=None, prev=None):
         '''
         Initialize a CoastRun object
@@ -54,7 +65,8 @@ class CoastRun(object):
         self.exposure_below = None
         self.state_risk = None
 
-        self.gamswriter = None
+        # Time and memory of each stage of this run
+        self.profile = profiling.RunProfile(run_name)
 
         if prev is not None and hasattr(prev, 'lsl_unit'):        self.lsl_unit = prev.lsl_unit
         if prev is not None and hasattr(prev, 'gauge_db'):        self.gauge_db = prev.gauge_db
@@ -66,339 +78,473 @@ class CoastRun(object):
     def _load_storm_data(self):
         '''
         Load data from RMS into dev.lib.rms.StormDatabase object
+
+        Reads the consolidated store, rms.STORM_STORE, if it is up to date, 
+        and otherwise reads the RMS files and rewrites the store.
         '''
 
-        self.storm_db = rms.StormDatabase()
-        self.storm_db.add_historical()
-        self.storm_db.add_noreaster()
-        self.storm_db.add_climatological(name = 'rcp45', clim_dir = '45_Climatology')
-        self.storm_db.add_climatological(name = 'rcp85', clim_dir = '85_update/CMIP5.RCP8.5.MEAN.B.v2.Climatology-2014-05-22')
+        self.storm_db = rms.StormDatabase.load_store()
+        if self.storm_db is None:
+            self.storm_db = rms.StormDatabase.consolidate()
 
-    def _state_damage(self, state_draw, index_names):
+    def _lsl_array(self, lsl):
         '''
-        Compute storm damages for a state's single 2010-2100 scenario
-
-        Reads in RMS damages. Assumes that the data does not include 
-        a linear 2010-2100 phase-in of changes in storm activity. As 
-        of this writing, this effect is removed from the RMS data by 
-        the RMS.StormDatabase class, then interpolated and re-applied 
-        for each LSL scenario by the _storm_damages method of this 
-        class.
+        Arrange LSL scenarios as a dense [scenario x year x draw] layout
+
+        Scenarios are the combinations of all index levels of lsl other 
+        than YEAR. Returns the scenario index, the years, and the 
+        (scenario, year) position of each row of lsl, so that blocks of 
+        draws can be copied into a [scenario x year x draw] array.
         '''
 
-        if 'RCP' in index_names:
-            rcp = state_draw.name[index_names.index('RCP')]
-        else:
-            rcp = None
+        key_names = [c for c in lsl.index.names if c != 'YEAR']
+        assert 'STATE' in key_names, 'STATE not found in LSL index passed to CoastRun._lsl_array'
 
-        assert 'STATE' in index_names, 'STATE not found in draw index passed to CoastRun._storm_damages'
-        
-        if isinstance(state_draw.name, str):
-            assert len(index_names) == 1, "I just don't even know"
-            state_name = state_draw.name
-            indices = (state_draw.name,)
-        else:
-            st_i = index_names.index('STATE')
-            state_name = state_draw.name[st_i]
-            indices = state_draw.name
+        key_values = zip(*[lsl.index.get_level_values(c) for c in key_names])
+        keys = pd.MultiIndex.from_tuples(sorted(set(key_values)), names=key_names)
+        key_positions = {key: k for k, key in enumerate(keys)}
 
-        damages = {}
+        year_values = lsl.index.get_level_values('YEAR').values
+        years = np.unique(year_values)
 
-        if state_name in self.storm_db.historical.index.get_level_values('STATE'):
-            damages['historical'] = self.storm_db.historical.xs(state_name, level='STATE').apply(lambda y: pd.Series(y(state_draw), index=state_draw.index))
+        return keys, years, (np.array([key_positions[key] for key in key_values]), np.searchsorted(years, year_values))
 
-        if state_name in self.storm_db.noreaster.index.get_level_values('STATE'):
-            damages['noreaster'] = self.storm_db.noreaster.xs(state_name, level='STATE').apply(lambda y: pd.Series(y(state_draw), index=state_draw.index))
+    def _scenarios(self, keys):
+        '''
+        Scenarios simulated for the LSL scenarios keys
 
-        if (rcp in ('rcp45', 'rcp85')) and (state_name in self.storm_db.clim_adjusted[rcp].index.get_level_values('STATE')):
-            damages['climatological'] = self.storm_db.clim_adjusted[rcp].xs(state_name, level='STATE').apply(lambda y: pd.Series(y(state_draw), index=state_draw.index))
+        Proj is simulated if climatological storm damages are available for 
+        the RCP and state of any key. The scenarios depend only on keys, so 
+        every block of draws has the same damage labels; proj damages are 
+        not found for draws without climatological damages.
+        '''
 
-        if len(damages) == 0:
-            return None
+        st_i = keys.names.index('STATE')
+        rcp_i = keys.names.index('RCP') if 'RCP' in keys.names else None
 
-        damages = pd.concat(damages, names = ['STORM'], axis=0)
+        for key in keys:
+            rcp = key[rcp_i] if rcp_i is not None else None
+            if rcp in ('rcp45', 'rcp85') and len(self.storm_db.clim_adjusted[rcp].locate(key[st_i])) > 0:
+                return ['hist','proj']
 
-        damages.set_index(pd.MultiIndex.from_tuples([indices for _ in range(len(damages))], names=index_names), append=True, inplace=True)
-        return damages
+        return ['hist']
 
-    def _storm_damages(self, draw):
+    def _storm_array(self, keys, years, lsl):
         '''
-        Calculates storm damages for a given LSL scenario
-
-        Groups storm damages by state and uses _state_damage
-        to read in RMS damage info given the LSL scenario 
-        "draw." Changes in damages from changes in projected
-        hurricane activity (relative to historical) are 
-        linearly phased in over the period 2010-2100.
+        Compute storm damages for each LSL scenario, year, and draw
+
+        Reads in RMS damages for every group of a scenario's state at once, 
+        and sums them across COASTALFLAG. Returns a list of (STORM, SECTOR, 
+        scenario) labels, a matching [label x year x draw] array, and a 
+        boolean array of the draws with climatological damages.
+
+        Assumes that the RMS data does not include a linear 2010-2100 
+        phase-in of changes in storm activity. As of this writing, this 
+        effect is removed from the RMS data by the RMS.StormDatabase class, 
+        then interpolated and re-applied here. Values are NaN where no 
+        damages are available for any COASTALFLAG, as for missing LSLs.
         '''
 
-        draw = draw.unstack('YEAR')
+        st_i = keys.names.index('STATE')
+        rcp_i = keys.names.index('RCP') if 'RCP' in keys.names else None
+
+        phase = ((years.astype(np.float64) - 2010) / (2100 - 2010))[:, np.newaxis]
+
+        labels = []
+        damages = []
+        projected = np.zeros(lsl.shape[2], dtype=bool)
+
+        for k, key in enumerate(keys):
+            state = key[st_i]
+            rcp = key[rcp_i] if rcp_i is not None else None
+
+            interpolators = [('historical', self.storm_db.historical), ('noreaster', self.storm_db.noreaster)]
+            if rcp in ('rcp45', 'rcp85'):
+                interpolators.append(('climatological', self.storm_db.clim_adjusted[rcp]))
 
-        draw = pd.concat([self._state_damage(draw.iloc[i], draw.index.names) for i in range(len(draw))])
-        draw = draw.stack('YEAR')
+            # Damages by (COASTALFLAG, SECTOR) group, for each storm type
+            storms = {}
+            for storm, interp in interpolators:
+                groups = interp.locate(state)
+                if len(groups) == 0:
+                    continue
 
-        # Adjust climatological damages to linearly phase in from 2010 to 2100
-        draw = draw.unstack('STORM')
+                index = interp.index[groups].droplevel('STATE')
+                flags = index.get_level_values('COASTALFLAG').unique()
+                invalid = flags[np.in1d(flags, [0,1], invert=True)]
+                assert len(invalid) == 0, "Illegal values found in COASTALFLAG: {}".format(invalid)
 
-        if 'climatological' in draw.columns:
-            draw['climatological'] = (draw['climatological'] - draw['historical'])*((draw.index.get_level_values('YEAR').astype(np.float64)-2010)/(2100-2010)) + draw['historical']
+                storms[storm] = (index, interp(np.tile(lsl[k], (len(groups), 1, 1)), groups))
 
-            scenario = pd.concat({'hist': draw[['noreaster','historical']].stack('STORM'), 'proj': draw[['noreaster','climatological']].stack('STORM')}, names=['SCENARIO'], axis=0)
+            if 'climatological' in storms:
+                projected |= (~np.isnan(storms['climatological'][1])).any(axis=1).any(axis=0)
 
-        else:
-            scenario = pd.concat({'hist': draw.stack('STORM')}, names=['SCENARIO'], axis=0)
+                # Adjust climatological damages to linearly phase in from 2010 to 2100
+                index, clim = storms['climatological']
+                hist_index, hist = storms.get('historical', (pd.MultiIndex.from_tuples([], names=index.names), None))
+                for g, group in enumerate(index):
+                    if group in hist_index:
+                        base = hist[hist_index.get_loc(group)]
+                        clim[g] = (clim[g] - base)*phase + base
+                    else:
+                        clim[g] = np.nan
 
-        # Sum across coastal/non-coastal values
-        flags = scenario.index.get_level_values('COASTALFLAG').unique()
-        invalid = flags[np.in1d(flags, [0,1], invert=True)]
-        assert len(invalid) == 0, "Illegal values found in COASTALFLAG: {}".format(invalid)
-        scenario = scenario.sum(level=[c for c in scenario.index.names if c != 'COASTALFLAG'])
-        return scenario
+            # Sum across coastal/non-coastal values
+            for storm in sorted(storms.keys()):
+                index, values = storms[storm]
+                sectors = index.get_level_values('SECTOR')
+
+                for sector in sorted(sectors.unique()):
+                    sector_values = values[np.array(sectors == sector)]
+                    found = ~np.isnan(sector_values)
+
+                    labels.append((storm, sector, k))
+                    damages.append(np.where(found.any(axis=0), np.where(found, sector_values, 0).sum(axis=0), np.nan))
+
+        return labels, np.array(damages).reshape((len(labels),) + lsl.shape[1:]), projected
 
     def _prep_exposure(self):
         '''
+        Load exposure below sea level for both coasts, from the rms exposure cache if it is up to date
         '''
-        
-        exposure_coasts = []
-
-        for coast in ['east','west']:
-            exp = rms.Exposure(coast=coast)
-            exp.read()
-            exp.convert('mm')
-            exp.interpolate()
-
-            exposure_coasts.append(exp)
 
-        self.exposure_below = {sl: pd.concat([exp.exposure[sl] for exp in exposure_coasts], axis=0).sort_index() for sl in rms.Exposure.SL_MEAS}
+        _, self.exposure_below = rms.Exposure.load_all('mm')
 
-    def _exposure_run(self, lsl):
+    def _exposure_array(self, keys, years, lsl):
         '''
+        Compute exposure below sea level for each LSL scenario, year, and draw
+
+        Returns {SL_MEASURE: [scenario x year x draw]}, relative to 2010, 
+        and held at its running maximum so that exposure never decreases 
+        with year.
         '''
-        
-        exposure_below_run = {}
-        
-        assert 'STATE' in lsl.index.names
-        assert 'YEAR' in lsl.index.names
-
-        # get_state_name is a closure for finding the state name
-        # from the Series name once the YEAR index has been grouped
-        if len(lsl.index.names) <= 2:
-            get_state_name = lambda lev: lev.name
-        else:
-            st_i = lsl.index.names.index('STATE')
-            y_i = lsl.index.names.index('YEAR')
-            st_i -= 1 if y_i < st_i else 0
-            get_state_name = lambda lev: lev.name[st_i]
+
+        exposure_below = {}
+
+        groups = pd.MultiIndex.from_arrays([keys.get_level_values('STATE'), ['ALL'] * len(keys)])
+        base = np.searchsorted(years, 2010)
+        assert base < len(years) and years[base] == 2010, '2010 not found in LSL years passed to CoastRun._exposure_array'
 
         for sl in rms.Exposure.SL_MEAS:
-            exposure_by_state = self.exposure_below[sl].xs('ALL', level='LOB')
-            exposure_below_run[sl] = lsl.groupby(level=[c for c in lsl.index.names if c != 'YEAR']).apply(lambda lev: pd.Series(exposure_by_state.loc[get_state_name(lev)](lev.values), index=lev.index))
+            positions = self.exposure_below[sl].index.get_indexer(groups)
+            if (positions < 0).any():
+                raise KeyError('No exposure found for states {}'.format(sorted(set(groups[positions < 0].get_level_values(0)))))
+
+            exposure = self.exposure_below[sl](lsl, positions)
 
-        return exposure_below_run
+            # Adjust exposure to remove base-year exposure below
+            exposure = exposure - exposure[:, base:base+1, :]
 
-    def _prep_value_at_risk(self, filepath='data/RMSData/valueAtRisk.csv'):
+            # Require exposure_below monotonicity with year
+            exposure_below[sl] = np.fmax.accumulate(exposure, axis=1)
+
+        return exposure_below
+
+    def _prep_value_at_risk(self, filepath=rms.DEFAULT_VALUE_AT_RISK_FILE):
         '''
+        Load total value at risk by state, from the rms value-at-risk cache if it is up to date
         '''
-        
-        risk = pd.read_csv(filepath, index_col=[0,1], header=[0,1])
-        self.risk = risk.stack()
-        self.state_risk = self.risk[['BUILDING','CONTENTS']].sum(axis=1).sum(level='STATE')
-
-    def _export_to_gams(self, filepath, data, rcp, scen, sl):
-        from lib import writegams
-
-        if self.gamswriter is None:
-            self.gamswriter = writegams.PyGDX()
-            self.gams_damtypes  = self.gamswriter.add_set('coastDamTypes', ['inundation','direct','bi'], 'Types of damage suffered during coastal storms and due to LSL rise', exists='error')
-            self.gams_states    = self.gamswriter.add_set('coastReg', gauge.GaugeDatabase.STATES, 'Coastal regions affected by LSL and storm damage', exists='error')
-            self.gams_years     = self.gamswriter.add_set('tp', range(2011, 2101), 'Time periods in the model', exists='error')
-
-        # Rebase all values to 2011 for CGE model
-        data = data[data.index.get_level_values('YEAR') >= 2011]
-        data = data.groupby(level=[c for c in data.index.names if c != 'YEAR']).apply(lambda x: x - x[x.index.get_level_values('YEAR') == 2011].iloc[0])
-        data.index = data.index.reorder_levels(['DAMAGE','STATE','YEAR'])
-        data.index.names = ['coastDamTypes', 'coastReg', 'tp']
-        data.sort_index(inplace=True)
-
-        self.gamswriter.reset_param('impact')
-        self.gamswriter.dataframe_to_param('impact', data, 'Direct coastal damages (without lost capital accounting) for {} {} {}'.format(rcp,scen,sl), exists='replace', domain=[self.gams_damtypes, self.gams_states, self.gams_years], set_exists='validate')
-        self.gamswriter.export(filepath)
-
-    def _prep_gams_export(self, storm_damages, exposure_below, scenarios, draw):
+
+        self.state_risk = rms.load_value_at_risk(filepath)
+
+    def _gams_export(self, keys, years, present, labels, storm_damages, exposure_below, projected, draws, batch):
         '''
+        Add a block of draws' damages to a writegams.GDXBatch
+
+        Each (RCP, scenario, SL_MEASURE, draw) is a file of the batch, named 
+        by self.gams_filepath, with the parameter 
+        impact(coastDamTypes, coastReg, tp). Storm damages are summed across 
+        the scenario's storm types, and damages are rebased to 2011 for the 
+        CGE model. Proj files are only added for draws with climatological 
+        damages.
         '''
 
-        for scen in scenarios:
-            for sl in rms.Exposure.SL_MEAS:
-                storm = storm_damages.xs(scen, level='SCENARIO')
-                storm = storm.sum(
-                    level=[c for c in storm.index.names if c != 'STORM'])
+        if 'coastDamTypes' not in batch.sets:
+            batch.add_set('coastDamTypes', ['inundation','direct','bi'], 'Types of damage suffered during coastal storms and due to LSL rise')
+            batch.add_set('coastReg', gauge.GaugeDatabase.STATES, 'Coastal regions affected by LSL and storm damage')
+            batch.add_set('tp', range(2011, 2101), 'Time periods in the model')
+
+        base = np.searchsorted(years, 2011)
+        assert base < len(years) and years[base] == 2011, '2011 not found in LSL years passed to CoastRun._gams_export'
+
+        storms = {'hist': ['historical', 'noreaster'], 'proj': ['climatological', 'noreaster']}
+        rcps = keys.get_level_values('RCP').values
+        states = keys.get_level_values('STATE').values
+
+        # Rebase a [series x year x draw] array to 2011, dropping earlier years
+        rebase = lambda values: values[:, base:] - values[:, base:base+1]
+
+        for scen in ['hist','proj']:
+            in_scenario = np.ones(len(draws), dtype=bool) if scen == 'hist' else projected
+            if not in_scenario.any():
+                continue
+
+            # Storm damages by (DAMAGE, scenario), summed across storm types
+            groups = OrderedDict()
+            for i, (storm, sector, k) in enumerate(labels):
+                if storm in storms[scen]:
+                    groups.setdefault((sector.lower(), k), []).append(i)
 
-                expos = exposure_below[sl]
+            storm_series = []
+            for (damage, k), rows in groups.items():
+                values = storm_damages[rows]
+                found = ~np.isnan(values)
+                storm_series.append(np.where(found.any(axis=0), np.where(found, values, 0).sum(axis=0), np.nan))
 
-                si = storm.index.names.index('SECTOR')
-                before = [storm.index.levels[i] for i in range(si)]
-                middle = [storm.index.levels[si].str.lower()]
-                after = [storm.index.levels[i] for i in range(si+1,len(storm.index.names))]
-                storm.index.set_levels(before+middle+after, inplace=True)
-                storm.index.names = [storm.index.names[i] if i != si else 'DAMAGE' for i in range(len(storm.index.names))]
-                storm.index = storm.index.reorder_levels(['RCP', 'DAMAGE', 'STATE', 'YEAR'])
-                storm.sort_index(inplace=True)
+            storm_labels = groups.keys()
+            storm_values = rebase(np.array(storm_series).reshape((len(storm_series),) + storm_damages.shape[1:]))
 
+            for sl in rms.Exposure.SL_MEAS:
+                # Inundation is only exported for years with LSLs
+                exposure = np.where(present[:, :, np.newaxis], exposure_below[sl], np.nan)
+
+                series_labels = storm_labels + [('inundation', k) for k in range(len(keys))]
+                values = np.concatenate([storm_values, rebase(exposure)], axis=0)
+
+                k = np.array([key for damage, key in series_labels], dtype=int)
+                damage_labels = np.array([damage for damage, key in series_labels])
 
-                expos = pd.DataFrame(expos, columns = ['inundation'])
-                expos.columns.names = ['DAMAGE']
-                expos = expos.stack('DAMAGE')
-                expos.index = expos.index.reorder_levels(['RCP', 'DAMAGE',  'STATE', 'YEAR'])
-                expos.sort_index(inplace=True)
+                for rcp in sorted(set(rcps[k])):
+                    in_rcp = np.nonzero(rcps[k] == rcp)[0]
+                    rows, y = np.meshgrid(in_rcp, np.arange(values.shape[1]), indexing='ij')
+                    rows, y = rows.ravel(), y.ravel()
 
-                damages = pd.concat([storm, expos], axis=0)
+                    for d in np.nonzero(in_scenario)[0]:
+                        found = ~np.isnan(values[rows, y, d])
 
-                for rcp in damages.index.get_level_values('RCP').unique():
-                    self._export_to_gams('output/gams/coastal_{}_{}_{}_{}.gdx'.format(rcp,scen,sl,draw), damages.xs(rcp, level='RCP'), rcp, scen, sl)
+                        batch.add_parameter(
+                            self.gams_filepath.format(rcp=rcp, scen=scen, sl=sl, draw=draws[d]),
+                            'impact',
+                            [damage_labels[rows[found]], states[k[rows[found]]], years[base:][y[found]]],
+                            values[rows[found], y[found], d],
+                            ['coastDamTypes', 'coastReg', 'tp'],
+                            'Direct coastal damages (without lost capital accounting) for {} {} {}'.format(rcp, scen, sl))
 
-    def _damage_simulation(self, lsl_scenario, gams=False, simulate=True):
+    def _damage_simulation(self, keys, years, lsl, present, draws, gams=False, simulate=True):
         '''
+        Compute damages for a block of LSL draws
+
+        lsl is a [scenario x year x draw] array, and present marks the 
+        (scenario, year) pairs in the LSL data. Returns a list of 
+        (SL_MEASURE, SCENARIO, STORM, SECTOR, scenario) labels, a matching 
+        [label x year x draw] array of damages, and a boolean array of the 
+        damages found for each draw. The scenarios are set by 
+        self._scenarios(keys), and projected (proj) damages are only found 
+        for draws with climatological storm damages.
         '''
         
-        storm_damages = self._storm_damages(lsl_scenario)
-        exposure_below = self._exposure_run(lsl_scenario)
+        labels, storm_damages, projected = self._storm_array(keys, years, lsl)
+        exposure_below = self._exposure_array(keys, years, lsl)
 
-        # Adjust exposure to remove base-year exposure below
-        for sl in rms.Exposure.SL_MEAS:
-            exposure_below[sl] = exposure_below[sl].groupby(level=[c for c in exposure_below[sl].index.names if c != 'YEAR']).apply(lambda x: x-x[x.index.get_level_values('YEAR') == 2010].iloc[0])
+        storm_found = ~np.isnan(storm_damages)
 
-            # Require exposure_below monotonicity with year
-            exposure_below[sl] = exposure_below[sl].groupby(level=[c for c in exposure_below[sl].index.names if c != 'YEAR']).apply(lambda x: x.rolling(window=100, min_periods=0).max())
+        if gams:
+            batch = gams if isinstance(gams, writegams.GDXBatch) else writegams.GDXBatch()
+            self._gams_export(keys, years, present, labels, storm_damages, exposure_below, projected, draws, batch)
 
-        share_below = {}
-        adjusted_damage = {sl:{} for sl in rms.Exposure.SL_MEAS}
+            # Write the block's files at once, unless the caller writes the batch
+            if batch is not gams:
+                batch.write()
 
-        if 'proj' in storm_damages.index.get_level_values('SCENARIO'):
-            scenarios = ['hist','proj']
-        else:
-            scenarios = ['hist']
+        scenarios = self._scenarios(keys)
+        storms = {'hist': ['historical', 'noreaster'], 'proj': ['climatological', 'noreaster']}
 
-        if gams:
-            self._prep_gams_export(storm_damages, exposure_below, scenarios, lsl_scenario.name)
+        risk = self.state_risk.reindex(keys.get_level_values('STATE')).values
+
+        damage_labels = []
+        damages = []
+        found = []
 
         for sl in rms.Exposure.SL_MEAS:
 
+            exposure_found = present[:, :, np.newaxis] & ~np.isnan(exposure_below[sl])
+
             # Get share of exposure set unavailable for damage due to inundation
-            share_below[sl] = exposure_below[sl].div(self.state_risk, level='STATE')
+            share_below = exposure_below[sl] / risk[:, np.newaxis, np.newaxis]
+            share_below[~present] = np.nan
 
             # Require share_below monotonicity with year
-            assert share_below[sl].groupby(level=[c for c in share_below[sl].index.names if c != 'YEAR']).apply(lambda x: ((x.diff().fillna(0) >= 0).all())).all()
-
-            # Scale damages 
-            adjusted_damage[sl] = storm_damages * (1- share_below[sl].loc[[tuple([k[storm_damages.index.names.index(n)] for n in share_below[sl].index.names]) for k in storm_damages.index.values]]).values
+            with np.errstate(invalid='ignore'):
+                assert not (np.diff(share_below, axis=1) < 0).any()
 
             for scen in scenarios:
+                in_scenario = np.ones(len(draws), dtype=bool) if scen == 'hist' else projected
 
-                scen_exposure = exposure_below[sl].copy()
-
-                scen_exposure = pd.DataFrame(
-                    scen_exposure.values,
-                    index=scen_exposure.index,
-                    columns=pd.MultiIndex.from_tuples(
-                        [(scen,'IN', 'inundation')],
-                        names=['SCENARIO', 'SECTOR', 'STORM'])
-                    ).stack(['SCENARIO','SECTOR','STORM'])
-
-                missing = np.array(adjusted_damage[sl].index.names)[np.in1d(adjusted_damage[sl].index.names, scen_exposure.index.names, invert=True)]
-                assert len(missing) == 0, "['{}'] not found in scen_exposure index".format("', '".join(map(str, missing)))
-                scen_exposure.index = scen_exposure.index.reorder_levels(adjusted_damage[sl].index.names)
-                adjusted_damage[sl] = adjusted_damage[sl].append(scen_exposure)
+                # Scale damages
+                for i, (storm, sector, k) in enumerate(labels):
+                    if storm in storms[scen]:
+                        damage_labels.append((sl, scen, storm, sector, k))
+                        damages.append(storm_damages[i] * (1 - share_below[k]))
+                        found.append(storm_found[i] & in_scenario)
 
-        damage_scenario = pd.concat(adjusted_damage, axis=0, names=['SL_MEASURE'])
+                for k in range(len(keys)):
+                    damage_labels.append((sl, scen, 'inundation', 'IN', k))
+                    damages.append(exposure_below[sl][k])
+                    found.append(exposure_found[k] & in_scenario)
 
-        return damage_scenario
+        return damage_labels, np.array(damages), np.array(found)
 
-    def postprocess(self):
+    def _damage_index(self, keys, years, labels):
         '''
+        Index damage labels from _damage_simulation by year, as in CoastRun.damages
         '''
 
-        diff = self.damages.sort_index().groupby(
-            level=[c for c in self.damages.index.names if c != 'YEAR']
-            ).apply(lambda x: x - x.iloc[0,:])
-
-        storm = diff.query(
-            'STORM in ("historical","climatological","noreaster")'
-            ).sum(level=[c for c in diff.index.names if c != 'STORM'])
+        positions = np.array([k for (sl, scen, storm, sector, k) in labels])
+        columns = zip(*[(sl, scen, storm, sector) for (sl, scen, storm, sector, k) in labels])
 
-        expos = diff.query(
-            'STORM in ("inundation")'
-            ).sum(level=[c for c in diff.index.names if c != 'STORM'])
+        levels = [np.repeat(np.array(column, dtype=object), len(years)) for column in columns]
+        levels += [np.repeat(keys.get_level_values(c)[positions], len(years)) for c in keys.names]
+        levels += [np.tile(years, len(labels))]
 
-        def operate_across(df, levels, axis=0, func=(lambda x: x.sum)):
-            return func(df)(
-                level=[c for c in df.index.names if c not in levels],
-                axis=axis)
+        index = pd.MultiIndex.from_arrays(levels, names=['SL_MEASURE','SCENARIO','STORM','SECTOR'] + keys.names + ['YEAR'])
 
-        storm = operate_across(storm, ['SECTOR', 'STATE'])
-        expos = operate_across(expos, ['SECTOR', 'STATE'])
+        ordering = [
+            'RCP','SL_MEASURE','SCENARIO','STORM','SECTOR','STATE','YEAR']
 
-        def get_period(x):
-            return pd.MultiIndex.from_tuples(
-                [("None",) if y < 2020 or y > 2099 else (
-                    '{} to {}'.format(
-                        ((y-2020)//20*20+2020),
-                        ((y-2020)//20*20+2039)),
-                    ) for y in x.index.get_level_values('YEAR')],
-                names=['PERIOD'])
+        return index.reorder_levels(
+            [c for c in ordering if c in index.names])
 
-        storm.set_index(get_period(storm), inplace=True, append=True)
-        expos.set_index(get_period(expos), inplace=True, append=True)
+    def postprocess(self):
+        '''
+        Summarize damages by 20-year period
 
-        storm = operate_across(storm, ['YEAR'], func=(lambda x: x.mean))
-        expos = operate_across(expos, ['YEAR'], func=(lambda x: x.mean))
+        Storm and inundation damages are taken as changes from 2010, 
+        summed across states and sectors, and averaged over each period. 
+        With more than one draw, these are summarized by quantiles across 
+        draws. Draws are reduced self.chunksize at a time; see 
+        periods.summarize.
+        '''
 
-        storm = storm.query('PERIOD != "None"')
-        expos = expos.query('PERIOD != "None"')
+        damages = self.damages
+        if not damages.index.is_monotonic_increasing:
+            damages = damages.sort_index()
 
-        if storm.shape[1] > 1:
-            storm = storm.quantile([0.05,0.167,0.5,0.833,0.95], axis=1).T
-            expos = expos.quantile([0.05,0.167,0.5,0.833,0.95], axis=1).T
+        blocks = (
+            (damages.columns[start:start+self.chunksize], damages.values[:, start:start+self.chunksize])
+            for start in range(0, damages.shape[1], self.chunksize))
 
-        self.storm = storm
-        self.exposure = expos
+        self.storm, self.exposure = periods.summarize(damages.index, blocks)
 
     def load_data(self, refresh=False, *args, **kwargs):
 
         if refresh or (self.gauge_data is None):
-            self._load_gauge_data(*args, **kwargs)
+            with self.profile.stage('load_gauge_data') as record:
+                self._load_gauge_data(*args, **kwargs)
+                record.update(rows=self.gauge_data.shape[0], draws=self.gauge_data.shape[1], array_mb=self.gauge_data.values.nbytes / profiling.MB)
         if refresh or (self.storm_db is None):
-            self._load_storm_data()
+            with self.profile.stage('load_storm_data'):
+                self._load_storm_data()
         if refresh or (self.exposure_below is None):
-            self._prep_exposure()
+            with self.profile.stage('prep_exposure'):
+                self._prep_exposure()
         if refresh or (self.state_risk is None):
-            self._prep_value_at_risk()
+            with self.profile.stage('prep_value_at_risk'):
+                self._prep_value_at_risk()
+
+    def iter_damages(self, gams=False, simulate=True):
+        '''
+        Simulate damages for the LSL draws in self.gauge_data, in blocks
+
+        Draws are simulated self.chunksize at a time, as dense arrays. 
+        Yields (index, draws, values, found) for each block, where index is 
+        the sorted damage index (the same for every block), values is a 
+        [damage x draw] array, and found marks the damages computed for 
+        each draw. Damages that are not found are NaN.
+
+        If gams is True, each block's GAMS files are written as it is 
+        simulated. If gams is a writegams.GDXBatch, the files are added 
+        to it before each block is yielded, to be written by the caller.
+        '''
+
+        keys, years, (key_positions, year_positions) = self._lsl_array(self.gauge_data)
+
+        present = np.zeros((len(keys), len(years)), dtype=bool)
+        present[key_positions, year_positions] = True
+
+        draw_order = np.argsort(self.gauge_data.columns.values, kind='mergesort')
+        draws = self.gauge_data.columns[draw_order]
+        lsl_values = self.gauge_data.values
+
+        index = None
+
+        for start in range(0, len(draws), self.chunksize):
+            chunk = draw_order[start:start+self.chunksize]
+
+            lsl = np.empty((len(keys), len(years), len(chunk)))
+            lsl.fill(np.nan)
+            lsl[key_positions, year_positions] = lsl_values[:, chunk]
+
+            labels, damages, found = self._damage_simulation(
+                keys,
+                years,
+                lsl,
+                present,
+                draws[start:start+self.chunksize],
+                gams=gams,
+                simulate=simulate)
+
+            # Lay out damages in sorted order on the first block
+            if index is None:
+                index = self._damage_index(keys, years, labels)
+                ordered = pd.Series(np.arange(len(index)), index=index).sort_index()
+                index = ordered.index
+
+                rows = np.empty(len(index), dtype=int)
+                rows[ordered.values] = np.arange(len(index))
+                rows = rows.reshape((len(labels), len(years)))
+
+            values = np.empty((len(index), len(chunk)))
+            values_found = np.empty((len(index), len(chunk)), dtype=bool)
+
+            for i in range(len(labels)):
+                values[rows[i]] = np.where(found[i], damages[i], np.nan)
+                values_found[rows[i]] = found[i]
+
+            yield index, draws[start:start+self.chunksize], values, values_found
 
     def run(self, refresh=False, gams=False, simulate=True, *args, **kwargs):
         '''
+        Simulate damages for every LSL draw in self.gauge_data
+
+        Blocks of draws from iter_damages are copied into a single 
+        [damage x draw] array. Damages that are never found are dropped 
+        from the array, and it is formatted as a DataFrame without a 
+        further copy, once all draws are complete.
         '''
 
         self.load_data(refresh=refresh, *args, **kwargs)
 
-        damages = pd.concat({
-            col: self._damage_simulation(
-                self.gauge_data[col],
-                gams=gams,
-                simulate=simulate) for col in self.gauge_data.columns},
-            axis=1,
-            names=['DRAW'])
+        if self.gauge_data.shape[1] == 0:
+            raise ValueError('No LSL draws to simulate')
 
-        ordering = [
-            'RCP','SL_MEASURE','SCENARIO','STORM','SECTOR','STATE','YEAR']
+        values = None
+        start = 0
+
+        with self.profile.stage('simulate') as record:
+            for index, draws, block, found in self.iter_damages(gams=gams, simulate=simulate):
+                if values is None:
+                    values = np.empty((len(index), len(self.gauge_data.columns)))
+                    found_any = np.zeros(len(index), dtype=bool)
 
-        damages.index = damages.index.reorder_levels(
-            [c for c in ordering if c in damages.index.names])
+                values[:, start:start+len(draws)] = block
+                found_any |= found.any(axis=1)
+                start += len(draws)
 
-        damages.sort_index(inplace=True)
+            record.update(draws=start, damage_rows=len(index), array_mb=values.nbytes / profiling.MB)
 
-        self.damages = damages
+        with self.profile.stage('format'):
+            if not found_any.all():
+                values = values[found_any]
+                index = index[found_any]
 
-        self.postprocess()
+            self.damages = pd.DataFrame(
+                values,
+                index=index,
+                columns=pd.Index(np.sort(self.gauge_data.columns.values, kind='mergesort'), name='DRAW'),
+                copy=False)
+
+        with self.profile.stage('postprocess'):
+            self.postprocess()
 
 
 class Median(CoastRun):
@@ -482,15 +628,71 @@ class Replication(CoastRun):
 
 
 def do_montecarlo(start, end, outdir):
-    mc = MonteCarlo()
+    mc = MonteCarlo(run_name='coastal-damages-{:04}-{:04}'.format(start, end))
     mc.run(draws=range(start, end))
 
     if not os.path.isdir(outdir):
         os.makedirs(outdir)
     
-    mc.damages.to_csv(os.path.join(
-        outdir, 'coastal-damages-raw-{:04}-{:04}.csv'.format(start, end)))
-    
+    with mc.profile.stage('write'):
+        mc.damages.to_csv(os.path.join(
+            outdir, 'coastal-damages-raw-{:04}-{:04}.csv'.format(start, end)))
+
+    mc.profile.save(os.path.join(
+        outdir, 'coastal-damages-profile-{:04}-{:04}.json'.format(start, end)))
+
+    print(mc.profile.summary())
+
+
+def plan_montecarlo(start, end, calibration_draws=100):
+    '''
+    Estimate the wall time and peak memory of do_montecarlo(start, end)
+
+    Runs the first calibration_draws draws of the range, and scales the 
+    time of its per-draw stages to the full range. Peak memory is the 
+    RSS before simulation, plus the LSL draws and [damage x draw] arrays 
+    held for every draw, plus the working memory of simulating a block 
+    of draws, measured in the calibration run. Returns a dict, with the 
+    calibration run's profile report.
+    '''
+
+    ndraws = end - start
+    calibration = min(calibration_draws, ndraws)
+
+    mc = MonteCarlo(run_name='calibration-{:04}-{:04}'.format(start, start + calibration))
+    mc.run(draws=range(start, start + calibration))
+
+    # Writing the CSV scales with the draws as well; time it on the calibration draws
+    with mc.profile.stage('write'):
+        with open(os.devnull, 'w') as devnull:
+            mc.damages.to_csv(devnull)
+
+    fixed_seconds = mc.profile.seconds('load_storm_data', 'prep_exposure', 'prep_value_at_risk')
+    seconds_per_draw = mc.profile.seconds('load_gauge_data', 'simulate', 'format', 'postprocess', 'write') / calibration
+
+    simulated = mc.profile.get('simulate')[0]
+    gauge_rows = mc.profile.get('load_gauge_data')[0]['rows']
+
+    # run makes a second, filtered copy of the damages array if any are never found
+    filtered_rows = 0 if len(mc.damages) == simulated['damage_rows'] else len(mc.damages)
+    mb_per_draw = 8. * (gauge_rows + simulated['damage_rows'] + filtered_rows) / profiling.MB
+
+    rss_start = simulated['rss_start_mb'] if simulated['rss_start_mb'] is not None else mc.profile.get('load_gauge_data')[0]['peak_rss_mb']
+    baseline_mb = rss_start - calibration * 8. * gauge_rows / profiling.MB
+    working_mb = max(0, mc.profile.get('postprocess')[0]['peak_rss_mb'] - baseline_mb - calibration * mb_per_draw)
+
+    return dict(
+        start=start,
+        end=end,
+        draws=ndraws,
+        calibration_draws=calibration,
+        damage_rows=simulated['damage_rows'],
+        seconds=fixed_seconds + seconds_per_draw * ndraws,
+        seconds_per_draw=seconds_per_draw,
+        peak_rss_mb=baseline_mb + working_mb + ndraws * mb_per_draw,
+        mb_per_draw=mb_per_draw,
+        calibration=mc.profile.report())
+
 
 @click.command()
 @click.argument('start', type=int)
@@ -500,7 +702,16 @@ def do_montecarlo(start, end, outdir):
     help='output directory',
     default='outputs/mc_run/{}/'.format(
         pd.datetime.today().strftime('%Y-%m-%d')))
-def main(start, end, outdir):
+@click.option('--dry-run', is_flag=True, default=False, help='estimate time and peak memory from a short calibration run, without running the range')
+@click.option('--calibration-draws', type=int, default=100, help='draws in the --dry-run calibration run')
+def main(start, end, outdir, dry_run, calibration_draws):
+    if dry_run:
+        plan = plan_montecarlo(start, end, calibration_draws)
+        print('{draws} draws, {damage_rows} damages per draw, calibrated on {calibration_draws} draws'.format(**plan))
+        print('estimated wall time: {:.0f} s ({:.3f} s per draw)'.format(plan['seconds'], plan['seconds_per_draw']))
+        print('estimated peak memory: {:.0f} MB ({:.3f} MB per draw)'.format(plan['peak_rss_mb'], plan['mb_per_draw']))
+        return
+
     do_montecarlo(start, end, outdir)
 
 
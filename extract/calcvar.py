@@ -11,35 +11,53 @@ __version__ = "$Revision$"
 
 import csv, os
 import numpy as np
-from statsmodels.distributions.empirical_distribution import StepFunction
-
-# Print as a table
-print "\t".join(['name', 'model', 'weather', 'impact', 'total'])
 
 # Results stored under uncertain/
 path = "uncertain"
 
-# Look for each file
-for filename in os.listdir(path):
-    # Only collect on set of assumptions and then infer the filenames of the others
-    if filename[0:6] != 'model-':
-        continue
+# Our full set of assumptions
+parts = ['model', 'weather', 'impact', 'total']
+
+def read_ecdf(filepath):
+    """Read the probabilities and the first region's values from an uncertain.py result."""
+    with open(filepath, 'r') as csvfp:
+        reader = csv.reader(csvfp)
+        pp = map(float, reader.next()[1:])
+        xx = map(float, reader.next()[1:])
+
+    return (pp, xx)
 
-    # Our full set of assumptions
-    parts = ['model', 'weather', 'impact', 'total']
+def ecdf_std(xxs, weights=None):
+    """Calculate the standard deviation of each row of values in xxs directly.
+    Each value is given its weight (by default, all are equally
+    likely), so this is the limit of np.std of draws taken with
+    np.random.choice(xx).
+    xxs may be a single list of values or a [files x values] array.
+    """
+    xxs = np.atleast_2d(np.array(xxs, dtype=float))
+    if weights is None:
+        weights = np.ones(xxs.shape[-1])
+    weights = np.array(weights, dtype=float) / np.sum(weights)
 
-    # Collect the ECDF for each assumption
-    values = {} # assumption -> std. dev.
-    for part in parts:
-        with open(os.path.join(path, part + filename[5:]), 'r') as csvfp:
-            reader = csv.reader(csvfp)
-            pp = map(float, reader.next()[1:])
-            xx = map(float, reader.next()[1:])
+    means = np.sum(xxs * weights, axis=-1)
+    variances = np.sum((xxs - means[:, np.newaxis])**2 * weights, axis=-1)
+
+    return np.sqrt(variances)
+
+if __name__ == '__main__':
+    # Print as a table
+    print "\t".join(['name', 'model', 'weather', 'impact', 'total'])
+
+    # Only collect on set of assumptions and then infer the filenames of the others
+    filenames = [filename for filename in os.listdir(path) if filename[0:6] == 'model-']
 
-            # Take 100000 draws from ECDF
-            samples = np.random.choice(xx, 100000, replace=True)
-            values[part] = np.std(samples)
+    # Collect the ECDF for each assumption of each file
+    xxs = [read_ecdf(os.path.join(path, part + filename[5:]))[1] for filename in filenames for part in parts]
 
-    # Report this impact
-    print "\t".join([filename[6:-4]] + map(str, [values['model'], values['weather'], values['impact'], values['total']]))
+    if filenames:
+        # Calculate all standard deviations at once, as [file x assumption]
+        stds = ecdf_std(xxs).reshape((len(filenames), len(parts)))
 
+        # Report each impact
+        for ii in range(len(filenames)):
+            print "\t".join([filenames[ii][6:-4]] + map(str, stds[ii]))
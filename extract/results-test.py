@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Script to check weighted_quantiles and WeightedECDF.inverse against the original step-function inverse.
+"""
+__author__ = "James Rising"
+__maintainer__ = "James Rising"
+__email__ = "jrising@berkeley.edu"
+
+__status__ = "Production"
+__version__ = "$Revision$"
+# $Source$
+
+import numpy as np
+import results
+
+def baseline_inverse(values, weights, pp):
+    """The original WeightedECDF construction and inverse, kept as the reference."""
+    order = sorted(range(len(values)), key=lambda ii: values[ii])
+    sortvalues = np.array([values[ii] for ii in order])
+    sortweights = [weights[ii] for ii in order]
+    cumpp = np.cumsum(sortweights) / sum(sortweights)
+
+    if len(np.array(pp).shape) == 0:
+        pp = np.array([pp])
+
+    # Determine the index for interior solutions
+    indexes = np.searchsorted(cumpp, pp) - 1
+
+    useiis = indexes
+    # Handle points below the lowest stp
+    useiis[indexes < 0] = 0
+
+    results = np.array(sortvalues[useiis], dtype=float)
+    results[indexes < 0] = -np.inf
+
+    return results
+
+def check(valueses, weightses, pvals):
+    """Compare all three evaluations for a set of ragged rows."""
+    (values, weights) = results.stack_weighted(valueses, weightses)
+    quantiles = results.weighted_quantiles(values, weights, pvals)
+
+    for ii in range(len(valueses)):
+        expected = baseline_inverse(valueses[ii], weightses[ii], pvals)
+        assert np.array_equal(results.WeightedECDF(valueses[ii], weightses[ii]).inverse(pvals), expected), (ii, pvals)
+        assert np.array_equal(quantiles[ii], expected), (ii, pvals, quantiles[ii], expected)
+
+# The worked example: pvals below the first step take the lowest value
+check([[3, 1, 2, 5]], [[.3, .3, .2, .2]], [.01, .2, .3, .5, .99, 1])
+assert np.array_equal(results.weighted_quantiles([3, 1, 2, 5], [.3, .3, .2, .2], [.01, .2, .3, .5, .99, 1])[0], [1, 1, 1, 1, 3, 3])
+
+randstate = np.random.RandomState(0)
+evalpvals = list(np.linspace(.01, .99, 99))
+
+for trial in range(50):
+    # Ragged rows, with ties, and GCM-like weights
+    valueses = []
+    weightses = []
+    for region in range(randstate.randint(1, 8)):
+        numvalues = randstate.randint(1, 40)
+        valueses.append(list(np.round(randstate.normal(size=numvalues), 1)))
+        weightses.append(list(randstate.randint(1, 5, numvalues) / 4.))
+
+    # Evaluate at the usual percentiles, at the exact steps of the first row, and below its first step
+    order = sorted(range(len(valueses[0])), key=lambda ii: valueses[0][ii])
+    steps = list(np.cumsum([weightses[0][ii] for ii in order]) / sum(weightses[0]))
+    pvals = evalpvals + steps + [0, steps[0] / 2, 1]
+    randstate.shuffle(pvals)
+
+    check(valueses, weightses, pvals)
+
+print "weighted_quantiles matches the original WeightedECDF.inverse."
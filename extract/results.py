@@ -185,9 +185,7 @@ class WeightedECDF(StepFunction):
         self.expected = sum(np.array(values) * np.array(weights)) / sum(weights)
 
         # Creat the cummulative sum that represents this ECDF
-        order = sorted(range(len(values)), key=lambda ii: values[ii])
-        self.values = np.array([values[ii] for ii in order])
-        self.weights = [weights[ii] for ii in order]
+        (self.values, self.weights) = sort_weighted(values, weights)
 
         self.pp = np.cumsum(self.weights) / sum(self.weights)
         super(WeightedECDF, self).__init__(self.values, self.pp, sorted=True)
@@ -202,14 +200,85 @@ class WeightedECDF(StepFunction):
         # Determine the index for interior solutions
         indexes = np.searchsorted(self.pp, pp) - 1
 
-        useiis = indexes
-        # Handle points below the lowest stp
-        useiis[indexes < 0] = 0
+        # Points below the lowest step take the lowest value
+        useiis = np.maximum(indexes, 0)
 
-        results = np.array(self.values[useiis], dtype=float)
-        results[indexes < 0] = -np.inf
+        return np.array(self.values[useiis], dtype=float)
 
-        return results
+def sort_weighted(values, weights):
+    """Sort values along their last axis, carrying the weights along.
+    The sort is stable, so ties keep their original order (as with sorted()).
+    weights may be 1-D for a [regions x samples] values array.
+    Returns (sorted values, sorted weights) as float arrays.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != values.shape:
+        weights = np.ones(values.shape) * weights
+
+    order = np.argsort(values, axis=-1, kind='mergesort')
+    if values.ndim == 1:
+        return (values[order], weights[order])
+
+    # Gather each row in its own order
+    rows = np.arange(values.shape[0])[:, np.newaxis]
+    return (values[rows, order], weights[rows, order])
+
+def weighted_quantiles(values, weights, pvals):
+    """Evaluate the inverse weighted ECDF for many regions at once.
+
+    values: [regions x samples] array of results
+    weights: [samples] or [regions x samples] array of weights; rows
+      with fewer samples may be padded with values of inf and weights of 0
+    pvals: sequence of probabilities, each no greater than 1
+    Returns a [regions x pvals] array, identical to calling
+    WeightedECDF(values[ii], weights[ii]).inverse(pvals) for each row.
+    """
+    values = np.atleast_2d(values)
+    pvals = np.atleast_1d(np.asarray(pvals, dtype=float))
+    (sortvals, sortweights) = sort_weighted(values, weights)
+    (numregions, numsamples) = sortvals.shape
+
+    # Cummulative probability at each step, normalized by the same sequential sum
+    cumweights = np.cumsum(sortweights, axis=1)
+    pp = cumweights / cumweights[:, -1:]
+
+    # For each step, find how many of the pvals are at or below it
+    porder = np.argsort(pvals, kind='mergesort')
+    below = np.searchsorted(pvals[porder], pp, side='right')
+
+    # Count the steps strictly below each pval; this is searchsorted(pp, pval) within each row
+    offsets = np.arange(numregions)[:, np.newaxis] * (len(pvals) + 1)
+    counts = np.bincount((below + offsets).ravel(), minlength=numregions * (len(pvals) + 1))
+    counts = np.cumsum(counts.reshape(numregions, len(pvals) + 1), axis=1)[:, :-1]
+
+    # Look up the value for the last step below each pval; points below the lowest step take the lowest value
+    indexes = np.maximum(counts - 1, 0)
+    rows = np.arange(numregions)[:, np.newaxis]
+    sorted_results = np.array(sortvals[rows, indexes], dtype=float)
+
+    # Return to the order that pvals were given in
+    results = np.empty(sorted_results.shape)
+    results[:, porder] = sorted_results
+
+    return results
+
+def stack_weighted(valueses, weightses):
+    """Stack ragged lists of values and weights into [regions x samples] arrays.
+    Short rows are padded with values of inf and weights of 0, which
+    weighted_quantiles ignores.
+    """
+    numsamples = max([len(values) for values in valueses])
+
+    values = np.empty((len(valueses), numsamples))
+    values.fill(np.inf)
+    weights = np.zeros((len(valueses), numsamples))
+
+    for ii in range(len(valueses)):
+        values[ii, :len(valueses[ii])] = valueses[ii]
+        weights[ii, :len(weightses[ii])] = weightses[ii]
+
+    return (values, weights)
 
 def get_yearses(fp, yearses):
     """Get the given years of results, for collections of year sets."""
@@ -289,6 +358,49 @@ def get_years(fp, years, column=2):
 
     return results
 
+def read_summary(targetdir, bundle):
+    """Read the window summary sidecar written alongside a bundle.
+    Returns {region: {(year0, year1): (mean, min, max, count)}}, or
+    None if the bundle has no sidecar.
+    """
+    path = os.path.join(targetdir, bundle + ".summary.csv")
+    if not os.path.exists(path):
+        return None
+
+    summary = {}
+    with open(path, 'r') as fp:
+        reader = csv.reader(fp)
+        reader.next()
+
+        for row in reader:
+            if row[0] not in summary:
+                summary[row[0]] = {}
+
+            if row[3] == 'NA':
+                stats = (np.nan, np.nan, np.nan, 0)
+            else:
+                stats = (float(row[3]), float(row[4]), float(row[5]), int(row[6]))
+
+            summary[row[0]][(int(row[1]), int(row[2]))] = stats
+
+    return summary
+
+def get_summary_yearses(summary, region, yearses):
+    """Get the mean result for each of a collection of year sets from a summary.
+    Returns None if any of the year sets was not summarized, so the
+    caller can fall back on get_yearses.
+    """
+    if summary is None or region not in summary:
+        return None
+
+    results = []
+    for years in yearses:
+        if tuple(years) not in summary[region]:
+            return None
+        results.append(summary[region][tuple(years)][0])
+
+    return results
+
 def iterate_bundle(targetdir, impact, suffix, working_suffix=''):
     """Yield a file pointer to each file in the given result bundle."""
 
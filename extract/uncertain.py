@@ -9,7 +9,7 @@ __status__ = "Production"
 __version__ = "$Revision$"
 # $Source$
 
-import tarfile, os, csv
+import tarfile, os, csv, tempfile, shutil, multiprocessing
 import numpy as np
 
 import results
@@ -22,62 +22,135 @@ yearses = [(2020, 2039), (2040, 2059), (2080, 2099)]
 checks = ['check-20140609', 'chkcge-20140609']
 # Collect results from all MC batches
 batches = map(lambda i: 'batch-' + str(i), range(25))
-# Only take national results
-suffix = '-national'
+# Only take national results; add e.g. '-state' to include regional bundles
+suffixes = ['-national']
 # Place the results in uncertain/
 outdir = 'uncertain'
-# Use working directories with the prefix uncwork
+# Use private working directories with the prefix uncwork
 workdir = 'uncwork'
+# Number of target directories to read at once
+processes = multiprocessing.cpu_count()
+# Root of the result catalog
+root = "/home/jrising/impacts"
 # Evaluate the result at each percentile
 evalpvals = list(np.linspace(.01, .99, 99))
 
 base_model = 'hadgem2-ao' # Choose a model to compare variance against
 base_realization = '001' # Choose a realization to compare variance against
 
-# Collect the results for a given Monte Carlo run into our data dictionary
-def collect_result(impact, batch, rcp, model, realization, targetdir, data):
-    """Collect the results for a paricular target directory, and filter them into data."""
+def collect_target(job):
+    """Read every requested impact's bundles in a target directory, in a single visit.
+    job is (batch, rcp, model, realization, targetdir, holds), where
+    holds lists the held-assumption distributions to fill.
+    Returns (job, [(impact, dist, region, value)]).
+    """
+    (batch, rcp, model, realization, targetdir, holds) = job
     print targetdir
 
+    found = []
+
+    # Extract into a private scratch directory, so concurrent runs don't collide
+    scratch = tempfile.mkdtemp(prefix=workdir + '-')
+    try:
+        contents = os.listdir(targetdir)
+        for impact in impacts:
+            for suffix in suffixes:
+                if impact + suffix + ".tar.gz" not in contents:
+                    continue
+
+                # Use the precomputed window means, if they are all available
+                summary = results.read_summary(targetdir, impact + suffix)
+                if summary is not None:
+                    means = dict((region, results.get_summary_yearses(summary, region, yearses)) for region in summary)
+                    if None not in means.values():
+                        for region in means:
+                            for ii in range(len(yearses)):
+                                found.append((impact, rcp + '-' + str(yearses[ii][0]), region, means[region][ii]))
+                        continue
+
+                # Otherwise, extract the values
+                os.system("tar -xzf " + os.path.join(targetdir, impact + suffix + ".tar.gz") + " -C " + scratch)
+
+                # Go through all regions
+                for name in os.listdir(os.path.join(scratch, impact + suffix)):
+                    if name == impact:
+                        continue # just the directory
+
+                    region = name[0:-4]
+
+                    # Open up this region's results
+                    with open(os.path.join(scratch, impact + suffix, name)) as fp:
+                        # Get the values for our year sets
+                        values = results.get_yearses(fp, yearses)
+                        if not values:
+                            continue
+
+                        for ii in range(len(yearses)):
+                            found.append((impact, rcp + '-' + str(yearses[ii][0]), region, np.mean(values[ii])))
+    finally:
+        shutil.rmtree(scratch)
+
+    return (job, found)
+
+def file_result(job, found, holds):
+    """Filter the values from collect_target into each held-assumption distribution.
+    holds is { hold => { impact => { rcp-year0 => { region => { batch-realization => { model => value } } } } } }
+    """
+    (batch, rcp, model, realization, targetdir, jobholds) = job
     collection = batch + '-' + realization
 
-    # Extract the values
-    os.mkdir(workdir + suffix)
-    os.chdir(workdir + suffix)
-    os.system("tar -xzf " + os.path.join(targetdir, impact + suffix + ".tar.gz"))
-    os.chdir('..')
+    for (impact, dist, region, value) in found:
+        for hold in jobholds:
+            # Store everything in the data dictionary-of-dictionaries-of-...
+            data = holds[hold].setdefault(impact, {})
+            if dist not in data:
+                data[dist] = {}
+            if region not in data[dist]:
+                data[dist][region] = {}
+            if collection not in data[dist][region]:
+                data[dist][region][collection] = {}
 
-    # Go through all regions
-    for name in os.listdir(os.path.join(workdir + suffix, impact + suffix)):
-        if name == impact:
-            continue # just the directory
+            data[dist][region][collection][model] = value
 
-        region = name[0:-4]
+def catalog_jobs():
+    """Walk the result catalog once, listing each target directory and the distributions it fills."""
+    jobs = []
 
-        # Open up this region's results
-        with open(os.path.join(workdir + suffix, impact + suffix, name)) as fp:
-            # Get the values for our year sets
-            values = results.get_yearses(fp, yearses)
-            if not values:
-                continue
+    # Go through all median result sets for a baseline
+    for (pdir, rcp, model, realization, pvals, targetdir) in results.iterate_byp(root):
+        if pdir != 'pmed':
+            continue
 
-            # Store everything in the data dictionary-of-dictionaries-of-...
-            for ii in range(len(yearses)):
-                dist = rcp + '-' + str(yearses[ii][0])
+        # Collect the result into the hold_model_impact ('weather') and hold_realization_impact ('model') distributions
+        jobholds = []
+        if model == base_model:
+            jobholds.append('weather')
+        if realization == base_realization:
+            jobholds.append('model')
 
-                if dist not in data:
-                    data[dist] = {}
-                if region not in data[dist]:
-                    data[dist][region] = {}
-                if collection not in data[dist][region]:
-                    data[dist][region][collection] = {}
+        if jobholds:
+            jobs.append((pdir, rcp, model, realization, targetdir, jobholds))
 
-                data[dist][region][collection][model] = np.mean(values[ii])
+    # Go through all Monte Carlo result sets to understand the variance
+    for (batch, rcp, model, realization, pvals, targetdir) in results.iterate_montecarlo(root, batches=batches):
+        # Make sure this is a valid result set
+        if not results.directory_contains(targetdir, checks):
+            continue
+
+        if batch not in batches:
+            continue
+
+        # Filter the result into the hold_model_realization ('impact') and hold_nothing ('total') distributions
+        jobholds = ['total']
+        if model == base_model and realization == base_realization:
+            jobholds.insert(0, 'impact')
 
-    os.system('rm -r ' + workdir + suffix)
+        jobs.append((batch, rcp, model, realization, targetdir, jobholds))
 
-def write_result(impact, prefix, dist, data):
-    """Report the results for a given rcp-year set."""
+    return jobs
+
+def write_result(impact, prefix, dist, data, weights):
+    """Report the results for a given rcp-year set, weighting each GCM by weights (GCM -> weight)."""
     if dist not in data:
         return
 
@@ -87,6 +160,9 @@ def write_result(impact, prefix, dist, data):
         writer.writerow(['region'] + evalpvals)
 
         # Go through all known regions
+        regions = []
+        valueses = []
+        weightses = []
         for region in data[dist].keys():
             allvalues = []
             allweights = []
@@ -102,68 +178,46 @@ def write_result(impact, prefix, dist, data):
 
             print dist, region, len(allvalues)
 
-            # Construct an ECDF
-            distribution = results.WeightedECDF(allvalues, allweights)
-
-            # Evaluate all percentiles
-            writer.writerow([region] + list(distribution.inverse(evalpvals)))
+            regions.append(region)
+            valueses.append(allvalues)
+            weightses.append(allweights)
 
-# Set up the result directory
-if not os.path.exists(outdir):
-    os.mkdir(outdir)
+        if not regions:
+            return
 
-# Report result for every impact
-for impact in impacts:
-    print impact
+        # Evaluate all percentiles of every region's ECDF at once
+        (allvalues, allweights) = results.stack_weighted(valueses, weightses)
+        quantiles = results.weighted_quantiles(allvalues, allweights, evalpvals)
 
-    # Collect all available results
-    # { rcp-year0 => { region => { batch-realization => { model => value } } } }
-    hold_model_realization = {}
-    hold_model_impact = {}
-    hold_realization_impact = {}
-    hold_nothing = {}
+        for ii in range(len(regions)):
+            writer.writerow([regions[ii]] + list(quantiles[ii]))
 
-    # Go through all median result sets for a baseline
-    for (pdir, rcp, model, realization, pvals, targetdir) in results.iterate_byp("/home/jrising/impacts"):
-        if pdir != 'pmed':
-            continue
+if __name__ == '__main__':
+    # Set up the result directory
+    if not os.path.exists(outdir):
+        os.mkdir(outdir)
 
-        if impact + suffix + ".tar.gz" not in os.listdir(targetdir):
-            continue
+    # Collect all available results, for all impacts at once
+    holds = dict(model={}, weather={}, impact={}, total={})
 
-        # Collect the result into the hold_model_impact and hold_realization_impact data structures
-        if model == base_model:
-            collect_result(impact, pdir, rcp, model, realization, targetdir, hold_model_impact)
-        if realization == base_realization:
-            collect_result(impact, pdir, rcp, model, realization, targetdir, hold_realization_impact)
+    jobs = catalog_jobs()
+    pool = multiprocessing.Pool(processes)
+    for (job, found) in pool.imap_unordered(collect_target, jobs):
+        file_result(job, found, holds)
+    pool.close()
+    pool.join()
 
-    # Go through all Monte Carlo result sets to understand the variance
-    for (batch, rcp, model, realization, pvals, targetdir) in results.iterate_montecarlo("/home/jrising/impacts", batches=batches):
-        # Make sure this is a valid result set
-        if not results.directory_contains(targetdir, checks):
-            continue
+    # Report result for every impact
+    for impact in impacts:
+        print impact
 
-        if batch not in batches:
-            continue
+        # Combine across all batch-realizations that have all models
+        for rcp in results.rcps:
+            weights = results.get_weights(rcp)
 
-        if impact + suffix + ".tar.gz" not in os.listdir(targetdir):
-            continue
+            for years in yearses:
+                dist = rcp + '-' + str(years[0])
 
-        # Filter the result into the hold_model_realization data structure
-        if model == base_model and realization == base_realization:
-            collect_result(impact, batch, rcp, model, realization, targetdir, hold_model_realization)
-        # Filter the result into the hold_nothing data structure
-        collect_result(impact, batch, rcp, model, realization, targetdir, hold_nothing)
-
-    # Combine across all batch-realizations that have all models
-    for rcp in results.rcps:
-        weights = results.get_weights(rcp)
-
-        for years in yearses:
-            dist = rcp + '-' + str(years[0])
-
-            # Write out the distributions for each set of held assumptions
-            write_result(impact, 'model', dist, hold_realization_impact)
-            write_result(impact, 'weather', dist, hold_model_impact)
-            write_result(impact, 'impact', dist, hold_model_realization)
-            write_result(impact, 'total', dist, hold_nothing)
+                # Write out the distributions for each set of held assumptions
+                for hold in ['model', 'weather', 'impact', 'total']:
+                    write_result(impact, hold, dist, holds[hold].get(impact, {}), weights)
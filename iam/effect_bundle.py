@@ -75,6 +75,12 @@ results into the output file format.
 Temporary directories (characterized by random letters) are used to
 hold the results as they're being generated (before being bundled into
 tars).
+
+Each bundle <name>.tar.gz is accompanied by a summary sidecar
+<name>.summary.csv, with the mean, min, max and count of the first
+result column for each region over the year windows in
+summary_yearses and the single years in summary_years.  The format is:
+  region,year0,year1,mean,min,max,count
 """
 
 __copyright__ = "Copyright 2014, Distributed Meta-Analysis System"
@@ -98,6 +104,11 @@ except:
 
 FIPS_COMPLETE = '__complete__' # special FIPS code for the last county
 
+# Year windows to summarize in each bundle's sidecar (see WindowSummary)
+summary_yearses = [(2000, 2019), (2020, 2039), (2040, 2059), (2060, 2079), (2080, 2099)]
+# Single years to summarize in each bundle's sidecar
+summary_years = range(2020, 2100, 10)
+
 ### Variable Discovery
 
 # -D-
@@ -136,6 +147,7 @@ def make_tar_text(name, weather_dir, make_generator):
     # Put files into <name> directory
     if not os.path.exists(name):
         os.mkdir(name)
+    summary = WindowSummary()
 
     # Each file in <weather_dir> describes a forecast for a different FIPS
     for filename in os.listdir(weather_dir):
@@ -155,10 +167,11 @@ def make_tar_text(name, weather_dir, make_generator):
                 continue
 
             # Output the data to a file <name>/<fips>.csv
-            write_effect_file(name, fips, generator, "fraction")
+            write_effect_file(name, fips, generator, "fraction", summary)
 
     # tar and gzip all of the generated files
     os.system("tar -czf " + name + ".tar.gz " + name)
+    summary.write(name + ".summary.csv")
     os.system("rm -r " + name)
 
 # -D-
@@ -386,6 +399,66 @@ def kill_local_tempdir(tempdir):
 
 ## General helper functions for creation
 
+class WindowSummary(object):
+    """Running statistics of the first result column, over year
+    windows, for every region written into a bundle.
+    """
+
+    def __init__(self, yearses=None):
+        """yearses: list of (year0, year1) windows, inclusive; defaults
+        to summary_yearses and summary_years.
+        """
+        if yearses is None:
+            yearses = summary_yearses + [(year, year) for year in summary_years]
+
+        self.yearses = yearses
+        self.stats = {} # {region: {(year0, year1): [total, min, max, count]}}
+
+    def add(self, region, year, value):
+        """Include one year's result for a region."""
+        if region not in self.stats:
+            self.stats[region] = {}
+
+        try:
+            year = int(year)
+            value = float(value)
+        except (TypeError, ValueError):
+            return # header or 'NA'
+
+        for years in self.yearses:
+            if year < years[0] or year > years[1]:
+                continue
+
+            # Update the running statistics for this window
+            stats = self.stats[region].get(years)
+            if stats is None:
+                self.stats[region][years] = [value, value, value, 1]
+            else:
+                stats[0] += value
+                stats[1] = min(stats[1], value)
+                stats[2] = max(stats[2], value)
+                stats[3] += 1
+
+    def watch(self, region, generator):
+        """Pass through the rows of generator, including each one."""
+        for values in generator:
+            self.add(region, values[0], values[1])
+            yield values
+
+    def write(self, path):
+        """Write the summary sidecar to path (see the module documentation)."""
+        with open(path, 'wb') as csvfp:
+            writer = csv.writer(csvfp, quoting=csv.QUOTE_MINIMAL)
+            writer.writerow(["region", "year0", "year1", "mean", "min", "max", "count"])
+
+            for region in sorted(self.stats.keys()):
+                for years in self.yearses:
+                    stats = self.stats[region].get(years)
+                    if stats is None:
+                        writer.writerow([region, years[0], years[1], 'NA', 'NA', 'NA', 0])
+                    else:
+                        writer.writerow([region, years[0], years[1], repr(stats[0] / stats[3]), repr(stats[1]), repr(stats[2]), stats[3]])
+
 def send_fips_complete(make_generator):
     """Call after the last county of a loop of counties, to clean up any memory.
     """
@@ -409,7 +482,7 @@ def get_target_path(targetdir, name):
     else:
         return name
 
-def write_effect_file(path, fips, generator, collabel):
+def write_effect_file(path, fips, generator, collabel, summary=None):
     """Write the effects for a single FIPS-coded county.
 
     path: relative path for file
@@ -417,8 +490,12 @@ def write_effect_file(path, fips, generator, collabel):
     generator: a enumerator of tuples/lists with individual rows
     collabel: label for one (string) or more (list) columns after the
     year column
+    summary: a WindowSummary to include the results in, if given
     """
 
+    if summary is not None:
+        generator = summary.watch(fips, generator)
+
     # Create the CSV file
     with open(os.path.join(path, fips + '.csv'), 'wb') as csvfp:
         writer = csv.writer(csvfp, quoting=csv.QUOTE_MINIMAL)
@@ -449,6 +526,7 @@ def make_tar_dummy(name, acradir, make_generator, targetdir=None, collabel="frac
 
     tempdir = enter_local_tempdir()
     os.mkdir(name) # directory for county files
+    summary = WindowSummary()
 
     # Generate a effect file for each county in regionsA
     with open(os.path.join(acradir, 'regions/regionsANSI.csv')) as countyfp:
@@ -466,13 +544,14 @@ def make_tar_dummy(name, acradir, make_generator, targetdir=None, collabel="frac
                 continue
 
             # Construct the effect file
-            write_effect_file(name, fips, generator, collabel)
+            write_effect_file(name, fips, generator, collabel, summary)
 
     send_fips_complete(make_generator)
 
     # Generate the bundle tar
     target = get_target_path(targetdir, name)
     os.system("tar -czf " + os.path.join("..", target) + ".tar.gz " + name)
+    summary.write(os.path.join("..", target) + ".summary.csv")
 
     # Remove the working directory
     exit_local_tempdir(tempdir)
@@ -490,6 +569,7 @@ def make_tar_duplicate(name, filepath, make_generator, targetdir=None, collabel=
 
     tempdir = enter_local_tempdir()
     os.mkdir(name)
+    summary = WindowSummary()
 
     # Iterate through all FIPS-titled files in the effect bundle
     with tarfile.open(filepath) as tar:
@@ -503,13 +583,14 @@ def make_tar_duplicate(name, filepath, make_generator, targetdir=None, collabel=
                 continue
 
             # Construct the effect file
-            write_effect_file(name, fips, generator, collabel)
+            write_effect_file(name, fips, generator, collabel, summary)
 
     send_fips_complete(make_generator)
 
     # Generate the bundle tar
     target = get_target_path(targetdir, name)
     os.system("tar -czf " + os.path.join("..", target) + ".tar.gz " + name)
+    summary.write(os.path.join("..", target) + ".summary.csv")
 
     # Remove the working directory
     exit_local_tempdir(tempdir)
@@ -535,10 +616,11 @@ def make_tar_ncdf(name, weather_ncdf, var, make_generator, targetdir=None, colla
     # Create the working directory
     tempdir = enter_local_tempdir()
     os.mkdir(name)
+    summary = WindowSummary()
 
     # Helper function for calling write_effect_file with collabel
     def write_csv(name, fips, generator):
-        write_effect_file(name, fips, generator, collabel)
+        write_effect_file(name, fips, generator, collabel, summary)
 
     # Iterate through the data
     call_with_generator(name, weather_ncdf, var, make_generator, write_csv)
@@ -546,6 +628,7 @@ def make_tar_ncdf(name, weather_ncdf, var, make_generator, targetdir=None, colla
     # Create the effect bundle
     target = get_target_path(targetdir, name)
     os.system("tar -czf " + os.path.join("..", target) + ".tar.gz " + name)
+    summary.write(os.path.join("..", target) + ".summary.csv")
 
     # Remove the working directory
     exit_local_tempdir(tempdir)
@@ -1061,6 +1144,8 @@ def aggregate_tar(name, scale_dict=None, targetdir=None, collabel="fraction", ge
     if not os.path.exists(dirregion):
         os.mkdir(dirregion)
 
+    summary = WindowSummary()
+
     # For each region that got a result
     for region in regions:
         # Create a new CSV effect file
@@ -1078,17 +1163,21 @@ def aggregate_tar(name, scale_dict=None, targetdir=None, collabel="fraction", ge
             # For each year, output the weighted average
             for year in years:
                 if regions[region][year][1] == 0: # the denom is 0-- never got a value
-                    writer.writerow([year, 'NA'])
+                    row = [year, 'NA']
                 else:
                     # Write out the year's result
                     if report_all:
-                        writer.writerow([year] + list(regions[region][year][0] / float(regions[region][year][1])))
+                        row = [year] + list(regions[region][year][0] / float(regions[region][year][1]))
                     else:
-                        writer.writerow([year, float(regions[region][year][0]) / regions[region][year][1]])
+                        row = [year, float(regions[region][year][0]) / regions[region][year][1]]
+
+                writer.writerow(row)
+                summary.add(region, row[0], row[1])
 
     # Construct the effect bundle
     target = get_target_path(targetdir, dirregion)
     os.system("tar -czf " + os.path.join("..", target) + ".tar.gz " + dirregion)
+    summary.write(os.path.join("..", target) + ".summary.csv")
 
     # Clean up temporary directory
     exit_local_tempdir(tempdir)
@@ -4,36 +4,88 @@ from regions.regdefs import RegionDefinitions
 
 
 class MortalityCostCalculator(object):
-	def __init__(self,readdir, agglev='state', deflator=None, test_data=False):
+	def __init__(self,readdir, agglev='state', deflator=None, test_data=False, static_data=None, output_agglevs=None):
 		
 		self.agglev					=	agglev
 		self.config_data		= lib.config.ConfigData
-		self.static_data		=	static.StaticData(agglev=self.agglev,deflator=deflator,test_data=test_data)
+
+		if static_data is None:
+			static_data = static.StaticData(agglev=self.agglev,deflator=deflator,test_data=test_data)
+
+		self.static_data		=	static_data
+
+		#	Aggregation levels written from each impact run: agglev, the level of the impact data, and any coarser 
+		#	levels, which are summed from agglev results (e.g. 'state', 'midwest' and 'national' from 'county')
+		if output_agglevs is None:
+			output_agglevs = [agglev]
+
+		self.output_agglevs	=	list(output_agglevs)
+
+		#	Total population by region at each output level, summed once from agglev
+		population = self.static_data.region_total_population['total']
+		self.output_population = {}
+		for output_agglev in self.output_agglevs:
+			if output_agglev == self.agglev:
+				self.output_population[output_agglev] = population
+			else:
+				codes, regions = RegionDefinitions.get_aggregation(population.index,self.agglev,output_agglev)
+				self.output_population[output_agglev] = pd.Series(RegionDefinitions.sum_by_codes(population.values[:,np.newaxis],codes,len(regions))[:,0],index=regions,name='total')
 
 		self.readdir				=	readdir
 
 		self.impact_reader	=	rundata.ImpactDirectoryReader(agglev=self.agglev,readdir=self.readdir)
 
 	def run_simulation(self):
-		cohort_mortality_value = {}
-
-		cohort_mortality_value = self.static_data.cohort_mortality_value
 
 		# Loop through impact files in rundata.ImpactDirectoryReader.filepath and 
 		# create a set of results for each RCP, time period, and cohort or total
 		for rcp, tp, run in self.impact_reader.get_impact_run():
+			self.write_run(rcp,tp,run)
+
+	def write_run(self,rcp,tp,run):
+	#	Calculate and write the results of one impact run, for every discount rate and output aggregation level
+		mort_costs = self.calculate_mort_costs(run,self.static_data.cohort_mortality_values)
+		for output_agglev in self.output_agglevs:
 			for discrate in self.config_data.discount_rates:
-				mort_cost = self.calculate_mort_cost(discrate,run,cohort_mortality_value[discrate])
-				writer.ImpactWriter.output_results(mort_cost,rcp,tp,discrate,self.agglev,self.static_data)
+				mort_cost = mort_costs[discrate] if output_agglev == self.agglev else self.aggregate_mort_cost(mort_costs[discrate],output_agglev)
+				writer.ImpactWriter.output_results(mort_cost,rcp,tp,discrate,output_agglev,self.static_data,population=self.output_population[output_agglev])
+
+
+	def aggregate_mort_cost(self,mort_cost,output_agglev):
+	#	Sum mort_cost, indexed by cohort and region at self.agglev, to cohort and region at output_agglev. The regions
+	#	of the impact data are mapped once (RegionDefinitions.get_aggregation caches the mapping for each set of regions).
+
+		region_codes, regions = pd.factorize(mort_cost.index.get_level_values('region'))
+		cohort_codes, cohorts = pd.factorize(mort_cost.index.get_level_values('cohort'),sort=True)
+
+		target_codes, targets = RegionDefinitions.get_aggregation(regions,self.agglev,output_agglev)
+		codes = cohort_codes*len(targets) + target_codes[region_codes]
+
+		#	Sum into every (cohort, region) pair, keeping the pairs with data
+		sums = RegionDefinitions.sum_by_codes(mort_cost.values,codes,len(cohorts)*len(targets))
+		found = np.bincount(codes,minlength=len(cohorts)*len(targets)) > 0
+
+		index = pd.MultiIndex.from_product([cohorts,targets],names=['cohort','region'])
+		return pd.DataFrame(sums[found],index=index[found],columns=mort_cost.columns)
 
 
 
 	def calculate_mort_cost(self,discrate,run,cohort_mortality_value):
-		
-		def calculate_mort_cost_by_column(impact_column):
-			return impact_column*cohort_mortality_value['value']*self.static_data.region_cohort_population['population']*(np.float64(1)/100000/1e6)
+		return self.calculate_mort_costs(run,cohort_mortality_value.rename(columns={'value':discrate}))[discrate]
+
+
+	def calculate_mort_costs(self,run,cohort_mortality_values):
+	#	Mortality cost of every impact quantile, for each discount rate (columns of cohort_mortality_values), as {discount_rate: DataFrame}
+	#	Rows are aligned on (cohort, region) once, as pandas arithmetic would, and all quantiles and discount rates are 
+	#	computed as a single broadcast [row x quantile x discount_rate] product.
+
+		impacts, values = run.mort_data.align(cohort_mortality_values,join='outer',axis=0)
+		impacts, population = impacts.align(self.static_data.region_cohort_population['population'],join='outer',axis=0)
+		values = values.reindex(impacts.index)
+
+		mort_cost = impacts.values[:,:,np.newaxis]*values.values[:,np.newaxis,:]*population.values[:,np.newaxis,np.newaxis]*(np.float64(1)/100000/1e6)
 
-		return run.mort_data.apply(calculate_mort_cost_by_column)
+		return {discrate:pd.DataFrame(mort_cost[:,:,i],index=impacts.index,columns=impacts.columns) for i, discrate in enumerate(values.columns)}
 
 
 
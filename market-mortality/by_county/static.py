@@ -51,26 +51,17 @@ class StaticData(object):
 
 	def set_national_config_data(self):
 
-		self.labor_participation = self.national_data._get_and_validate_labor_participation()
-
-
-		#	Retrieve, validate, and set mortality_share_by_cohort
-		mortality_share_by_cohort = self.national_data._get_mortality()
-		self.source_data.validate_mortality_share_by_cohort(mortality_share_by_cohort)
-		self.mortality_share_by_cohort = mortality_share_by_cohort
-
-
-		#	Retrieve, validate, and set lost_participation_years
-		lost_participation_years = self.national_data.get_lost_participation_years(self.labor_participation,self.mortality_share_by_cohort)
-		self.source_data.validate_lost_labor_participation(lost_participation_years)
-		self.lost_participation_years = lost_participation_years
+		#	National tables are computed and validated once, and shared by all StaticData instances
+		self.labor_participation = self.national_data.labor_participation
+		self.mortality_share_by_cohort = self.national_data.mortality_share_by_cohort
+		self.lost_participation_years = self.national_data.lost_participation_years
 
 	def set_regional_config_data(self):
 
 		#	Load and cohort and total population by county and aggregate to regions
 		region_total_population		= RegionDefinitions.aggregate_dataframe(self.source_data.county_total_population,agglev=self.agglev)
 
-		pop_by_cohort							= RegionDefinitions.aggregate_dataframe(self.source_data.county_cohort_population,agglev=self.agglev).sum(level='region')
+		pop_by_cohort							= RegionDefinitions.aggregate_sum(self.source_data.county_cohort_population,agglev=self.agglev)
 		region_cohort_population	= pd.DataFrame(pd.concat({c:pop_by_cohort[c] for c in pop_by_cohort.columns},names=['cohort','region']),columns=['population'])
 		# region_cohort_population.columns = ['population']
 		
@@ -82,16 +73,17 @@ class StaticData(object):
 		#	Set and validate current value added per FTE-year
 		self.fte_employment, self.value_added, self.value_per_fte = self._get_value_per_fte()
 
-		#	Retrieve, validate, and set discounted_labor_lost and cohort_mortality_value, once for each discount rate
+		#	Retrieve and set discounted_labor_lost and cohort_mortality_value, for all discount rates at once
 		self.discounted_labor_lost = {}
 		self.cohort_mortality_value = {}
 
-		for discount_rate in self.config_data.discount_rates:
-			discounted_labor_lost, cohort_mortality_value = self._get_discounted_mort_value(discount_rate)
-			# self.source_data.validate_cohort_mortality_value(cohort_mortality_value,discount_rate)
+		discounted_labor_lost, cohort_mortality_value = self._get_discounted_mort_values(self.config_data.discount_rates)
 
-			self.discounted_labor_lost[discount_rate] = discounted_labor_lost
-			self.cohort_mortality_value[discount_rate] = self.format_mortality_value(cohort_mortality_value)
+		for i, discount_rate in enumerate(self.config_data.discount_rates):
+			# self.source_data.validate_cohort_mortality_value(cohort_mortality_value[i],discount_rate)
+
+			self.discounted_labor_lost[discount_rate] = discounted_labor_lost[i]
+			self.cohort_mortality_value[discount_rate] = self.format_mortality_value(cohort_mortality_value[i])
 
 	def deflate_config_data(self):
 		self.value_per_fte = self.deflator * self.value_per_fte
@@ -99,6 +91,10 @@ class StaticData(object):
 		for discount_rate in self.config_data.discount_rates:
 			self.cohort_mortality_value[discount_rate] = self.deflator * self.cohort_mortality_value[discount_rate]
 
+		#	Mortality values by cohort and region (rows, as in impact data) and discount rate (columns)
+		self.cohort_mortality_values = pd.concat({r:self.cohort_mortality_value[r]['value'] for r in self.config_data.discount_rates},axis=1)
+		self.cohort_mortality_values = self.cohort_mortality_values[list(self.config_data.discount_rates)]
+
 
 	#########################################
 	#       Private Instance Methods        #
@@ -106,10 +102,10 @@ class StaticData(object):
 
 	@staticmethod
 	def vec_echo_by_state(states,state_vec):
-		def echo_by_state(state):
-			return state_vec.loc[state]
-		f = np.vectorize(echo_by_state)
-		return f(states)
+		positions = state_vec.index.get_indexer(states)
+		if (positions < 0).any():
+			raise KeyError('States not found: {}'.format(list(np.unique(np.asarray(states)[positions < 0]))))
+		return state_vec.values[positions]
 
 
 	def _get_value_per_fte(self):
@@ -119,37 +115,37 @@ class StaticData(object):
 
 		else:
 			try:
-				cty_fte_employment	= RegionDefinitions.aggregate_dataframe(self.source_data.county_fte_employment,agglev=self.agglev)
+				fte_employment			= RegionDefinitions.aggregate_sum(self.source_data.county_fte_employment,agglev=self.agglev)
 				value_added					= self.source_data.cluster_value_added[self.agglev]
 
 			except NameError:
 				raise NameError('County-level GDP data not yet loaded into lib/data.py')
 
-		fte_employment			= cty_fte_employment.sum(level='region')
 		value_added_per_fte	= value_added['GDP'] * 1e6 / fte_employment['employment']
 
 		return fte_employment, value_added, value_added_per_fte
 
 
 	def _get_discounted_mort_value(self,discount_rate):
+		discounted_labor_lost, cohort_mortality_value = self._get_discounted_mort_values(np.array([discount_rate]))
+		return discounted_labor_lost[0], cohort_mortality_value[0]
 
-		#	Shift lost_participation_years by 1 year to take NPV assuming deaths occur at end of year
-		shifted_lost_participation = self.lost_participation_years.copy()
-		shifted_lost_participation.index = shifted_lost_participation.index + 1
-		shifted_lost_participation = shifted_lost_participation.reindex(range(self.config_data.max_age+1),fill_value=0)
 
-		#	Take the NPV of the time series of expected labor-force participation years lost given a death for each cohort
-		discounted_labor_lost = pd.DataFrame([(cohort[0],np.npv(discount_rate,cohort[1])) for cohort in shifted_lost_participation.iteritems()])
+	def _get_discounted_mort_values(self,discount_rates):
+	#	Returns lists of discounted_labor_lost and cohort_mortality_value DataFrames, one for each discount rate
 
-		#	Clean up DataFrame
-		discounted_labor_lost = discounted_labor_lost.set_index(0)
-		discounted_labor_lost.index.name = 'cohort'
+		#	NPV of the time series of expected labor-force participation years lost given a death, as a 
+		#	[discount_rate x cohort] array, computed once for all cohorts and discount rates in NationalData
+		npv = self.national_data.get_lost_participation_npv(discount_rates)
 
-		#	Take the outer product to get the discounted value by state and cohort
-		cohort_mortality_value = np.outer(self.value_per_fte, discounted_labor_lost)
+		#	Take the outer product to get the discounted value as a [discount_rate x region x cohort] array
+		mortality_value = self.value_per_fte.values[np.newaxis,:,np.newaxis] * npv[:,np.newaxis,:]
 
-		#	Convert back to DataFrame and clean up data
-		cohort_mortality_value = pd.DataFrame(cohort_mortality_value, index=self.value_per_fte.index, columns=discounted_labor_lost.index)
+		cohorts = pd.Index(self.lost_participation_years.columns, name='cohort')
+
+		#	Convert back to DataFrames, as ({1: NPV} by cohort) and (region by cohort)
+		discounted_labor_lost = [pd.DataFrame({1: npv[i]}, index=cohorts) for i in range(len(discount_rates))]
+		cohort_mortality_value = [pd.DataFrame(mortality_value[i], index=self.value_per_fte.index, columns=cohorts) for i in range(len(discount_rates))]
 
 		return discounted_labor_lost, cohort_mortality_value
 
@@ -158,12 +154,7 @@ class StaticData(object):
 	def echo_foreach(foreach,echoed):
 	#	return vector function with echoed for each element of numpy vector foreach
 
-		def return_echoed(each):
-		#	Dummy function to add echoed column for each element of foreach
-			return echoed
-
-		f = np.vectorize(return_echoed)
-		return f(foreach)
+		return np.full(np.shape(foreach),echoed)
 
 	def format_mortality_value(self,cohort_mortality_value):
 	#	Re-orient cohort_mortality_values values to allow combination with run data (which has cohort, region index and quantile columns)
@@ -194,7 +185,7 @@ class StaticData(object):
 		cty_valadd.reset_index('state',inplace=True)
 		del cty_valadd['state']
 
-		fte_employment			= cty_fte_employment.sum(level='region')
-		value_added					= pd.DataFrame((RegionDefinitions.aggregate_dataframe(cty_valadd,agglev=self.agglev).sum(level='region'))['value_added'],columns=['GDP'])
+		fte_employment			= RegionDefinitions.aggregate_sum(self.source_data.county_fte_employment,agglev=self.agglev)
+		value_added					= pd.DataFrame(RegionDefinitions.aggregate_sum(cty_valadd,agglev=self.agglev)['value_added'],columns=['GDP'])
 
 		return fte_employment, value_added
\ No newline at end of file
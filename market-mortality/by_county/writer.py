@@ -1,6 +1,6 @@
-import pandas as pd, numpy as np, StringIO
+import pandas as pd, numpy as np, gzip, multiprocessing.pool
 import rundata, static, lib.config
-import lib.pandas_tools as pandas_tools
+from regions.regdefs import RegionDefinitions
 
 DEFAULT_VALUE_WRITE_DIR = '../outputs/value/'
 DEFAULT_PERCAP_WRITE_DIR = '../outputs/percap/'
@@ -15,7 +15,7 @@ CSV_PERCAP_HEADER = '''"Heat-related change in mortality cost per capita using l
 '''
 
 OUTPUT_REGION_ORDERING = {
-		'states':			[lib.config.ConfigData.STATE_ABBREV_TO_ANSI[st] for st in ['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY']],
+		'state':			[lib.config.ConfigData.STATE_ABBREV_TO_ANSI[st] for st in ['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY']],
 		'midwest':		['IL_Chicago','IN_Indianapolis','IA_DesMoines','MI_Detroit','MN_Minneapolis','MO_KansasCity','MO_StLouis','OH_ClevelandToledo','OH_ColumbusCinDayton','WI_MilwaukeeMadison','other'],
 		'california':	['NorthCoast','Sierra','CentralValley','CentralCoast','SanJoaquinValley','InlandEmpire_Imperial','SouthCoast','other']
 }
@@ -27,6 +27,15 @@ class ImpactWriter(object):
 	valuedir			=	DEFAULT_VALUE_WRITE_DIR
 	percapdir			=	DEFAULT_PERCAP_WRITE_DIR
 
+	#	Rows formatted at a time by DataFrame.to_csv, bounding the buffer held for each file
+	chunksize			=	1000
+
+	#	Set compression to 'gzip' to write .csv.gz files. With more than one compress_workers, files are 
+	#	written and compressed in a pool of threads (zlib releases the GIL while compressing), started and 
+	#	closed within each call to output_results.
+	compression				=	None
+	compress_workers	=	4
+
 
 	@classmethod
 	def reassign_output_directories(cls,valuedir=None,percapdir=None):
@@ -36,49 +45,114 @@ class ImpactWriter(object):
 			cls.percapdir = percapdir
 
 	@classmethod
-	def output_results(cls,mortality_cost_by_cohort,rcp,tp,discount_rate,agglev,static_data=None):
-		#	initialize output formatting method cls.region_sorter()
-		# cls.set_region_sorter(agglev)
+	def output_results(cls,mortality_cost_by_cohort,rcp,tp,discount_rate,agglev,static_data=None,population=None):
+	#	Write the cost of each cohort, and the total over cohorts, from a single sort of mortality_cost_by_cohort.
+	#	Rows are ordered by cohort and output region order once, and each cohort is a contiguous block of that order.
+	#	Per capita costs use population (total population by region), or static_data.region_total_population if None.
 
-		if static_data is None:
-			static_data = static.StaticData()
+		if population is None:
+			if static_data is None:
+				static_data = static.StaticData()
+			population = static_data.region_total_population['total']
 
 		discname = 'undiscounted' if discount_rate == 0 else 'disc-{disc:2.0%}'.format(disc=discount_rate)
 
-		for cohort in cls.config_data.mort_cohort_names:
-			mortality_cost = mortality_cost_by_cohort.copy()
-			mortality_cost.index = mortality_cost.index.reorder_levels(['cohort','region'])
-			mortality_cost.sortlevel(inplace=True)
-			mortality_cost = mortality_cost.loc[cohort].copy()
-			cls.write_to_file(mortality_cost,cohort,rcp,tp,discname,static_data,agglev)
+		regions = mortality_cost_by_cohort.index.get_level_values('region')
+		cohort_codes = pd.Index(cls.config_data.mort_cohort_names).get_indexer(mortality_cost_by_cohort.index.get_level_values('cohort'))
+		values = mortality_cost_by_cohort.values
+
+		order = np.lexsort((cls.region_rank(regions,agglev),cohort_codes))
+		bounds = np.searchsorted(cohort_codes[order],np.arange(len(cls.config_data.mort_cohort_names)+1))
+
+		#	The pool is not kept between calls, so a process forked afterwards never inherits one without threads
+		pool = None
+		if cls.compression == 'gzip' and cls.compress_workers > 1:
+			pool = multiprocessing.pool.ThreadPool(cls.compress_workers)
+
+		try:
+			pending = []
+
+			for i, cohort in enumerate(cls.config_data.mort_cohort_names):
+				rows = order[bounds[i]:bounds[i+1]]
+				mortality_cost = pd.DataFrame(values[rows],index=pd.Index(regions[rows],name='region'),columns=mortality_cost_by_cohort.columns)
+				pending.extend(cls.write_to_file(mortality_cost,cohort,rcp,tp,discname,population,agglev,pool))
+
+			#	Total over cohorts, skipping missing values as in DataFrame.sum
+			codes, total_regions = pd.factorize(regions)
+			total_regions = pd.Index(total_regions,name='region')
+
+			mortality_cost = pd.DataFrame(RegionDefinitions.sum_by_codes(values,codes,len(total_regions)),index=total_regions,columns=mortality_cost_by_cohort.columns)
+			mortality_cost = mortality_cost.iloc[np.argsort(cls.region_rank(total_regions,agglev),kind='mergesort')]
+
+			pending.extend(cls.write_to_file(mortality_cost,'total',rcp,tp,discname,population,agglev,pool))
+
+			#	Wait for files being compressed in the pool, raising any error
+			for result in pending:
+				result.get()
+
+		finally:
+			if pool is not None:
+				pool.close()
+				pool.join()
 
-		mortality_cost = mortality_cost_by_cohort.copy()
-		mortality_cost = mortality_cost.sum(level=['region'])
-		cls.write_to_file(mortality_cost,'total',rcp,tp,discname,static_data,agglev)
-		
 
 	@classmethod
-	def write_to_file(cls,output_data,cohort,rcp,tp,discname,static_data,agglev):
-		
-		region_sorter	= pandas_tools.sort_pd(key=OUTPUT_REGION_ORDERING[agglev].index)
+	def region_rank(cls,regions,agglev):
+	#	Position of each region in the output ordering for agglev. Levels without an ordering (e.g. county) are sorted by region.
+
+		if agglev not in OUTPUT_REGION_ORDERING:
+			return pd.factorize(regions,sort=True)[0]
+
+		rank = pd.Index(OUTPUT_REGION_ORDERING[agglev]).get_indexer(regions)
+		if (rank < 0).any():
+			raise ValueError('Regions not in output ordering for {}: {}'.format(agglev,list(pd.unique(np.asarray(regions)[rank < 0]))))
+
+		return rank
+
+
+	@classmethod
+	def write_to_file(cls,output_data,cohort,rcp,tp,discname,population,agglev,pool=None):
+	#	Write absolute and per capita costs for output_data, which is already in output order, using population 
+	#	by region. Returns the pending results of any writes submitted to the compression pool.
 
 		#	Total regional costs
 
 		filename = 'mortality_value_{reg}-{c}-{r}-{y}-{d}.csv'.format(reg=agglev,c=cohort,r=rcp,y=tp,d=discname)
-		write_buffer = StringIO.StringIO()
-		(output_data.iloc[region_sorter(output_data.index.get_level_values('region'))]).to_csv(write_buffer)
-		
-		with open(cls.valuedir+filename,'w+') as csvfile:
-			csvfile.write(CSV_VALUE_HEADER + write_buffer.getvalue())
+		pending = cls._write_csv(cls.valuedir+filename,CSV_VALUE_HEADER,output_data,pool)
 
 		#	Per capita costs
 
-		output_data_percap = pd.concat([output_data[i]/static_data.region_total_population['total']*1e6 for i in output_data.columns],axis=1)
-		output_data_percap.columns = output_data.columns
+		population = population.reindex(output_data.index).values
+		output_data_percap = pd.DataFrame(output_data.values/population[:,np.newaxis]*1e6,index=output_data.index,columns=output_data.columns)
 
 		filename = 'mortality_value_{reg}-{c}-{r}-{y}-{d}-percap.csv'.format(reg=agglev,c=cohort,r=rcp,y=tp,d=discname)
-		write_buffer = StringIO.StringIO()
-		(output_data_percap.iloc[region_sorter(output_data_percap.index.get_level_values('region'))]).to_csv(write_buffer)
-		
-		with open(cls.percapdir+filename,'w+') as csvfile:
-			csvfile.write(CSV_PERCAP_HEADER + write_buffer.getvalue())
\ No newline at end of file
+		pending += cls._write_csv(cls.percapdir+filename,CSV_PERCAP_HEADER,output_data_percap,pool)
+
+		return pending
+
+
+	@classmethod
+	def _write_csv(cls,filepath,header,output_data,pool=None):
+	#	Stream the header and rows of output_data to filepath in chunks of cls.chunksize rows. Compressed 
+	#	files are written in pool, if given.
+
+		if cls.compression is None:
+			with open(filepath,'w+') as csvfile:
+				csvfile.write(header)
+				output_data.to_csv(csvfile,chunksize=cls.chunksize)
+			return []
+
+		if cls.compression != 'gzip':
+			raise ValueError('Unsupported compression: {}'.format(cls.compression))
+
+		if pool is not None:
+			return [pool.apply_async(_write_gzip,(filepath + '.gz',header,output_data,cls.chunksize))]
+
+		_write_gzip(filepath + '.gz',header,output_data,cls.chunksize)
+		return []
+
+
+def _write_gzip(filepath,header,output_data,chunksize):
+	with gzip.open(filepath,'wb') as csvfile:
+		csvfile.write(header)
+		output_data.to_csv(csvfile,chunksize=chunksize)
@@ -4,25 +4,33 @@ from regions.regdefs import RegionDefinitions
 
 
 class MortalityCostCalculator(object):
-	def __init__(self,readdir,deflator=None):
+	def __init__(self,readdir,deflator=None,static_data=None):
 
 		self.config_data		= lib.config.ConfigData
-		self.static_data		=	static.StaticData(deflator=deflator)
-		self.impact_reader	=	rundata.ImpactDirectoryReader()
-		self.readdir				=	os.path.normpath(os.path.expanduser(readdir))
 
-	def run_simulation(self):
-		cohort_mortality_value = {}
+		if static_data is None:
+			static_data = static.StaticData(deflator=deflator)
 
+		self.static_data		=	static_data
+		self.readdir				=	os.path.normpath(os.path.expanduser(readdir))
+		self.impact_reader	=	rundata.ImpactDirectoryReader(self.readdir)
+
+		self.cohort_mortality_value = {}
 		for discrate in self.config_data.discount_rates:
-			cohort_mortality_value[discrate] = self.format_mortality_value(discrate)
+			self.cohort_mortality_value[discrate] = self.format_mortality_value(discrate)
+
+	def run_simulation(self):
 
 		#	Loop through impact files in rundata.ImpactDirectoryReader.filepath and 
 		#	create a set of results for each RCP, time period, and cohort or total
 		for rcp, tp, run in self.impact_reader.get_impact_run():
-			for discrate in self.config_data.discount_rates:
-				mort_cost = self.calculate_mort_cost(discrate,run,cohort_mortality_value)
-				writer.ImpactWriter.output_results(mort_cost,rcp,tp,discrate,self.static_data)
+			self.write_run(rcp,tp,run)
+
+	def write_run(self,rcp,tp,run):
+	#	Calculate and write the results of one impact run, for every discount rate
+		for discrate in self.config_data.discount_rates:
+			mort_cost = self.calculate_mort_cost(discrate,run,self.cohort_mortality_value)
+			writer.ImpactWriter.output_results(mort_cost,rcp,tp,discrate,self.static_data)
 
 		#	save last used for testing:
 		self.mort_cost = mort_cost
@@ -56,12 +64,7 @@ class MortalityCostCalculator(object):
 	def echo_foreach(foreach,echoed):
 	#	return vector function with echoed for each element of numpy vector foreach
 
-		def return_echoed(each):
-		#	Dummy function to add echoed column for each element of foreach
-			return echoed
-
-		f = np.vectorize(return_echoed)
-		return f(foreach)
+		return np.full(np.shape(foreach),echoed)
 
 	def format_mortality_value(self,discrate):
 	#	Re-orient cohort_mortality_values values to allow combination with run data (which has cohort, state index and quantile columns)
@@ -49,18 +49,11 @@ class StaticData(object):
         self.deflate_config_data()
 
     def set_national_config_data(self):
-        
-        self.labor_participation = self.national_data._get_and_validate_labor_participation()
 
-        #    Retrieve, validate, and set mortality_share_by_cohort
-        mortality_share_by_cohort = self.national_data._get_mortality()
-        self.source_data.validate_mortality_share_by_cohort(mortality_share_by_cohort)
-        self.mortality_share_by_cohort = mortality_share_by_cohort
-        
-        #    Retrieve, validate, and set lost_participation_years
-        lost_participation_years = self.national_data.get_lost_participation_years(self.labor_participation,self.mortality_share_by_cohort)
-        self.source_data.validate_lost_labor_participation(lost_participation_years)
-        self.lost_participation_years = lost_participation_years
+        #    National tables are computed and validated once, and shared by all StaticData instances
+        self.labor_participation = self.national_data.labor_participation
+        self.mortality_share_by_cohort = self.national_data.mortality_share_by_cohort
+        self.lost_participation_years = self.national_data.lost_participation_years
 
     def set_state_config_data(self):
 
@@ -1,4 +1,5 @@
-import by_state.calc, by_county.calc
+import sys, time, traceback, multiprocessing
+import by_state.calc, by_county.calc, lib.config
 
 class StateRun(object):
 
@@ -10,6 +11,90 @@ class StateRun(object):
 class CountyRun(object):
 
 	@staticmethod
-	def run_scenario(readdir, agglev='state', deflator=None, test_data=False):
-		county_run = by_county.calc.MortalityCostCalculator(readdir=readdir,agglev=agglev,deflator=deflator,test_data=test_data)
-		county_run.run_simulation()
\ No newline at end of file
+	def run_scenario(readdir, agglev='state', deflator=None, test_data=False, output_agglevs=None):
+		county_run = by_county.calc.MortalityCostCalculator(readdir=readdir,agglev=agglev,deflator=deflator,test_data=test_data,output_agglevs=output_agglevs)
+		county_run.run_simulation()
+
+
+#	Calculators of the current ParallelRun, by run name. Set before the worker pool is started, so that
+#	forked workers inherit the static data of every run (copy-on-write) instead of rebuilding it.
+_calculators = {}
+
+def _run_job(job):
+#	Read, calculate and write one (run, rcp, tp) job in a worker. Returns (job, seconds, error traceback or None).
+	start = time.time()
+	try:
+		name, rcp, tp = job
+		calculator = _calculators[name]
+		calculator.write_run(rcp,tp,calculator.impact_reader.get_run(rcp,tp))
+		return job, time.time() - start, None
+
+	except Exception:
+		return job, time.time() - start, traceback.format_exc()
+
+
+class ParallelRun(object):
+#	Runs the state run and county runs at several aggregation levels, with every rcp and time period as a separate
+#	job in a pool of worker processes. The static data of each run is built once, here, and shared read-only with
+#	the forked workers. Each job writes the files of all discount rates for its rcp and time period, so no two jobs
+#	write the same file, and the results do not depend on the order in which jobs finish.
+
+	config_data = lib.config.ConfigData
+
+	@classmethod
+	def run_scenarios(cls, readdir, agglevs=('state',), state_run=False, deflator=None, test_data=False, processes=None, verbose=True, output_agglevs=None):
+	#	Returns the list of (run, rcp, tp) jobs that failed, in job order. Use processes=1 to run jobs in this process.
+	#	output_agglevs, if given, maps each of agglevs to the levels written from its impact data (see CountyRun).
+	#	Each output level may be written by only one run, as jobs of two runs would write the same files at once.
+
+		writers = {}
+		for agglev in agglevs:
+			levels = (output_agglevs or {}).get(agglev)
+			for level in set([agglev] if levels is None else levels):
+				writers.setdefault(level, []).append(agglev)
+
+		shared = dict((level, runs) for level, runs in writers.items() if len(runs) > 1)
+		if len(shared) > 0:
+			raise ValueError('Output levels written by more than one run: {}'.format(', '.join('{} (by {})'.format(level, ', '.join(runs)) for level, runs in sorted(shared.items()))))
+
+		_calculators.clear()
+
+		if state_run:
+			_calculators['by_state'] = by_state.calc.MortalityCostCalculator(readdir=readdir,deflator=deflator)
+		for agglev in agglevs:
+			_calculators[agglev] = by_county.calc.MortalityCostCalculator(readdir=readdir,agglev=agglev,deflator=deflator,test_data=test_data,output_agglevs=(output_agglevs or {}).get(agglev))
+
+		names = (['by_state'] if state_run else []) + list(agglevs)
+		jobs = [(name, rcp, tp) for name in names for rcp in cls.config_data.rcps for tp in cls.config_data.tps]
+
+		#	Check for missing impact files before starting any job
+		for name in names:
+			for rcp in cls.config_data.rcps:
+				for tp in cls.config_data.tps:
+					_calculators[name].impact_reader.validate_impact_files(rcp,tp)
+
+		failed = []
+		start = time.time()
+
+		def report(count, job, seconds, error):
+			if error is not None:
+				failed.append(job)
+			if verbose:
+				status = 'done in {:.1f}s'.format(seconds) if error is None else 'failed:\n{}'.format(error)
+				sys.stdout.write('[{}/{}] {} {} {} {} ({:.0f}s elapsed)\n'.format(count, len(jobs), job[0], job[1], job[2], status, time.time() - start))
+				sys.stdout.flush()
+
+		if processes == 1:
+			for count, job in enumerate(jobs):
+				report(count + 1, *_run_job(job))
+
+		else:
+			pool = multiprocessing.Pool(processes)
+			try:
+				for count, (job, seconds, error) in enumerate(pool.imap_unordered(_run_job, jobs)):
+					report(count + 1, job, seconds, error)
+			finally:
+				pool.close()
+				pool.join()
+
+		return sorted(failed, key=jobs.index)
@@ -1,2 +1,2 @@
 ""
-import config, data, national
\ No newline at end of file
+import config, data, national, impactfiles, scenario, rundata
\ No newline at end of file
@@ -1,6 +1,19 @@
 import numpy as np, pandas as pd, os
 import config
-from RHG_python_modules.regions.regdefs import RegionDefinitions
+from regions import tablecache
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE_TABLE_SOURCES = [
+	os.path.join(ROOT_DIR,'lib','sourcetables.py'),
+	os.path.join(ROOT_DIR,'data','2012_county_cohort_pop.pkl'),
+	os.path.join(ROOT_DIR,'data','2012_county_total_pop.pkl')]
+
+SOURCE_TABLE_ARTIFACT = os.path.join(ROOT_DIR,'data','sourcetables.pkl')
+
+def _build_source_tables():
+	import sourcetables
+	return tablecache.module_tables(sourcetables)
 
 
 class SourceData(object):
@@ -13,286 +26,26 @@ class SourceData(object):
 	#	instances, additional checks have been provided to ensure accuracy.
 
 
-	#########################################
-	#      Data directly from sources       #
-	#########################################
-
-	#	US BASE LABOR FORCE PARTICIPATION RATES	
-	LABOR_PARTICIPATION_DATA = {
-			(None,16):	np.float64(		  0.0	),
-			(16,20):		np.float64(		0.343	),
-			(20,25):		np.float64(		0.709	),
-			(25,35):		np.float64(		0.817	),
-			(35,45):		np.float64(		0.826	),
-			(45,55):		np.float64(		0.802	),
-			(55,60):		np.float64(		0.725	),
-			(60,62):		np.float64(		0.638	),
-			(62,65):		np.float64(		0.491	),
-			(65,70):		np.float64(		0.321	),	#	Rather than using (75,None): 7.6 we use (75,80): 11.4, (80,): 0 because the mortality 
-			(70,75):		np.float64(		0.195	),	# data quality does not allow for complete tracking of older populations, resulting in a
-			(75,80):		np.float64(		0.114	),	#	potential for overvaluation of lost 80+ year old labor. However, this does represent
-			(80,None):	np.float64(		  0.0	)}	#	a minor underestimate of the impact, as we assume here that no one over 80 is employed.
-
-	US_MORTALITY_DATA = {
-			(None,1):		np.float64(	 332697	),
-			(1,5):			np.float64(	  57529	),
-			(5,10):			np.float64(	  34262	),
-			(10,15):		np.float64(	  44258	),
-			(15,20):		np.float64(	 157564	),
-			(20,25):		np.float64(	 231954	),
-			(25,35):		np.float64(	 501208	),
-			(35,45):		np.float64(	1005193	),
-			(45,55):		np.float64(	2118807	),
-			(55,65):		np.float64(	3258625	),
-			(65,75):		np.float64(	4948370	),
-			(75,85):		np.float64(	8109495	),
-			(85,None):	np.float64(	8372695	)}
-
-	#	2012 population by state and cohort, consistent with "ACP Data Tables" base values
-	#	Calculated in rhgdevelopers/us_population/StateAgeData/ACP_statePop_sex_age_2010to2013.xlsx
-	# Original data:
-	#		State populations by sex and single year of age
-	#		accessed 08/07/2014 by Michael Delgado, mdelgado@rhg.com
-	#		https://www.census.gov/popest/data/state/asrh/2013/files/SC-EST2013-AGESEX-CIV.csv
-	#		saved in: rhgdevelopers/us_population/StateAgeData/statePop_sex_age_2010to2013.csv
-
-	cohort_population = pd.DataFrame({
-				'state_abbrev':	['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY'],
-				'state':				[1,2,4,5,6,8,9,11,10,12,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,49,50,51,53,54,55,56],
-				'0-0':					[58870,11296,85082,38748,497470,65375,37314,8960,11252,215612,132479,18476,21885,158925,83218,38521,39577,54859,61187,12791,73027,72941,113063,68673,39538,75049,12150,25793,34780,12869,105960,27168,238871,120183,9863,136678,52198,45146,142518,10947,57596,11928,79649,380493,50068,6090,102729,87990,20521,67792,7448],
-				'1-44':					[2755365,438494,3871347,1701460,23218726,3111837,1981582,406098,511119,10321961,6048519,754873,962273,7602041,3828674,1748230,1691666,2495909,2724913,676187,3391742,3755107,5546352,3115384,1760522,3429461,545193,1090391,1638294,703602,5033484,1204848,11293887,5609265,403166,6498530,2240450,2218261,6981602,582573,2664722,477507,3700784,16462494,1961338,329371,4711213,4007380,987340,3231998,333382],
-				'45-64':				[1288550,196743,1603027,760525,9529392,1363378,1033202,143527,250230,5204910,2530714,362115,395163,3384112,1733660,816711,736337,1189918,1200390,411999,1629665,1853535,2776406,1463253,765373,1618643,286078,475218,708391,409379,2468811,543592,5257585,2564892,179963,3203420,966606,1052348,3590846,294525,1262319,218562,1731789,6240536,566583,191449,2198357,1844025,535491,1597685,157173],
-				'65-inf':				[699260,62524,971518,442572,4599968,613210,532281,71786,140503,3510753,1138956,210733,212587,1694505,889109,470101,394317,614469,595073,226342,762916,957933,1442583,729835,404019,883058,158264,257416,360899,194388,1250263,294841,2757053,1347638,100696,1704906,534182,581518,2042916,158379,695352,122193,918414,2841582,271330,98430,1062238,908437,311913,824088,75497]
-						}).set_index(['state_abbrev','state'])
-
-	#	2012 Gross Domestic Product by State (2012 $US Million)
-	#	Calculated in acp/directCosts/publication/base values/BEA GDP calculations.xlsx
-	#	Original data:
-	#		Gross Domestic Product by State, 2008-2013 (millions of current dollars)
-	#		Accessed 08/07/2014, by Michael Delgado, mdelgado@rhg.com
-	#		http://www.bea.gov/iTable/iTable.cfm?reqid=70&step=1&isuri=1&acrdn=1#reqid=70&step=10&isuri=1&7003=200&7035=-1&7004=naics&7005=-1&7006=00000,01000,02000,04000,05000,06000,08000,09000,10000,11000,12000,13000,15000,16000,17000,18000,19000,20000,21000,22000,23000,24000,25000,26000,27000,28000,29000,30000,31000,32000,33000,34000,35000,36000,37000,38000,39000,40000,41000,42000,44000,45000,46000,47000,48000,49000,50000,51000,53000,54000,55000,56000,91000,92000,93000,94000,95000,96000,97000,98000&7010=0&7036=-1&7001=1200&7002=1&7090=70&7007=2013,2012,2011,2010,2009,2008&7093=levels
-
-	state_value_added = pd.DataFrame({
-				'state_abbrev':	['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY'],
-				'GDP':					[189542,59643,271503,118993,2125717,278551,242930,111870,60650,769007,438324,72512,58231,704138,306838,156606,138958,177967,251369,53235,336481,431937,416769,298272,101549,269356,42140,103062,128896,66111,528788,89188,1280737,452358,49509,548526,171432,210242,629851,51566,177985,43758,280485,1463021,134483,28422,445090,390918,69711,272086,41839]
-						}).set_index('state_abbrev')
-
-	#	2012 full-time-equivalent (FTE) employment by state (person-years)
-	#	Calculated in 
-	#	Original Data:
-	#		May 2012 State Employment
-	#		OES Data, BLS
-	#		http://www.bls.gov/oes/special.requests/oesm12st.zip
-	#		Accessed 08/09/2014 by Michael Delgado, mdelgado@rhg.com
-	#		Original data located in acp/mortality/mort_worksheet_byState.xlsx
-	#		Re-downloaded 09/18/2014 by Michael Delgado, mdelgado@rhg.com
-	#		Full download located in acp/directCosts/publication/base values/Employment Data/oesm12st.zip
-	#		Data checked against ACP tables in acp/directCosts/publication/base values/Employment Data/acp_employment_base.xlsx
-
-	state_fte_employment = pd.DataFrame({
-				'state_abbrev':	['AL','AK','AZ','AR','CA','CO','CT','DE','DC','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY'],
-				'employment':		[1824400,318700,2414340,1155020,14303630,2226160,1620620,405750,653760,7273850,3815530,588210,598540,5640740,2811920,1470740,1320920,1764750,1868210,581110,2510680,3202080,3918120,2641110,1080420,2605910,432380,914830,1127160,612710,3793720,773860,8542280,3878800,403290,5054250,1529900,1609900,5596480,453020,1796550,398680,2657280,10579400,1200850,294090,3597100,2764080,710540,2673280,278040]
-						}).set_index('state_abbrev')
-
-	#	For county-level data, we could potentially distribute this using BLS QCEW County-level total employment data. This counts the total number
-	#	of jobs, including multiple counts for people with multiple jobs and whole counts for part-time work. This is not an FTE estimate. However,
-	#	it could potentially be used as a distributor by county.
-	
-	#	http://www.bls.gov/cew/datatoc.htm
-
-
-
-	statePop = pd.DataFrame([
-			('AL',	1,	4802045),
-			('AK',	2,	709057),
-			('AZ',	4,	6530974),
-			('AR',	5,	2943305),
-			('CA',	6,	37845556),
-			('CO',	8,	5153800),
-			('CT',	9,	3584379),
-			('DC',	11,	630371),
-			('DE',	10,	913104),
-			('FL',	12,	19253236),
-			('GA',	13,	9850668),
-			('HI',	15,	1346197),
-			('ID',	16,	1591908),
-			('IL',	17,	12839583),
-			('IN',	18,	6534661),
-			('IA',	19,	3073563),
-			('KS',	20,	2861897),
-			('KY',	21,	4355155),
-			('LA',	22,	4581563),
-			('ME',	23,	1327319),
-			('MD',	24,	5857350),
-			('MA',	25,	6639516),
-			('MI',	26,	9878404),
-			('MN',	27,	5377145),
-			('MS',	28,	2969452),
-			('MO',	29,	6006211),
-			('MT',	30,	1001685),
-			('NE',	31,	1848818),
-			('NV',	32,	2742364),
-			('NH',	33,	1320238),
-			('NJ',	34,	8858518),
-			('NM',	35,	2070449),
-			('NY',	36,	19547396),
-			('NC',	37,	9641978),
-			('ND',	38,	693688),
-			('OH',	39,	11543534),
-			('OK',	40,	3793436),
-			('OR',	41,	3897273),
-			('PA',	42,	12757882),
-			('RI',	44,	1046424),
-			('SC',	45,	4679989),
-			('SD',	46,	830190),
-			('TN',	47,	6430636),
-			('TX',	48,	25925105),
-			('UT',	49,	2849319),
-			('VT',	50,	625340),
-			('VA',	51,	8074537),
-			('WA',	53,	6847832),
-			('WV',	54,	1855265),
-			('WI',	55,	5721563),
-			('WY',	56,	573500)],columns=['state_abbrev','state','population']).set_index(['state_abbrev','state'])
-
-
-	#########################################
-	# Data prepared outside this repository #
-	#########################################
-
-	county_cohort_population = pd.io.pickle.read_pickle(os.path.normpath(os.path.join(os.path.dirname(os.path.dirname(__file__)),'data/2012_county_cohort_pop.pkl')))
-	county_total_population = pd.io.pickle.read_pickle(os.path.normpath(os.path.join(os.path.dirname(os.path.dirname(__file__)),'data/2012_county_total_pop.pkl')))
-
-
-
-	# 2012 full-time-equivalent (FTE) employment by county (person-years)	
-	# State totals equal BLS data given in fte_2012_state.csv	
-	# County FTEs are equal to the share of state jobs times state FTEs.	
-	# State job data taken from BLS Quarterly Survey of Employment and Wages, 2012 Annual Average	
-	# Retrieved from data viewer:	
-	# 	http://www.bls.gov/cew/apps/data_views/data_views.htm
-	# 	Downloaded 30 October 2014 by Michael Delgado
-	# 	Data used is Total Covered, Total Employer, All Industries, All Establishment Sizes, 2012 Annual Averages - Source data
-
-	# Download file:	
-	# 	BLS_2012_annualavg_allIndustries_jobs_county.csv
-
-	county_fte_employment = pd.DataFrame({
-		'county':			[1001,1003,1005,1007,1009,1011,1013,1015,1017,1019,1021,1023,1025,1027,1029,1031,1033,1035,1037,1039,1041,1043,1045,1047,1049,1051,1053,1055,1057,1059,1061,1063,1065,1067,1069,1071,1073,1075,1077,1079,1081,1083,1085,1087,1089,1091,1093,1095,1097,1099,1101,1103,1105,1107,1109,1111,1113,1115,1117,1119,1121,1123,1125,1127,1129,1131,1133,2013,2016,2020,2050,2060,2068,2070,2090,2100,2105,2110,2122,2130,2150,2164,2170,2180,2185,2188,2195,2198,2220,2230,2240,2261,2270,2275,2282,2290,4001,4003,4005,4007,4009,4011,4012,4013,4015,4017,4019,4021,4023,4025,4027,5001,5003,5005,5007,5009,5011,5013,5015,5017,5019,5021,5023,5025,5027,5029,5031,5033,5035,5037,5039,5041,5043,5045,5047,5049,5051,5053,5055,5057,5059,5061,5063,5065,5067,5069,5071,5073,5075,5077,5079,5081,5083,5085,5087,5089,5091,5093,5095,5097,5099,5101,5103,5105,5107,5109,5111,5113,5115,5117,5119,5121,5123,5125,5127,5129,5131,5133,5135,5137,5139,5141,5143,5145,5147,5149,6001,6003,6005,6007,6009,6011,6013,6015,6017,6019,6021,6023,6025,6027,6029,6031,6033,6035,6037,6039,6041,6043,6045,6047,6049,6051,6053,6055,6057,6059,6061,6063,6065,6067,6069,6071,6073,6075,6077,6079,6081,6083,6085,6087,6089,6091,6093,6095,6097,6099,6101,6103,6105,6107,6109,6111,6113,6115,8001,8003,8005,8007,8009,8011,8013,8014,8015,8017,8019,8021,8023,8025,8027,8029,8031,8033,8035,8037,8039,8041,8043,8045,8047,8049,8051,8053,8055,8057,8059,8061,8063,8065,8067,8069,8071,8073,8075,8077,8079,8081,8083,8085,8087,8089,8091,8093,8095,8097,8099,8101,8103,8105,8107,8109,8111,8113,8115,8117,8119,8121,8123,8125,9001,9003,9005,9007,9009,9011,9013,9015,10001,10003,10005,11001,12001,12003,12005,12007,12009,12011,12013,12015,12017,12019,12021,12023,12027,12029,12031,12033,12035,12037,12039,12041,12043,12045,12047,12049,12051,12053,12055,12057,12059,12061,12063,12065,12067,12069,12071,12073,12075,12077,12079,12081,12083,12085,12086,12087,12089,12091,12093,12095,12097,12099,12101,12103,12105,12107,12109,12111,12113,12115,12117,12119,12121,12123,12125,12127,12129,12131,12133,13001,13003,13005,13007,13009,13011,13013,13015,13017,13019,13021,13023,13025,13027,13029,13031,13033,13035,13037,13039,13043,13045,13047,13049,13051,13053,13055,13057,13059,13061,13063,13065,13067,13069,13071,13073,13075,13077,13079,13081,13083,13085,13087,13089,13091,13093,13095,13097,13099,13101,13103,13105,13107,13109,13111,13113,13115,13117,13119,13121,13123,13125,13127,13129,13131,13133,13135,13137,13139,13141,13143,13145,13147,13149,13151,13153,13155,13157,13159,13161,13163,13165,13167,13169,13171,13173,13175,13177,13179,13181,13183,13185,13187,13189,13191,13193,13195,13197,13199,13201,13205,13207,13209,13211,13213,13215,13217,13219,13221,13223,13225,13227,13229,13231,13233,13235,13237,13239,13241,13243,13245,13247,13249,13251,13253,13255,13257,13259,13261,13263,13265,13267,13269,13271,13273,13275,13277,13279,13281,13283,13285,13287,13289,13291,13293,13295,13297,13299,13301,13303,13305,13307,13309,13311,13313,13315,13317,13319,13321,15001,15003,15005,15007,15009,16001,16003,16005,16007,16009,16011,16013,16015,16017,16019,16021,16023,16025,16027,16029,16031,16033,16035,16037,16039,16041,16043,16045,16047,16049,16051,16053,16055,16057,16059,16061,16063,16065,16067,16069,16071,16073,16075,16077,16079,16081,16083,16085,16087,17001,17003,17005,17007,17009,17011,17013,17015,17017,17019,17021,17023,17025,17027,17029,17031,17033,17035,17037,17039,17041,17043,17045,17047,17049,17051,17053,17055,17057,17059,17061,17063,17065,17067,17069,17071,17073,17075,17077,17079,17081,17083,17085,17087,17089,17091,17093,17095,17097,17099,17101,17103,17105,17107,17109,17111,17113,17115,17117,17119,17121,17123,17125,17127,17129,17131,17133,17135,17137,17139,17141,17143,17145,17147,17149,17151,17153,17155,17157,17159,17161,17163,17165,17167,17169,17171,17173,17175,17177,17179,17181,17183,17185,17187,17189,17191,17193,17195,17197,17199,17201,17203,18001,18003,18005,18007,18009,18011,18013,18015,18017,18019,18021,18023,18025,18027,18029,18031,18033,18035,18037,18039,18041,18043,18045,18047,18049,18051,18053,18055,18057,18059,18061,18063,18065,18067,18069,18071,18073,18075,18077,18079,18081,18083,18085,18087,18089,18091,18093,18095,18097,18099,18101,18103,18105,18107,18109,18111,18113,18115,18117,18119,18121,18123,18125,18127,18129,18131,18133,18135,18137,18139,18141,18143,18145,18147,18149,18151,18153,18155,18157,18159,18161,18163,18165,18167,18169,18171,18173,18175,18177,18179,18181,18183,19001,19003,19005,19007,19009,19011,19013,19015,19017,19019,19021,19023,19025,19027,19029,19031,19033,19035,19037,19039,19041,19043,19045,19047,19049,19051,19053,19055,19057,19059,19061,19063,19065,19067,19069,19071,19073,19075,19077,19079,19081,19083,19085,19087,19089,19091,19093,19095,19097,19099,19101,19103,19105,19107,19109,19111,19113,19115,19117,19119,19121,19123,19125,19127,19129,19131,19133,19135,19137,19139,19141,19143,19145,19147,19149,19151,19153,19155,19157,19159,19161,19163,19165,19167,19169,19171,19173,19175,19177,19179,19181,19183,19185,19187,19189,19191,19193,19195,19197,20001,20003,20005,20007,20009,20011,20013,20015,20017,20019,20021,20023,20025,20027,20029,20031,20033,20035,20037,20039,20041,20043,20045,20047,20049,20051,20053,20055,20057,20059,20061,20063,20065,20067,20069,20071,20073,20075,20077,20079,20081,20083,20085,20087,20089,20091,20093,20095,20097,20099,20101,20103,20105,20107,20109,20111,20113,20115,20117,20119,20121,20123,20125,20127,20129,20131,20133,20135,20137,20139,20141,20143,20145,20147,20149,20151,20153,20155,20157,20159,20161,20163,20165,20167,20169,20171,20173,20175,20177,20179,20181,20183,20185,20187,20189,20191,20193,20195,20197,20199,20201,20203,20205,20207,20209,21001,21003,21005,21007,21009,21011,21013,21015,21017,21019,21021,21023,21025,21027,21029,21031,21033,21035,21037,21039,21041,21043,21045,21047,21049,21051,21053,21055,21057,21059,21061,21063,21065,21067,21069,21071,21073,21075,21077,21079,21081,21083,21085,21087,21089,21091,21093,21095,21097,21099,21101,21103,21105,21107,21109,21111,21113,21115,21117,21119,21121,21123,21125,21127,21129,21131,21133,21135,21137,21139,21141,21143,21145,21147,21149,21151,21153,21155,21157,21159,21161,21163,21165,21167,21169,21171,21173,21175,21177,21179,21181,21183,21185,21187,21189,21191,21193,21195,21197,21199,21201,21203,21205,21207,21209,21211,21213,21215,21217,21219,21221,21223,21225,21227,21229,21231,21233,21235,21237,21239,22001,22003,22005,22007,22009,22011,22013,22015,22017,22019,22021,22023,22025,22027,22029,22031,22033,22035,22037,22039,22041,22043,22045,22047,22049,22051,22053,22055,22057,22059,22061,22063,22065,22067,22069,22071,22073,22075,22077,22079,22081,22083,22085,22087,22089,22091,22093,22095,22097,22099,22101,22103,22105,22107,22109,22111,22113,22115,22117,22119,22121,22123,22125,22127,23001,23003,23005,23007,23009,23011,23013,23015,23017,23019,23021,23023,23025,23027,23029,23031,24001,24003,24005,24009,24011,24013,24015,24017,24019,24021,24023,24025,24027,24029,24031,24033,24035,24037,24039,24041,24043,24045,24047,24510,25001,25003,25005,25007,25009,25011,25013,25015,25017,25019,25021,25023,25025,25027,26001,26003,26005,26007,26009,26011,26013,26015,26017,26019,26021,26023,26025,26027,26029,26031,26033,26035,26037,26039,26041,26043,26045,26047,26049,26051,26053,26055,26057,26059,26061,26063,26065,26067,26069,26071,26073,26075,26077,26079,26081,26083,26085,26087,26089,26091,26093,26095,26097,26099,26101,26103,26105,26107,26109,26111,26113,26115,26117,26119,26121,26123,26125,26127,26129,26131,26133,26135,26137,26139,26141,26143,26145,26147,26149,26151,26153,26155,26157,26159,26161,26163,26165,27001,27003,27005,27007,27009,27011,27013,27015,27017,27019,27021,27023,27025,27027,27029,27031,27033,27035,27037,27039,27041,27043,27045,27047,27049,27051,27053,27055,27057,27059,27061,27063,27065,27067,27069,27071,27073,27075,27077,27079,27081,27083,27085,27087,27089,27091,27093,27095,27097,27099,27101,27103,27105,27107,27109,27111,27113,27115,27117,27119,27121,27123,27125,27127,27129,27131,27133,27135,27137,27139,27141,27143,27145,27147,27149,27151,27153,27155,27157,27159,27161,27163,27165,27167,27169,27171,27173,28001,28003,28005,28007,28009,28011,28013,28015,28017,28019,28021,28023,28025,28027,28029,28031,28033,28035,28037,28039,28041,28043,28045,28047,28049,28051,28053,28055,28057,28059,28061,28063,28065,28067,28069,28071,28073,28075,28077,28079,28081,28083,28085,28087,28089,28091,28093,28095,28097,28099,28101,28103,28105,28107,28109,28111,28113,28115,28117,28119,28121,28123,28125,28127,28129,28131,28133,28135,28137,28139,28141,28143,28145,28147,28149,28151,28153,28155,28157,28159,28161,28163,29001,29003,29005,29007,29009,29011,29013,29015,29017,29019,29021,29023,29025,29027,29029,29031,29033,29035,29037,29039,29041,29043,29045,29047,29049,29051,29053,29055,29057,29059,29061,29063,29065,29067,29069,29071,29073,29075,29077,29079,29081,29083,29085,29087,29089,29091,29093,29095,29097,29099,29101,29103,29105,29107,29109,29111,29113,29115,29117,29119,29121,29123,29125,29127,29129,29131,29133,29135,29137,29139,29141,29143,29145,29147,29149,29151,29153,29155,29157,29159,29161,29163,29165,29167,29169,29171,29173,29175,29177,
-									29179,29181,29183,29185,29186,29187,29189,29195,29197,29199,29201,29203,29205,29207,29209,29211,29213,29215,29217,29219,29221,29223,29225,29227,29229,29510,30001,30003,30005,30007,30009,30011,30013,30015,30017,30019,30021,30023,30025,30027,30029,30031,30033,30035,30037,30039,30041,30043,30045,30047,30049,30051,30053,30055,30057,30059,30061,30063,30065,30067,30069,30071,30073,30075,30077,30079,30081,30083,30085,30087,30089,30091,30093,30095,30097,30099,30101,30103,30105,30107,30109,30111,31001,31003,31005,31007,31009,31011,31013,31015,31017,31019,31021,31023,31025,31027,31029,31031,31033,31035,31037,31039,31041,31043,31045,31047,31049,31051,31053,31055,31057,31059,31061,31063,31065,31067,31069,31071,31073,31075,31077,31079,31081,31083,31085,31087,31089,31091,31093,31095,31097,31099,31101,31103,31105,31107,31109,31111,31113,31115,31117,31119,31121,31123,31125,31127,31129,31131,31133,31135,31137,31139,31141,31143,31145,31147,31149,31151,31153,31155,31157,31159,31161,31163,31165,31167,31169,31171,31173,31175,31177,31179,31181,31183,31185,32001,32003,32005,32007,32009,32011,32013,32015,32017,32019,32021,32023,32027,32029,32031,32033,32510,33001,33003,33005,33007,33009,33011,33013,33015,33017,33019,34001,34003,34005,34007,34009,34011,34013,34015,34017,34019,34021,34023,34025,34027,34029,34031,34033,34035,34037,34039,34041,35001,35003,35005,35006,35007,35009,35011,35013,35015,35017,35019,35021,35023,35025,35027,35028,35029,35031,35033,35035,35037,35039,35041,35043,35045,35047,35049,35051,35053,35055,35057,35059,35061,36001,36003,36005,36007,36009,36011,36013,36015,36017,36019,36021,36023,36025,36027,36029,36031,36033,36035,36037,36039,36041,36043,36045,36047,36049,36051,36053,36055,36057,36059,36061,36063,36065,36067,36069,36071,36073,36075,36077,36079,36081,36083,36085,36087,36089,36091,36093,36095,36097,36099,36101,36103,36105,36107,36109,36111,36113,36115,36117,36119,36121,36123,37001,37003,37005,37007,37009,37011,37013,37015,37017,37019,37021,37023,37025,37027,37029,37031,37033,37035,37037,37039,37041,37043,37045,37047,37049,37051,37053,37055,37057,37059,37061,37063,37065,37067,37069,37071,37073,37075,37077,37079,37081,37083,37085,37087,37089,37091,37093,37095,37097,37099,37101,37103,37105,37107,37109,37111,37113,37115,37117,37119,37121,37123,37125,37127,37129,37131,37133,37135,37137,37139,37141,37143,37145,37147,37149,37151,37153,37155,37157,37159,37161,37163,37165,37167,37169,37171,37173,37175,37177,37179,37181,37183,37185,37187,37189,37191,37193,37195,37197,37199,38001,38003,38005,38007,38009,38011,38013,38015,38017,38019,38021,38023,38025,38027,38029,38031,38033,38035,38037,38039,38041,38043,38045,38047,38049,38051,38053,38055,38057,38059,38061,38063,38065,38067,38069,38071,38073,38075,38077,38079,38081,38083,38085,38087,38089,38091,38093,38095,38097,38099,38101,38103,38105,39001,39003,39005,39007,39009,39011,39013,39015,39017,39019,39021,39023,39025,39027,39029,39031,39033,39035,39037,39039,39041,39043,39045,39047,39049,39051,39053,39055,39057,39059,39061,39063,39065,39067,39069,39071,39073,39075,39077,39079,39081,39083,39085,39087,39089,39091,39093,39095,39097,39099,39101,39103,39105,39107,39109,39111,39113,39115,39117,39119,39121,39123,39125,39127,39129,39131,39133,39135,39137,39139,39141,39143,39145,39147,39149,39151,39153,39155,39157,39159,39161,39163,39165,39167,39169,39171,39173,39175,40001,40003,40005,40007,40009,40011,40013,40015,40017,40019,40021,40023,40025,40027,40029,40031,40033,40035,40037,40039,40041,40043,40045,40047,40049,40051,40053,40055,40057,40059,40061,40063,40065,40067,40069,40071,40073,40075,40077,40079,40081,40083,40085,40087,40089,40091,40093,40095,40097,40099,40101,40103,40105,40107,40109,40111,40113,40115,40117,40119,40121,40123,40125,40127,40129,40131,40133,40135,40137,40139,40141,40143,40145,40147,40149,40151,40153,41001,41003,41005,41007,41009,41011,41013,41015,41017,41019,41021,41023,41025,41027,41029,41031,41033,41035,41037,41039,41041,41043,41045,41047,41049,41051,41053,41055,41057,41059,41061,41063,41065,41067,41069,41071,42001,42003,42005,42007,42009,42011,42013,42015,42017,42019,42021,42023,42025,42027,42029,42031,42033,42035,42037,42039,42041,42043,42045,42047,42049,42051,42053,42055,42057,42059,42061,42063,42065,42067,42069,42071,42073,42075,42077,42079,42081,42083,42085,42087,42089,42091,42093,42095,42097,42099,42101,42103,42105,42107,42109,42111,42113,42115,42117,42119,42121,42123,42125,42127,42129,42131,42133,44001,44003,44005,44007,44009,45001,45003,45005,45007,45009,45011,45013,45015,45017,45019,45021,45023,45025,45027,45029,45031,45033,45035,45037,45039,45041,45043,45045,45047,45049,45051,45053,45055,45057,45059,45061,45063,45065,45067,45069,45071,45073,45075,45077,45079,45081,45083,45085,45087,45089,45091,46003,46005,46007,46009,46011,46013,46015,46017,46019,46021,46023,46025,46027,46029,46031,46033,46035,46037,46039,46041,46043,46045,46047,46049,46051,46053,46055,46057,46059,46061,46063,46065,46067,46069,46071,46073,46075,46077,46079,46081,46083,46085,46087,46089,46091,46093,46095,46097,46099,46101,46103,46105,46107,46109,46111,46113,46115,46117,46119,46121,46123,46125,46127,46129,46135,46137,47001,47003,47005,47007,47009,47011,47013,47015,47017,47019,47021,47023,47025,47027,47029,47031,47033,47035,47037,47039,47041,47043,47045,47047,47049,47051,47053,47055,47057,47059,47061,47063,47065,47067,47069,47071,47073,47075,47077,47079,47081,47083,47085,47087,47089,47091,47093,47095,47097,47099,47101,47103,47105,47107,47109,47111,47113,47115,47117,47119,47121,47123,47125,47127,47129,47131,47133,47135,47137,47139,47141,47143,47145,47147,47149,47151,47153,47155,47157,47159,47161,47163,47165,47167,47169,47171,47173,47175,47177,47179,47181,47183,47185,47187,47189,48001,48003,48005,48007,48009,48011,48013,48015,48017,48019,48021,48023,48025,48027,48029,48031,48033,48035,48037,48039,48041,48043,48045,48047,48049,48051,48053,48055,48057,48059,48061,48063,48065,48067,48069,48071,48073,48075,48077,48079,48081,48083,48085,48087,48089,48091,48093,48095,48097,48099,48101,48103,48105,48107,48109,48111,48113,48115,48117,48119,48121,48123,48125,48127,48129,48131,48133,48135,48137,48139,48141,48143,48145,48147,48149,48151,48153,48155,48157,48159,48161,48163,48165,48167,48169,48171,48173,48175,48177,48179,48181,48183,48185,48187,48189,48191,48193,48195,48197,48199,48201,48203,48205,48207,48209,48211,48213,48215,48217,48219,48221,48223,48225,48227,48229,48231,48233,48235,48237,48239,48241,48243,48245,48247,48249,48251,48253,48255,48257,48259,48261,48263,48265,48267,48269,48271,48273,48275,48277,48279,48281,48283,48285,48287,48289,48291,48293,48295,48297,48299,48301,48303,48305,48307,48309,48311,48313,48315,48317,48319,48321,48323,48325,48327,48329,48331,48333,48335,48337,48339,48341,48343,48345,48347,48349,48351,48353,48355,48357,48359,48361,48363,48365,48367,48369,48371,48373,48375,48377,48379,48381,48383,48385,48387,48389,48391,48393,48395,48397,48399,48401,48403,48405,48407,48409,48411,48413,48415,48417,48419,48421,48423,48425,48427,48429,48431,48433,48435,48437,48439,48441,48443,48445,48447,48449,48451,48453,48455,48457,48459,48461,48463,48465,48467,48469,48471,48473,48475,48477,48479,48481,48483,48485,48487,48489,48491,48493,48495,48497,48499,48501,48503,48505,48507,49001,49003,49005,49007,49009,49011,49013,49015,49017,49019,49021,49023,49025,49027,49029,49031,49033,49035,49037,49039,49041,49043,49045,49047,49049,49051,49053,49055,49057,50001,50003,50005,50007,50009,50011,50013,50015,50017,50019,50021,50023,50025,50027,51001,51003,51005,51007,51009,51011,51013,51015,51017,51019,51021,51023,51025,51027,51029,51031,51033,51035,51036,51037,51041,51043,51045,51047,51049,51051,51053,51057,51059,51061,51063,51065,51067,51069,51071,51073,51075,51077,51079,51081,51083,51085,51087,51089,51091,51093,51095,51097,51099,51101,51103,51105,51107,51109,51111,51113,51115,51117,51119,51121,51125,51127,51131,51133,51135,51137,51139,51141,51143,51145,51147,51149,51153,51155,51157,51159,51161,51163,51165,51167,51169,51171,51173,51175,51177,51179,51181,51183,51185,51187,51191,51193,51195,51197,51199,51510,51515,51520,51530,51540,51550,51570,51580,51590,51595,51600,51610,51620,51630,51640,51650,51660,51670,51678,51680,51683,51685,51690,51700,51710,51720,51730,51735,51740,51750,51760,51770,51775,51790,51800,51810,51820,51830,51840,53001,53003,53005,53007,53009,53011,53013,53015,53017,53019,53021,53023,53025,53027,53029,53031,53033,53035,53037,53039,53041,53043,53045,53047,53049,53051,53053,53055,53057,53059,53061,53063,53065,53067,53069,53071,53073,53075,53077,54001,54003,54005,54007,54009,54011,54013,54015,54017,54019,54021,54023,54025,54027,54029,54031,54033,54035,54037,54039,54041,54043,54045,54047,54049,54051,54053,54055,54057,54059,54061,54063,54065,54067,54069,54071,54073,54075,54077,54079,54081,54083,54085,54087,54089,54091,54093,54095,54097,54099,54101,54103,54105,54107,54109,55001,55003,55005,55007,55009,55011,55013,55015,55017,55019,55021,55023,55025,55027,55029,55031,55033,55035,55037,55039,55041,55043,55045,55047,55049,55051,55053,55055,55057,55059,55061,55063,55065,55067,55069,55071,55073,55075,55077,55078,55079,55081,55083,
-									55085,55087,55089,55091,55093,55095,55097,55099,55101,55103,55105,55107,55109,55111,55113,55115,55117,55119,55121,55123,55125,55127,55129,55131,55133,55135,55137,55139,55141,56001,56003,56005,56007,56009,56011,56013,56015,56017,56019,56021,56023,56025,56027,56029,56031,56033,56035,56037,56039,56041,56043,56045],
-		'employment':	[10366.90272,61810.75271,8713.229866,4223.66659,8389.040445,2892.137801,6547.194554,46453.17373,8167.11898,4925.224769,9006.7389,3680.623743,8169.164339,3611.081532,2334.777439,14954.64323,22314.86804,3299.164266,1396.980281,12872.46764,3605.968135,26075.26078,18125.97255,13296.87966,20204.05742,18513.56811,12635.20598,35277.33148,3998.677086,10209.41006,5075.558665,1896.047907,2956.566613,3334.958051,47356.19978,16152.201,343854.5264,3408.590979,30320.40365,5985.743475,51235.22336,21588.76555,2572.039098,4965.109272,182488.9864,6888.769528,9578.416775,34258.74264,167378.8958,6513.446129,130223.9247,46678.16324,2192.62498,3634.603162,13544.36812,4408.771591,13321.42397,17683.1523,76178.37787,3187.692194,27826.08819,12880.64908,86678.22893,18747.76173,3521.085731,2603.742164,7208.868231,1877.887475,3687.310302,149999.1962,6596.079755,1274.42051,1874.953276,2567.424282,36983.62452,932.0972726,699.3174711,17453.59479,19172.05744,7079.244553,6209.74353,749.1988571,20073.83465,3799.787937,13750.63542,2830.524142,1596.204354,1844.633217,4231.115217,738.4401268,2389.416198,4580.284919,2266.179833,796.146044,297.3321835,2349.315476,18531.44403,35850.05535,56748.17296,14342.02186,9535.684782,3941.456371,5378.258199,1666582.135,44112.91569,26305.37181,346780.17,55972.27997,12793.23548,54192.52545,63274.27284,10076.26837,7679.456162,14525.72986,98826.12515,14218.55161,3562.856718,2828.300042,10277.62936,3541.282327,9455.747761,3751.889486,7266.46066,1074.610187,8717.081677,6848.328398,45198.35102,19664.54454,16545.50388,5237.44047,3002.949881,4776.159424,6512.384296,41911.85199,4573.771081,2055.731342,36800.77581,3819.694717,15226.38392,8738.656069,8689.343173,7410.28994,15007.55794,3211.502336,5447.020277,31657.85172,8841.391268,1324.256721,4187.486731,2151.275077,3052.262777,3927.566677,5807.620827,13483.99493,3268.006696,3713.877462,13693.57474,19815.56528,2377.292516,1617.05204,2431.742172,1121.868378,7367.141156,1387.952545,6314.105361,2349.554012,5342.230374,6174.38549,26784.09386,1461.921889,249167.7887,4752.530329,8222.925368,21949.37537,3097.466265,1697.185496,67311.07536,5078.200911,3720.041574,2650.568147,17961.19493,3923.457269,94449.60565,26194.39382,1962.24231,6747.647903,643564.8478,621.3788859,11133.03837,69671.61908,7353.960494,8275.281704,316047.3703,7625.569504,46213.58912,330897.9349,7965.569272,44116.92389,57653.4089,7238.673217,287657.3897,39980.26005,13916.54222,10089.59081,3885862.231,44274.22263,103583.6649,5035.513802,29081.70427,69148.91828,2561.722388,6218.673913,167288.6788,65910.12739,27370.95832,1371338.259,127571.2347,5801.49029,559193.1238,576090.526,14055.27776,598893.9587,1245854.896,573053.9764,201507.506,102652.5736,332256.957,179691.8313,882292.5583,91339.7652,57981.68453,571.5513337,12322.06055,118668.712,173147.8128,160412.4766,26207.33842,15233.55281,2571.492496,139378.4105,15792.40301,298253.0721,89513.73196,15622.40312,157581.2457,7447.192454,282801.2171,3242.860695,1133.76351,1015.93132,159132.8679,31590.90919,6591.671342,715.9048191,3090.371978,1332.790991,775.3160074,1106.038289,828.7860768,8384.899042,429830.0455,414.8881316,94289.51658,27902.46459,2976.500534,235372.2753,12894.20823,23946.66963,5295.517251,6479.780271,7445.212081,250.5171773,1696.189426,551.5338647,209796.7489,473.3091335,2963.62811,2043.744878,23484.25255,131312.5888,4961.82441,2048.69581,7990.804827,57756.58671,503.0147276,4907.364154,8725.523189,13228.89126,11828.76759,5936.167898,1464.485792,2129.891101,1545.681082,15178.56842,4593.475042,55958.40808,3098.29347,4065.705653,13110.06889,1613.013762,298.046128,4403.35924,786.2080585,17554.02577,6711.483905,1158.518172,84572.81674,3838.952951,418158.811,503162.557,62083.70263,67882.65095,362954.5042,125910.0625,41384.00963,39083.70204,62322.64995,273118.9455,70308.40453,653760,118840.3605,6692.40824,71953.81844,6676.127484,190847.0914,713732.0598,2930.53607,42087.78921,31985.58015,43276.28439,120572.2259,21663.58088,7832.061156,2450.25377,449410.9344,121066.7538,19676.31111,3391.484973,12850.60418,3012.957397,1663.689748,3499.344981,3346.712894,7980.623054,11324.28331,37436.58075,27890.97003,596282.6864,3319.239118,47046.29694,14446.11826,2513.341699,1632.145783,82682.83661,206973.1801,139656.3245,8150.553444,1936.39241,4255.382585,106200.3886,92135.85053,57215.66412,1010094.73,37166.93073,18572.27234,77254.22205,10769.72006,692441.9188,75888.67364,514791.3977,100399.3517,389200.6288,193789.838,16658.26597,58596.47574,66047.97422,33514.95366,140203.7649,161339.2388,22759.47926,11035.29989,6865.391272,3785.275757,152585.2798,5025.66585,20708.10401,5817.317608,6706.771294,1532.189885,3615.886575,493.3998034,15353.50091,4560.889918,15107.82043,31965.98685,5716.913424,3977.781059,81783.05625,3156.127668,2026.60911,3336.565199,6297.98344,22472.11832,6581.382501,5638.418001,1273.256931,14609.32352,2946.126925,37814.40559,13592.9607,2174.425166,135502.4695,2323.260644,5831.088585,46494.7761,65778.14527,626.943965,113459.5275,2394.62012,307128.1251,14824.42136,15175.10222,30050.49464,3972.683954,31506.22794,1282.43172,7311.287995,3276.419355,7822.017957,8809.836985,281643.6175,5471.232943,3016.46698,47971.91724,37370.95742,4247.927646,996.9938175,9345.033052,5849.438165,6680.266346,4331.520175,5195.989251,38263.97029,37345.47189,59310.93793,6515.120131,735175.9012,7004.44225,403.6907482,35877.50554,20785.99585,5924.875325,5180.697935,314406.7916,13133.20179,72667.39294,1209.033402,7311.287995,3729.042315,5885.117902,2024.570267,50262.55641,58653.41133,2142.823113,18998.95069,2074.5219,4052.198798,4774.968345,1311.994932,1672.869994,3567.973785,3711.712157,1443.500251,17199.67248,5385.601573,18538.17236,1343.596985,894.0322883,47692.59587,6425.411076,6759.78119,1809.472419,2985.884347,3193.846248,1486.315937,4469.14202,1576.024992,8157.407493,6593.615554,1476.121726,6033.95338,9380.71279,95677.76559,20848.18053,8589.642031,1769.714997,19820.60408,8376.583025,7137.986411,3761.66379,2476.173807,11149.40837,2832.971185,5486.52426,403.6907482,4520.113075,1838.01621,100154.0436,30137.14543,1015.343397,3393.65278,2235.590431,20953.18091,9291.003735,1175.392507,10889.45599,829.8087602,174.3210049,5869.826586,1757.481944,3682.148946,2332.435434,21364.0076,18694.14379,11583.68175,3498.653151,1091.799978,35562.50442,2082.677269,1193.742086,6195.021911,7042.16083,12682.61767,18693.12437,14599.12931,1120.343768,6893.325352,8338.864445,546.4096996,1409.859355,6415.216865,52751.98269,1173.353665,2956.321136,2892.097608,3520.060994,61431.79028,431419.5713,0,28065.31453,67293.32384,195248.0248,917.5696414,30049.17906,1600.594743,3227.68615,14528.02243,11440.67046,1515.216606,12261.08567,42391.71743,3369.001689,7623.188208,409.2262465,51282.82006,3137.401223,9763.529799,436.7042678,2717.38004,1647.699923,5987.26458,2946.036432,2758.597072,2950.943221,5762.53362,4106.982834,5576.075618,8650.669935,50051.21588,13013.78718,2269.880835,1500.496237,1477.925005,12390.62491,6790.015347,19339.62024,1036.313948,2948.980505,5531.914512,3178.618255,4573.127839,2523.071174,33022.69351,3796.873735,2789.019167,33690.11825,1883.845426,4479.252031,16278.88167,3498.423815,12246.0191,867.1831933,4120.911869,5701.7039,89509.27728,11216.04709,4420.893776,5065.906069,12301.30586,23274.70547,2462956.915,8253.085857,2476.642437,36725.77134,5692.489439,7007.08592,582344.7411,6474.694822,2444.903737,20640.39336,6064.139379,4644.088506,9107.983102,8706.64212,1125.18811,2596.430435,16952.56117,1670.888986,4084.054023,906.0886966,1085.258778,14177.98449,8144.559979,26070.78257,2306.686817,19126.15022,4951.237217,7912.150788,2274.948117,200320.3415,43589.5212,25898.77929,19989.23809,329505.0415,43846.50228,4466.966083,12683.19409,14108.36411,9136.650315,12415.97472,95751.56291,88492.61504,51563.10173,10259.79077,96358.69353,13431.61312,3208.680198,3229.156779,3742.095126,2046.634242,3173.870011,8551.020106,9254.390654,14819.92529,4682.994009,15925.66065,105396.0324,4973.761456,3363.278382,4160.841201,591.7731826,1648.364748,1749.723822,12240.89995,6200.30864,76642.81779,95434.17591,9574.849142,130802.3499,1954.489629,998.2333098,4878.545355,1354.525814,18295.82487,62405.45121,4948.16573,29014.29104,3319.253734,6333.406415,5884.969297,4449.560989,4593.920883,20995.66204,207310.0223,26563.24433,127725.7437,11004.11448,12650.55611,179088.7174,48298.12557,2347.051436,3289.962732,22970.42366,2954.523573,5278.053361,14621.26117,47957.57301,7805.096541,10854.72939,1985.022587,10966.20155,14622.28385,12886.79527,19647.73516,45628.92982,27409.87913,112174.7411,6376.412072,28431.53681,5565.426543,3848.346211,6662.762574,18244.6177,27827.13271,6557.426496,116464.8853,20372.81554,10347.47993,55420.07163,12658.73755,37235.79207,14094.58078,19437.06301,11724.0077,7623.059436,12567.719,7293.756359,45827.32981,17628.96412,35863.35502,11871.27367,192890.8116,42060.79803,12915.43032,39330.24145,576197.5482,18633.23624,7434.886249,9386.160384,62887.68365,15024.19723,14954.65497,3543.587463,17683.16618,1542.201989,7543.290368,4718.647201,3089.517381,6269.030634,3187.694696,57365.20968,8839.026389,4626.605968,12700.66745,7459.430578,12336.59324,4680.808028,
-									117849.5945,7010.473898,16958.0858,7035.018227,4279.917325,14871.81786,6314.02857,2301.03082,80337.6787,4268.667841,1407.208181,107248.4898,4398.548247,50314.85125,12563.62828,2002.408153,15391.33948,5758.713132,29590.23366,10838.3665,8906.523293,11590.03657,2821.52576,0,5115.449141,4377.404227,1841.122853,5644.048877,74530.56803,9168.712021,9774.108322,6254.431968,10732.56935,3772.007926,3040.944518,11851.60502,5917.324967,5397.701453,24317.58256,5466.519155,4693.566711,4203.863937,8843.573316,6642.404227,22348.79789,7542.021136,34822.75429,1941.856011,2165.264201,6298.31572,21458.1572,8492.503303,56272.93263,4227.800528,7199.927345,5309.93395,3924.603699,2503.36856,3122.727873,4014.365918,3105.772787,5709.874505,6238.47424,7298.665786,4213.837517,9203.619551,4055.257596,3971.479524,3402.985469,8868.507266,6091.862616,10695.66711,7024.392338,77679.22721,6317.265522,2361.743725,6692.272127,16055.46896,126026.1559,3592.483487,3176.585205,4604.801849,3653.322325,7779.392338,16324.75561,18174.85469,4050.270806,3687.232497,2655.964333,3517.681638,4088.17041,21774.31968,6382.093791,2208.150594,6478.837517,3721.142668,10728.57992,2855.435931,271450.9247,37298.19683,9435.006605,1425.224571,3235.429326,87922.09379,6148.712021,19294.88771,42647.02774,4896.030383,1922.906209,6562.615588,2016.65786,15672.48349,9780.09247,8203.269485,1870.046235,17502.6354,4247.747688,10118.19683,50439.38573,2362.741083,5768.718626,5844.599451,2076.864079,6038.102396,1814.470032,12985.97257,5747.341425,4810.219829,18476.99857,743.6186508,831.7587362,5762.537992,848.9815115,764.8938438,3153.794087,3716.067045,4021.011478,685.8716984,14075.05983,17001.91853,975.6195651,6864.79561,2287.589801,46286.71515,989.8030271,663.583401,15943.2244,3004.867736,18342.25569,18310.84945,9010.550791,14119.63643,1241.052925,1052.615502,3393.899837,3176.082385,655.4785655,1752.670662,1289.681938,2557.075579,13531.02275,1821.561763,566.3253758,4022.024583,3416.188134,805.418021,314242.7056,1318.048862,2688.779154,1191.410808,9031.825984,692.9634294,21187.05292,989.8030271,1983.658472,1266.380536,15232.02509,14489.41954,3669.464242,4878.097825,1662.504368,7692.501929,3469.882669,17486.18244,1462.922795,1194.450122,5496.091527,6763.485168,1333.245428,2680.674319,2852.902072,1460.896587,1332.232324,3279.419036,2512.498984,9404.648414,4857.835737,928.0036569,28117.70032,1977.579845,3856.888561,28998.08807,1941.108086,1226.869463,2846.823445,29459.05058,2073.824766,242824.9219,11900.93773,95923.76665,1016.143742,2650.281186,1389.979277,1315.009549,746.6579641,1931.990146,7099.835838,4067.614282,1282.590207,1375.795814,485.2770215,2104.217899,833.784945,3410.109508,690.9372205,85159.53209,4849.735774,4139.993649,4369.824551,2429.930241,17191.75646,1668.552099,9068.702155,76596.46357,6768.368193,26968.1758,13985.26101,1321.274569,3182.196145,3268.256175,20543.03525,2787.332481,4088.357631,15329.82241,28953.6313,881.8621835,6199.359529,5981.678278,3559.847804,31798.67462,12172.93804,4005.335015,3858.526729,2024.941868,1611.853727,45491.33153,1529.843581,891.9868928,2412.718236,180271.4623,2984.764313,11751.75013,30412.60191,2419.805532,2376.269282,2035.066577,4873.022605,11021.75859,7567.20776,1839.659687,7853.737035,4314.13865,45613.84052,8089.642762,4907.446617,4694.827721,19619.66176,2852.130621,1021.583172,18153.60385,2270.972305,428965.7102,15372.34619,5942.191911,62220.38878,2969.577249,7903.34811,2604.075242,23676.63279,3426.20164,1715.125762,2081.64024,5437.981386,1984.443031,4259.465219,2761.008237,7980.295901,2280.084543,38585.26729,2859.217917,1911.545123,32590.42689,2070.50306,7454.823487,10619.80763,2977.677017,8423.75817,4156.193184,965.897271,6211.50918,1878.133582,2966.539836,11134.14286,3168.021552,8874.307736,14399.36162,906.1614859,8135.203954,13941.72476,1678.676808,677.3430548,2313.496084,13237.04499,24068.45904,2455.242015,24939.18405,287.5417452,3257.118995,10120.65946,6345.155343,23013.46433,13738.2181,8713.324858,1747.524832,10945.82327,2266.922421,3229.782279,1052.969771,5767.03444,58644.34144,3157.896843,5144.364815,3124.485302,12250.8983,1219.015004,8666.751195,15040.08359,8374.511893,36958.22348,4572.950758,11206.2973,8356.385244,4480.303441,43887.63863,120069.9167,84844.80231,2446.090595,2734.102909,2353.443277,4270.83994,6061.350058,7595.065981,259828.3955,1718.003522,5007.990337,8210.365015,5022.088842,3254.740553,33280.52778,13514.42395,3574.978021,193630.88,8723.953407,138461.4163,38006.54802,4799.533872,17625.14516,22874.82415,3259.775733,7196.2797,13134.77136,178277.6082,69553.96674,14762.14164,5539.705378,58477.57709,2585.061572,6576.952522,5358.438887,10970.65086,24012.7749,1393.73791,8155.985068,14839.68341,24216.19619,12459.05016,27221.1918,79685.75656,42047.78374,1125.866318,55652.84094,4886.138974,14034.05456,14945.4222,9935.417789,12607.08446,11678.59721,2403.79508,5191.270901,5238.601595,48047.97055,28337.43433,172641.0846,10925.92147,22070.21982,58271.24415,16916.12085,11200.91459,16649.21576,69617.74333,5529.181503,15092.26942,17163.81685,10772.24884,10237.42766,67637.18627,29980.4771,246353.6935,371669.5875,21976.59759,9089.029731,56917.61505,29967.15609,41548.23997,11033.89765,94866.10739,11710.19524,88692.33015,162856.5584,7935.225055,461620.241,306912.0439,13863.0759,43022.77365,6728.136326,18502.88724,68186.16746,45245.33346,24397.9479,337604.6828,90636.77919,60592.73248,210528.6059,8067.216035,305597.9984,25983.90509,196408.725,60736.91506,827013.3002,6036.644592,321450.0729,176106.0144,596590.5009,316330.5898,1574.670693,2595.666852,34683.39191,11442.2684,5068.407798,4434.475854,3169.659717,11415.85457,36210.31452,3967.154229,60165.62738,12733.49836,55046.42376,8794.789799,9691.844135,6332.208018,13484.26071,6725.367733,14514.40012,3799.527994,13867.26126,13794.11527,30805.63834,17052.15973,131402.7136,3967.154229,5578.397919,45598.3996,13417.21022,11887.23986,11821.20528,12313.92482,155830.4277,20060.28871,7196.753025,3646.124591,28988.16358,55277.03682,111438.937,3862.514822,338907.7379,416.5257962,1477.142702,21458.18992,5917.714055,27134.11583,48758.91607,1772.774425,4413.141606,295233.4843,6978.330961,27627.85129,10306.47366,12371.83206,7596.008239,36061.9907,2903.489574,38741.97863,15007.11966,1810.363339,60510.0231,11212.67125,670930.6092,6895.025802,6080.260708,1465.967619,5587.541168,1594.989024,9578.061479,110453.4979,3170.675634,5394.517019,84146.33816,45233.68555,19866.24864,10735.19046,2748.054338,16130.72339,11223.84633,21056.90287,196695.672,696096.8947,12761.94403,3730.076936,112758.3247,13754.21392,18216.27652,16339.54661,1932.645477,38127.30317,13672.88218,13176.75856,34344.36061,9740.492539,5821.319307,14072.42435,18280.32526,2477.568137,2769.345755,5018.168372,27434.21263,175742.6409,5355.695094,17749.63566,5218.447782,6072.431055,12331.92511,21759.29045,1869.613379,852639.2654,5046.634481,5814.20278,10554.82659,16227.71547,5583.423967,3724.993703,22865.40212,1504.637194,5106.61664,2439.952207,4454.946071,1524.970129,7700.082506,1774.048584,14761.71085,16648.60723,1991.610989,2364.720347,9030.873106,6775.950608,9617.478282,11065.18326,16440.19464,3019.440856,13426.85367,10351.49724,1768.96535,92461.98888,22213.73155,9853.340329,8263.304807,4321.765346,12370.55769,3944.589401,322827.0266,1113.228194,6436.390592,5612.906723,23204.96213,3246.153082,8507.300028,95173.38577,42340.28732,23672.61964,4643.02572,82281.2883,21953.46998,5320.112458,3687.377773,6038.881712,1094.928553,6961.996964,5725.754512,7427.621176,74933.98221,4079.803419,2114.625246,25212.83947,37738.94411,4341.081635,11115.85416,13423.75452,1650.267296,4750.831959,1358.558586,12206.41181,3515.966112,1204.973435,6200.098553,1920.329776,4242.660955,3245.903632,5230.141323,8625.507015,7356.625665,5180.664227,48876.15513,37730.40855,1711.082892,4549.831257,2029.591696,10053.12738,13718.55555,85125.34313,124218.4334,3828.290279,2870.702323,249.4470241,5872.312794,49450.29559,4411.707699,1333.820038,1699.744391,29117.27081,3343.82705,19535.20661,18131.29402,34340.19672,2603.73216,5202.310457,52017.9507,14313.31147,11274.59318,26135.24502,48070.09078,7583.395687,5891.897478,9581.033425,2649.086165,13108.33804,6099.082816,2518.178016,18921.89678,11095.23871,10202.58944,2072.884155,14842.09793,11554.96339,7316.425525,1276.09676,57566.60083,12919.70661,1277.127532,7633.903555,2798.548225,4026.198661,9154.293475,2864.517686,5580.604084,5819.74338,5382.695702,11660.10222,9971.696326,2678.978577,21252.47414,18267.35604,5210.556639,2123.392023,2129.57666,4729.185729,3345.888596,6271.221878,10083.76178,2454.194567,1736.419671,9659.668742,14296.96693,3439.979833,3706.963342,3560.122412,1887.368039,88609.77305,47263.26918,19151.95936,1485.865916,14163.47517,16306.53127,40767.35502,2299.13876,1521.806004,23502.7637,3294.165762,2105.062286,15207.79144,1445.818389,88481.41559,4239.903501,52985.95802,5385.878872,6558.552594,1629.626267,2429.549935,1597.793618,3283.897165,3872.287746,2360.750339,10145.37336,36339.53621,5156.88917,2340.213146,157376.5102,3562.176131,2580.498304,7394.41635,1117.223301,1322.595231,2403.878444,15362.84725,3919.52329,357072.9872,58234.2377,46964.45302,
-									15027.06414,1106.954704,12705.33447,9172.937267,8737.548775,2733.500392,10242.92502,3867.153448,6170.399646,7037.069192,4936.114345,3618.653412,1437.603512,14462.29133,1823.702741,6044.095909,4196.775396,4066.36422,1870.938285,2932.711165,4032.477851,7384.147754,20126.44917,8423.329721,2377.180093,3302.380639,1531.04774,6409.657945,9717.172882,18707.32913,17770.83313,6137.540137,40457.24341,7719.93086,14165.52889,999.1344409,2657.512778,9713.065443,4082.793974,1533.10146,3220.231867,129519.8616,1744.634548,5549.149557,22626.85242,582761.3357,9017.881459,690.0496858,1207.58695,15574.38033,1280.493985,1922.281268,10672.15236,5079.874696,2504.51069,28158.54536,6071.821119,7142.835736,6641.728226,5062.418082,2725.285515,6530.827384,427.173615,4866.287888,223404.6126,3572.09976,4407.797849,1491.007689,1281.064022,2578.434349,257.8434349,35649.65752,1248.451414,5711.28304,592.1226706,3676.052449,3241.8971,1663.243027,4485.252794,38556.25624,45603.63708,296.5709073,4621.818092,171.2161939,779.6451687,7159.48668,2429.639323,436.1936369,8156.209523,35789.28025,511.6102937,5362.735788,570.7206464,3448.783335,584.9886626,1179.149621,56002.98257,1294.312895,5500.32023,123.3164254,1331.002079,1783.50202,512.6294377,2421.486171,299.6283394,10645.97834,6442.009296,3882.938684,4460.793338,2693.597622,1516.486289,15890.49343,3301.007453,1440.050488,1830.382645,2201.351065,186.5033541,2907.617865,629.8309991,335.2983798,79232.33202,15359.8486,2048.854098,87.7647989,164.4328991,154.3449912,2337.368265,4032.136795,594.1777765,1239.803883,26271.93859,1906.614597,2603.689034,5054.041868,2695.488996,1813.805844,2304.078169,5734.975652,2489.695675,4813.949659,3825.334683,4120.910385,11874.47641,3396.598596,11333.76455,668.8282951,1806.744308,16618.81951,319480.0086,670.8458766,2247.585884,831.2436126,786.8568177,1936.878321,9036.747914,591.1514041,846.3754744,441.8503669,259.2592335,646.6348976,35262.28213,3259.403049,896.815014,203.77574,716.2414623,4555.699216,340.9712877,1468.799393,3272.517329,1655.42569,2338.377056,3271.508538,133.1603845,1539.414749,2930.537251,158944.0684,14752.55654,200.7493676,112.9845687,56.49228435,21247.15166,2290.963889,1567.660891,1079.406147,3195.849229,1464.76423,6418.935809,832.2524034,1129.845687,4639.428852,2006.484885,19364.74804,1455.685113,5349.61757,2480.616557,464.0437643,6852.71585,62273.66438,4888.600178,17162.55774,6233.318303,1722.005882,816.1117507,161.4065267,1461.737858,2434.212181,252.197698,2948.695485,1772.445421,8367.919619,4259.114724,1036.028143,306.6724008,7853.436315,7637.33928,817134.2603,17219.03787,22749.90451,316.2210708,4737.311865,8411.880764,3523.463261,1220.853501,11169.80884,1337.935354,10710.48773,1815.269059,3426.3954,184036.6604,4338.032728,27375.13802,25855.16384,20611.65818,32861.21828,12697.12635,53397.93991,193406.1106,74745.61875,138970.3508,46201.97776,13962.83553,138168.0148,439105.2814,199486.9139,197174.1451,40841.32358,59607.34676,346901.8646,99533.91079,239764.2737,47637.86288,236056.6001,395706.9772,248925.3216,279169.3006,153226.3643,174592.8296,21665.52123,176631.3774,38619.61684,224901.5006,36003.65286,310845.499,661.6087282,20918.09724,7933.271833,4967.092884,16964.53262,478.6105694,69625.77203,25328.15177,9711.973718,1285.00905,173.9487994,1683.180868,30326.41467,6444.149452,16255.66612,7695.977517,21136.28735,722.943276,17712.613,2674.588476,9485.73973,6362.705216,29631.62496,49434.64001,8076.050616,60580.43446,3207.495202,5498.994126,10223.76527,3242.687156,1247.806127,13322.66816,222564.5145,13693.68771,239444.8091,90487.66932,30237.26895,26568.91845,51417.75882,38171.33198,17355.95303,32873.16692,20673.39137,17910.71878,15537.49783,111443.0075,459398.7805,14428.98053,18709.90601,17539.52268,23109.49253,14228.16952,1780.929908,16663.25649,42177.41007,526485.8828,6565.91129,20192.662,21560.81373,378275.192,18723.09057,598080.0765,2417447.036,71585.06589,106155.9986,243494.4977,51472.52545,132459.1974,13319.44902,33370.12344,24126.73211,24712.93797,528041.661,51110.45713,93568.79977,116280.7271,34890.40473,78741.23983,64468.44564,8465.502246,4963.480051,11483.75248,37018.19,626981.648,25301.17222,13308.29286,50241.29031,57930.93186,38824.47484,15539.52623,29243.35591,410605.7635,13834.66109,6992.888221,58042.59023,9027.632072,3357.258281,7655.359079,7205.699146,6593.999598,16244.47144,6263.843882,12252.22042,28384.27688,115040.0249,29103.32767,64206.1721,23396.49497,1958.653851,22339.18648,3108.122373,79962.4992,14031.61794,7779.927034,4711.301817,1967.768579,32667.18646,15513.26768,38488.45964,119381.6739,5435.416348,18950.53302,41008.17566,9607.936445,19795.16451,186974.4739,18245.66069,176184.6611,12063.84937,66421.05109,1468.484014,2165.254361,20522.31729,4402.4138,265730.7908,16266.75189,22240.94996,16657.67246,34380.75539,9016.491848,7839.679142,2120.693466,65355.64062,12148.92016,43434.7189,1851.302606,25353.12332,27947.78266,20195.19981,15121.33436,10689.55088,3852.491856,7439.643841,575550.5354,4915.876832,8748.113735,31898.51104,40354.95346,97971.17695,5185.267692,47713.5775,62531.08758,3215.473618,15856.58911,9669.714048,1804.716216,9844.919382,73016.06344,4630.28201,45251.58809,13613.35319,38534.03329,27095.04919,45837.96895,18441.12098,19134.85308,11717.48969,18386.43261,6858.326721,27559.90033,8460.493418,8368.333387,1241.628553,54246.81224,14457.98468,461857.4647,3610.44518,3186.103937,21537.09038,43944.13094,21084.3922,37937.52495,10087.97881,3870.721312,940.1844323,4784.428616,2327.374002,564.8966025,2763.572422,1747.740967,975.5518717,53661.24752,104724.9531,1494.274317,2030.680482,1017.796313,2604.418945,708.331218,986.3585893,1639.67379,698.5069293,39300.10224,596.3343264,976.5343006,686.7177828,562.9317447,1403.890861,591.4221821,1267.333247,1064.952899,7089.206754,3269.523292,4616.433278,9940.215346,6317.017659,1009.936882,662.157061,3707.68657,1730.057247,5665.667315,2094.538359,923.4831414,7578.456333,4611.521134,2602.454087,267.2206537,1680.935803,257.3963649,19478.61728,633.6666236,10655.42357,769.2418082,3322.574451,5139.085439,33878.07729,1592.517205,33676.67937,5611.928379,50821.10999,17821.87094,30671.54685,20255.50624,19548.53977,22998.82139,8250.319104,141346.435,6061.167881,9816.035916,49128.05771,54327.4192,15798.76515,30812.12519,10524.02107,13850.02328,714009.6511,18059.22423,15594.00973,81156.49122,36990.4417,40830.87916,11117.91366,684241.6767,17814.74015,11116.89497,33069.52822,69075.92149,14208.59993,499226.3098,42338.531,8187.160716,3492.047646,11441.85507,10511.79687,6692.751761,18133.58814,20759.75466,10738.96333,22137.015,19339.70962,95625.87417,12552.22027,53548.12619,18572.64081,96134.19733,204946.9317,14390.94431,99411.30272,24565.55688,59032.71911,3626.513892,18331.21278,39709.30843,3767.092239,247646.0767,2551.802612,4920.242162,32851.52992,2947.051879,13798.07041,4843.840886,5705.647278,13770.56595,8704.652024,52892.0939,10429.28349,11515.20029,51456.7686,27379.1612,26033.48006,23759.77809,18860.92829,26145.53527,156930.2579,260685.2278,71528.91178,35496.03274,28162.52895,10137.93996,2152.478611,77093.98071,24260.97046,43979.63041,16509.80636,60489.43677,8467.298727,4877.746946,1607.981511,3392.597355,1756.191928,11623.3512,2956.087223,14711.4066,7301.900891,29351.75342,23206.09681,15317.44509,4276.784159,674.0528557,75457.37481,1211.061833,42304.93782,1353.181411,5672.601443,17904.02141,12981.60831,8623.612966,1496.316129,1268.924804,26445.40805,9729.100255,12637.47591,1291.25788,1251.667426,775.56684,1250.652287,3629.124939,3250.477777,9605.253194,1134.926344,2641.393871,19013.56926,5755.84291,2379.487792,3764.138538,12955.21468,6922.238589,7146.584495,4417.888597,8446.978634,10768.60345,4278.814438,2533.789048,4275.769019,11616.24522,5972.067696,29869.47474,4398.60094,1748.07081,2269.852689,435858.4127,9817.417422,6438.016884,11886.27242,3512.383857,32536.24711,17544.66191,17918.23337,22152.38165,2904.315091,1098.38131,26427.13553,7605.427704,9180.92474,16140.7235,9805.235743,2057.688462,340461.6611,7421.687392,21139.27209,2224.171396,3826.062068,10440.71329,5011.567296,34047.89354,138485.9788,16568.93615,9570.604951,21143.85204,5543.488102,6048.61439,59780.55492,33767.04729,850.477856,2285.473165,2208.066779,12479.29876,75433.51551,6125.028387,22369.45315,21156.75311,2289.442723,135748.9684,16987.72455,39936.73321,12298.68386,130397.0115,4387.354261,437797.6179,16969.86154,732.3834979,8161.411771,29452.13747,9340.370573,2328.145916,11077.05231,247832.4229,316.5722708,30969.50111,33239.45941,701546.7788,18250.94727,56165.84487,15988.70472,168156.6065,59724.02482,25348.82312,254149.5495,85244.33887,57472.05119,2140.04243,17043.32256,67670.11327,242211.9328,13897.95309,31652.91164,13548.80989,25299.53232,31534.81909,127405.4339,179340.4847,216091.9139,15658.04557,128269.0499,41256.40339,2166.741616,56902.12626,4884.924107,15793.59528,13134.97252,33990.11729,16212.56712,6202.426237,99144.34574,225555.7484,29844.55525,50734.61434,180959.893,142570.5714,55138.95311,16850.26691,49004.30173,15525.57653,56252.10378,478316.9403,17220.97483,105866.3792,28815.60971,7951.222906,647068.1171,10561.58176,5496.951597,51347.66873,15272.96116,
-									25552.14769,1815.544633,9727.745652,14026.31456,16576.08681,20752.4556,15482.44708,88008.73149,15491.68911,136474.9419,10162.12087,175315.069,13765.00461,74510.59073,39173.05859,274913.2561,50658.09002,5664.79545,57805.31137,2971.81361,58761.74535,3969.252259,5576.635405,59027.2506,39007.74457,3691.445606,222585.6615,18359.84193,8106.623674,13519.24039,6866.232343,10151.73169,19088.69998,8576.127169,29996.96787,6050.239368,7560.236418,61591.06772,22137.39735,239850.6787,28459.29267,4772.943832,112324.0983,7144.038996,16244.00085,18227.60186,17655.58669,3489.497595,101342.022,1727.321812,6667.359683,7077.406404,13540.76784,22454.15844,30881.64367,34034.90296,208965.9597,4339.319425,117438.406,36178.42219,6408.005132,8418.259182,77842.24439,969.2301356,8576.885683,913.1589707,1776.254401,16804.32786,20433.93451,1981.514916,523.664629,2700.427351,478.607443,3440.366473,980.2441144,5997.612099,15989.29342,850.0789102,2491.161753,12267.56986,1942.465354,1579.004054,2216.813554,1118.419485,1206.531315,2451.110921,571.7256275,3616.590134,1460.854099,728.9251433,1761.235339,1273.616459,547.6951283,430.5464445,10526.35993,2588.285021,557.7078363,697.8857484,1567.990075,450.5718605,1912.42723,4674.933371,11165.1707,16210.57427,1483.883327,1349.71304,617.7840843,1661.108259,6811.645261,364.4625716,744.9454761,116419.7586,2248.85422,53746.21407,1052.335612,859.0903474,3489.428742,646.8209376,3716.717214,2373.011799,1309.662208,559.7103779,2897.677699,2078.638183,2095.659787,8864.250403,2216.813554,12366.69567,273.3469287,38546.51432,17092.34403,3817.620918,1860.732168,42828.55107,38275.43459,8935.401587,1923.131652,7593.3012,10413.55331,7577.957064,3494.37113,8482.238118,1674.556657,7696.618379,24527.08916,3623.261868,16800.80546,440023.7744,3757.267319,5499.338172,14510.43749,14834.71022,7572.842352,4543.91,9559.396431,14019.42516,8902.667431,3237.612596,23796.70831,2164.546051,29024.96676,188940.5242,865.4092435,6511.028174,7851.082676,11722.91954,5168.927787,8527.247582,10250.90547,3401.283374,1570.216535,5565.829426,1380.972197,12010.36635,3851.378016,223929.245,1978.37054,6496.706981,9946.068647,2473.474646,9393.679768,13758.57485,16914.35206,5780.647323,4229.866693,55077.26299,7301.762625,7697.641321,27869.04188,1924.154595,12675.27889,47112.63371,1796.286799,3307.172677,10132.24416,4613.470081,1735.933199,998.3917514,2481.658185,32123.45919,10376.72738,18066.18517,18307.59956,105134.9478,5133.124804,2549.172382,40129.00616,481112.3005,4841.586229,2687.269601,67977.5892,44664.73263,10341.94734,1514.977647,5086.069455,2569.631229,705.8302341,12131.07355,61705.92954,3775.680281,10280.5708,6709.478993,99781.89037,35720.12456,18919.76932,6685.533675,35821.73761,5920.956658,1923.483124,397.3392369,10740.19998,10347.87765,2634.880899,2961.983402,14167.75259,1479.988319,9387.641162,108760.5789,752068.8575,2691.070286,230.7778396,3695.455579,42341.71327,92616.16394,87412.62535,4412.873646,306.0314829,2648.928246,15096.88424,4364.711314,12273.36754,7755.138792,9991.677073,2111.115541,130014.2145,4128.916565,4764.057315,7459.141128,2654.948537,11530.86492,15293.54709,2398.082768,1445.873334,740.4958505,688.3199911,2140.213617,311440.7148,812.7393481,6990.561776,42391.88237,3633.245901,895.0166649,16603.96387,14682.48751,470.5861164,1696.718812,1577.316365,1428.815842,1077.632173,3945.297675,1473612.83,4414.88041,7378.870576,1397.711002,185640.7043,7389.907777,462.5590611,4814.22641,1028.466459,3479.728468,7179.197575,70396.27151,364.2276338,40633.95726,277525.4028,15223.31036,3227.879609,6588.205629,8862.872422,886.9896096,1714.779686,344.1599956,144045.5072,2878.702703,5963.098699,5974.1359,5705.229548,96353.76156,1838.195661,9390.651308,431.4542219,1486.008611,6750.753499,8988.295161,42179.1654,78573.83409,8209.670798,30705.49325,14355.385,863.9118256,2630.867371,2081.014084,1148.872288,12202.12742,2119675.392,23358.73089,1956.594727,1731.837179,52762.8378,2455.275537,15845.40714,229529.6325,9235.127111,10086.99835,14504.88891,11967.33606,6559.107554,12548.29418,1112.75054,27239.81213,8823.740528,607.0460563,2934.89209,5602.884593,10752.24056,963.2466348,122240.0115,2121.14936,20718.83309,43196.59466,3916.1996,4191.126243,26134.08526,11714.48381,508.714629,300.0111915,17290.2771,1371.623073,105.3551007,827.7900768,13227.58374,1223.12255,18881.64081,4296.481344,4447.992013,2785.388186,6020.291468,6561.114318,5219.592702,17444.79791,8644.135166,1283.325465,4247.31563,4340.630148,50.16909556,125968.5787,1321.453977,3302.12987,101693.7601,466.5725887,4340.630148,1800.067149,1570.292691,1111.747158,10327.81001,16761.49483,8592.962688,468.5793526,80206.33646,5582.816954,1355.568962,2322.829125,5221.599466,142065.8347,10504.40523,4738.972767,302.0179553,22213.87213,16332.04737,1697.722194,6028.318523,156308.8409,5144.339059,959.2331072,22769.74571,8442.455402,9811.068328,28932.51741,5140.325531,6102.568784,10895.72417,75373.04579,2520.495361,1689.695139,29473.34026,2207.440205,667.248971,2528.522416,3823.888464,2511.464924,222.7507843,3794.790388,22147.64893,2994.091623,13841.65347,1924.486506,1579.323128,2161.284637,19046.19544,1494.035666,982.3108911,7740.088064,1508.083013,8614.033708,904.0471021,93209.16265,3795.79377,14614.25754,3359.322639,585.9750362,572.9310713,2478.353321,1986.696184,784492.1406,58342.64461,399.3460007,3878.071087,469.5827345,15541.38242,45607.7214,606692.8659,2229.514607,3861.013595,6806.942886,1545.208143,9650.527223,16692.26148,9690.662499,39251.29699,23628.64063,15164.11083,4330.596329,14943.3668,91126.1418,15166.11759,2393.065858,53644.8105,6800.922595,3939.277384,133969.546,6705.601313,2636.887663,20990.74958,9096.660408,4164.034932,6806.942886,4702.851018,2920.844744,2463.947511,16287.72998,47272.24026,8681.588203,376.2581169,106283.5363,8935.38961,3292.505411,2261.498918,4742.234848,14402.48918,3043.641775,2939.948593,4309.686147,1864.502165,252.8138528,618.2088745,582054.5184,3974.905303,6706.479978,7920.183983,22458.95563,15617.18074,14745.17045,175344.1829,6164.312771,47678.125,890.7738095,89266.99134,14047.93586,17204.17354,10977.60283,98746.88267,1001.547082,16383.53153,1187.50537,11190.84847,7622.268508,10420.73861,27749.22122,32613.44534,22088.61052,22855.68845,12838.76674,50866.02906,4339.450399,2379.240399,9176.055507,3078.300797,168196.5699,25131.6779,2255.459022,15766.90652,1955.136993,9761.480544,4125.369493,8514.535362,3244.695435,15943.44717,5414.927935,6225.594493,1527.989783,2693.766848,119362.7875,3773.30279,654.4179348,15225.10935,1261.149601,3645.463007,7938.241739,4119.281884,599112.0098,21699.2812,2949.446413,4187.260181,13604.79083,25559.83971,4863.999348,9616.392536,11957.07808,2367.065181,3473.995362,4451.056558,12223.91826,46170.45355,180688.3429,13265.91395,539.767971,10206.89058,27385.10772,941.5501449,10241.38703,3426.309094,4698.619312,5130.839529,143311.4401,8362.345145,2479.685942,3102.651232,1489.434928,12133.61873,3256.870652,40235.03507,3691.120073,3850.4125,5075.036449,2552.737246,5265.781522,8632.229131,5438.263768,5093.299275,11990.55993,7228.020725,8943.711775,14226.74152,114603.2921,13074.15428,1440.734058,2655.211993,35088.97652,5976.002536,28641.18431,6858.705797,4815.298478,13381.57851,11775.46442,3814.901449,31469.89315,38636.02319,2265.605036,3529.798442,16538.00362,11921.56703,20355.94888,3464.863949,14496.62551,11707.48612,21107.76855,96979.66493,3170.629529,12144.77935,2249.371413,35995.01562,96694.56192,11178.87877,3874.762935,26803.74109,3760.112971,20019.1012,11363.53623,4416.560109,25389.38667,6131.236558,55762.49565,31902.11337,7979.840399,5044.598406,51517.40319,24601.04134,2772.905761,11331.06899,97666.55011,139782.6563,4202.479203,13976.13496,1754.245906,44561.29565,6221.536087,150577.0011,67159.51373,23013.19007,11569.50033,27062.46446,166988.1795,9674.224819,13909.17127,25744.49717,6907.093343,5353.525113,75575.00105,37981.33671,20745.26966,124616.5153,1206.198435,34158.34978,10339.52914,1538.214869,29378.65654,748.4763556,35230.20631,21116.62908,14206.65698,7434.865133,1116210.466,77120.8926,13042.68029,6577.955664,22347.77673,2837.493056,12695.31049,16581.63003,5636.602709,2835.573886,252853.545,4988.882786,43951.87502,2077.501679,246708.3623,190607.1806,9141.007389,92921.42038,662.1136992,25403.09559,77168.87185,16592.18547,98581.05313,3569.789307,31445.97842,8211.342225,4041.075909,7784.497122,53303.96164,1434.530272,1830.369676,1241.261424,12524.23475,2262.382395,3952.19291,14000.10595,4235.37828,11544.45471,5961.362108,35729.93229,7780.363029,15546.25673,108616.059,7535.418019,3365.151703,12259.6528,6470.889071,21260.60678,11503.11378,6663.124395,21545.8592,8097.654667,8365.337189,55102.2921,2051.543652,2941.407171,8804.58457,30463.09781,1654.670724,2803.948578,3165.681716,7240.863892,20482.36378,34977.52736,11964.06515,3269.034041,3151.212391,2252.047163,2921.770229,2490.791034,2444.282487,8344.666724,9338.916091,2094.951629,4830.687672,693.494101,39627.34847,5346.415774,4629.215338,8199.545615,20491.29336,3893.345739,148361.0016,4014.476537,4833.118848,12083.80654,22706.97755,10167.92109,20467.0672,7741.267428,308259.7118,34194.21491,13125.53141,15688.45721,
-									16066.99096,56264.24634,983.178312,44488.31391,3159.494986,17511.47573,14796.127,6602.637925,10171.95878,1714.000794,8565.966279,33226.17794,8899.075974,52879.64995,7264.819622,67590.98539,3835.80861,7540.392188,10274.91996,33850.00156,65738.6936,19068.00648,3694.489345,2158.147055,474021.1526,19564.64276,8592.211285,16622.17378,103499.2011,39035.40914,2258.079963,9785.349648,14900.0976,31978.53072,5711.317135,74165.35947,6181.708401,60910.62187,4881.571167,30399.79265,36699.60358,6815.626245,12505.74549,56959.739,8125.857712,14057.22913,8354.996806,7347.592334,38429.75515,5855.664669,51728.90737,229132.0273,20070.36384,6425.988844,90275.75563,42785.41677,15558.51733,4310.760606,28148.82026,6974.54276,5987.167509,2380.660165,17050.23534,4684.197495,2171.61669,3367.020643,44392.31014,5768.991065,41537.75045,940.6956407,14187.55745,3470.527607,13030.71491,5606.627201,25244.53663,17676.35099,9261.843703,3961.678297,2326.877135]
-									},dtype='float64').set_index(['county'])
-
-	#	2012 Gross Domestic Product by County Cluster (2012 $US Million)
-	#	Data preparation:
-	#		States touched by at least one county within the 'county cluster' set:
-	#			MW: IA, IL, IN, KS, KY, MI, MN, MO, OH, PA, SD, WI, WV
-	#			CA: CA
-	#		Total BEA GDP for the set of states was calculated in acp/clusters/gdp/gdp_compare.xlsx
-	#		BEA cluster-states GDP was then distributed by cluster region and rest_of_region using 2012 county-level IMPLAN data given in the csv files in acp/clusters/gdp
-	#		regional 2012 IMPLAN data was prepared in the acp/implanRead repository by acp_base_data.py
-	#		state cluster GDP is derived from the BEA data presented above
-	#	Original data:
-	#		Gross Domestic Product by State, 2008-2013 (millions of current dollars)
-	#		Accessed 08/07/2014, by Michael Delgado, mdelgado@rhg.com
-	#		http://www.bea.gov/iTable/iTable.cfm?reqid=70&step=1&isuri=1&acrdn=1#reqid=70&step=10&isuri=1&7003=200&7035=-1&7004=naics&7005=-1&7006=00000,01000,02000,04000,05000,06000,08000,09000,10000,11000,12000,13000,15000,16000,17000,18000,19000,20000,21000,22000,23000,24000,25000,26000,27000,28000,29000,30000,31000,32000,33000,34000,35000,36000,37000,38000,39000,40000,41000,42000,44000,45000,46000,47000,48000,49000,50000,51000,53000,54000,55000,56000,91000,92000,93000,94000,95000,96000,97000,98000&7010=0&7036=-1&7001=1200&7002=1&7090=70&7007=2013,2012,2011,2010,2009,2008&7093=levels
- 
-	cluster_value_added = {
-
-		'state':				pd.DataFrame({
-				'region':		list(RegionDefinitions.get_ansi_from_state_abbrev_vec(state_value_added.index.get_level_values('state_abbrev'))),
-				'GDP':			list(pd.DataFrame(state_value_added)['GDP'])}).set_index('region'),
-
-		'midwest':			pd.DataFrame({
-				'region': 	['IA_DesMoines','IL_Chicago','IN_Indianapolis','MI_Detroit','MN_Minneapolis','MO_KansasCity','MO_StLouis','OH_ClevelandToledo','OH_ColumbusCinDayton','WI_MilwaukeeMadison','other'],
-				'GDP':			[65068.68213,579706.7034,161825.2696,302946.2192,295133.7253,134672.8864,168246.3702,247200.1528,292660.5778,179878.2114,13713813.2]}).set_index('region'),
-
-		'california':		pd.DataFrame({
-				'region':		['CentralCoast','CentralValley','InlandEmpire_Imperial','NorthCoast','SanJoaquinValley','Sierra','SouthCoast'],
-				'GDP':			[632021.960228302,134804.171149538,146530.897738201,12171.1753315384,143455.382534595,11504.7765050521,1045228.67534676]}).set_index('region')
-		}
-
-
-	# Assume that county-level value added per FTE is equal to the state value added 
-	# per FTE for county-level reanalysis (in Science submission)
-	
-	state_fte_by_county = county_fte_employment.groupby(county_fte_employment.index.values//1000).sum().loc[county_fte_employment.index.values//1000]
-	cluster_value_added['county'] = pd.DataFrame({
-		'region':  list(county_fte_employment.index.values),
-		'GDP':     list(((cluster_value_added['state'].loc[county_fte_employment.index//1000] * county_fte_employment.values)/state_fte_by_county.values).values[:,0])}).set_index('region')
-
-
-	#########################################
-	#  Mirrored tables calculated in excel  #
-	#########################################
-
-	#	identical values as labor_participation_tuples, copied from excel version of this worksheet. used to check above calculations.
-	offline_lab_validation_data = {
-				0		:	0.0,		1		:	0.0,		2		:	0.0,		3		:	0.0,		4		:	0.0,		5		:	0.0,		6		:	0.0,		7		:	0.0,		8		:	0.0,		9		:	0.0,
-				10	:	0.0,		11	:	0.0,		12	:	0.0,		13	:	0.0,		14	:	0.0,		15	:	0.0,		16	:	0.343,	17	:	0.343,	18	:	0.343,	19	:	0.343,
-				20	:	0.709,	21	:	0.709,	22	:	0.709,	23	:	0.709,	24	:	0.709,	25	:	0.817,	26	:	0.817,	27	:	0.817,	28	:	0.817,	29	:	0.817,
-				30	:	0.817,	31	:	0.817,	32	:	0.817,	33	:	0.817,	34	:	0.817,	35	:	0.826,	36	:	0.826,	37	:	0.826,	38	:	0.826,	39	:	0.826,
-				40	:	0.826,	41	:	0.826,	42	:	0.826,	43	:	0.826,	44	:	0.826,	45	:	0.802,	46	:	0.802,	47	:	0.802,	48	:	0.802,	49	:	0.802,
-				50	:	0.802,	51	:	0.802,	52	:	0.802,	53	:	0.802,	54	:	0.802,	55	:	0.725,	56	:	0.725,	57	:	0.725,	58	:	0.725,	59	:	0.725,
-				60	:	0.638,	61	:	0.638,	62	:	0.491,	63	:	0.491,	64	:	0.491,	65	:	0.321,	66	:	0.321,	67	:	0.321,	68	:	0.321,	69	:	0.321,
-				70	:	0.195,	71	:	0.195,	72	:	0.195,	73	:	0.195,	74	:	0.195,	75	:	0.114,	76	:	0.114,	77	:	0.114,	78	:	0.114,	79	:	0.114,
-				80	:	0.0,		81	:	0.0,		82	:	0.0,		83	:	0.0,		84	:	0.0,		85	:	0.0}
-
-	#	identical values as mortality_share_by_cohort, copied from excel version of this worksheet. used to check above calculations.
-	offline_mort_validation_data = pd.DataFrame({
-				'age':					[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85],
-				'0-0':					[1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-				'1-44':					[0,0.00707799,0.00707799,0.00707799,0.00707799,0.003372297,0.003372297,0.003372297,0.003372297,0.003372297,0.004356171,0.004356171,0.004356171,0.004356171,0.004356171,0.015508512,0.015508512,0.015508512,0.015508512,0.015508512,0.022830478,0.022830478,0.022830478,0.022830478,0.022830478,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.024666136,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0.049468938,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-				'45-64':				[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.039401837,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0.060598163,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-				'65-inf':				[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.023090251,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.037840798,0.390689511]
-						}, dtype='float64').set_index('age')
-
-	#	identical values as lost_participation_years, copied from excel version of this worksheet. used to check above calculations.
-	offline_lost_labor_data = pd.DataFrame({
-				'years_since_death':	[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85],
-				'0-0':								[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.343,0.343,0.343,0.343,0.709,0.709,0.709,0.709,0.709,0.817,0.817,0.817,0.817,0.817,0.817,0.817,0.817,0.817,0.817,0.826,0.826,0.826,0.826,0.826,0.826,0.826,0.826,0.826,0.826,0.802,0.802,0.802,0.802,0.802,0.802,0.802,0.802,0.802,0.802,0.725,0.725,0.725,0.725,0.725,0.638,0.638,0.491,0.491,0.491,0.321,0.321,0.321,0.321,0.321,0.195,0.195,0.195,0.195,0.195,0.114,0.114,0.114,0.114,0.114,0,0,0,0,0,0],
-				'1-44':								[0.712347482,0.724843449,0.733514164,0.742184878,0.750855592,0.759526307,0.763324492,0.766785209,0.770245925,0.773706641,0.777167358,0.775833162,0.775770018,0.775706875,0.775643731,0.775580588,0.769970024,0.76435946,0.751476962,0.738594464,0.723121422,0.701492375,0.679863329,0.658234282,0.636605236,0.614211767,0.587909927,0.561608088,0.53895226,0.516296433,0.493640605,0.471636623,0.449632641,0.427628659,0.405624677,0.383556993,0.359722109,0.335887226,0.312322184,0.288757143,0.265192101,0.245354953,0.225517805,0.206756986,0.187996167,0.16940522,0.156163831,0.142922442,0.131320447,0.119718453,0.108116458,0.099281876,0.090447294,0.081757341,0.073067389,0.064922442,0.058829897,0.052737352,0.04610007,0.039462789,0.033441292,0.02865184,0.024902852,0.021153864,0.017404876,0.014859146,0.01319756,0.011535974,0.009874387,0.008212801,0.007443041,0.006485282,0.005527523,0.004569764,0.003612005,0.003227563,0.002420673,0.001613782,0.000806891,0,0,0,0,0,0,0],
-				'45-64':							[0.702255424,0.674739824,0.647224225,0.619708626,0.592193026,0.564677427,0.53137054,0.498063652,0.467872625,0.437681597,0.40749057,0.379028408,0.350566246,0.322104084,0.293641922,0.26517976,0.235908105,0.206636449,0.183156863,0.159677278,0.136197692,0.121133322,0.106068951,0.09100458,0.075940209,0.060875838,0.05319248,0.045509122,0.037825764,0.030142405,0.022459047,0.017967238,0.013475428,0.008983619,0.004491809,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-				'65-inf':							[0.081142102,0.07204857,0.062955037,0.053861504,0.044767971,0.035674438,0.031171839,0.02666924,0.022166641,0.017664042,0.013161443,0.010529154,0.007896866,0.005264577,0.002632289,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
-						}, dtype='float64').set_index('years_since_death')
-
-	#	identical values as cohort_mortality_value, copied from excel version of this worksheet. used to check above calculations.
-	offline_cohort_mort_value = {
-			0.00:	pd.DataFrame({
-				'state_abbrev':	['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY'],
-				'0-0':					[4040494.366,7278242.589,4373461.556,4006646.433,5779739.818,4866284.068,5829738.39,6654943.97,5813281.947,4111639.811,4467756.428,4794315.282,3783643.234,4854794.044,4243803.756,4141156.116,4091251.232,3921980.222,5232812.039,3562771.911,5212166.652,5246109.362,4136821.531,4392129.2,3655376.76,4019910.203,3790338.915,4381343.246,4447367.132,4196312.939,5420825.498,4482219.662,5830895.577,4535592.188,4774367.128,4220749.798,4357906.995,5078900.318,4376953.95,4426853.795,3852948.504,4268567.217,4105078.176,5378220.855,4355396.888,3758577.313,4812208.499,5500272.039,3815591.664,3958319.602,5852253.449],
-				'1-44':					[2920234.363,5260290.494,3160883.684,2895771.045,4177259.833,3517067.137,4213395.894,4809806.499,4201502.134,2971654.153,3229034.534,3465052.284,2734597.3,3508762.816,3067174.567,2992986.822,2956918.474,2834579.231,3781972.24,2574964.353,3767050.955,3791582.772,2989854.036,3174375.572,2641893.752,2905357.326,2739436.55,3166580.112,3214298.337,3032850.966,3917857.435,3239487.719,4214232.241,3278062.277,3450634.918,3050512.506,3149641.752,3670733.799,3163407.784,3199472.49,2784687.12,3085072.156,2966911.784,3887065.276,3147827.593,2716481.111,3477984.46,3975276.775,2757687.768,2860843.222,4229668.469],
-				'45-64':				[972898.1988,1752505.625,1053072.343,964748.0591,1391685.756,1171737.559,1403724.759,1602423.47,1399762.262,990029.0913,1075777.315,1154408.416,911051.8053,1168970.911,1021852.441,997136.2315,985119.7883,944361.5428,1259992.7,857868.8794,1255021.561,1263194.522,996092.5203,1057567.268,880166.916,967941.8013,912664.0378,1054970.151,1070867.839,1010417.273,1305263.882,1079259.873,1404003.394,1092111.279,1149605.162,1016301.349,1049327.008,1222932.771,1053913.266,1065928.496,927739.608,1027815.158,988449.1354,1295005.241,1048722.607,905016.2595,1158716.869,1324393.57,918744.5695,953111.5903,1409146.09],
-				'65-inf':				[50658.71618,91252.80031,54833.37621,50234.33919,72464.94425,61012.26263,73091.81395,83438.03684,72885.48715,51550.72011,56015.62193,60109.93584,47438.38038,60868.20357,53207.75888,51920.78823,51295.09318,49172.81523,65607.69942,44669.15052,65348.85269,65774.41796,51866.44228,55067.42651,45830.20715,50400.63704,47522.32918,54932.19489,55759.98599,52612.3308,67964.96553,56196.95838,73106.32247,56866.12986,59859.83084,52918.71407,54638.35699,63677.99244,54877.16298,55502.79486,48307.31268,53518.23701,51468.45196,67430.79909,54606.88589,47124.11009,60334.27656,68961.04656,47838.94188,49628.42937,73374.10218]
-						}, dtype='float64').set_index('state_abbrev'),
-
-			0.03: pd.DataFrame({
-				'state_abbrev':	['AL','AK','AZ','AR','CA','CO','CT','DC','DE','FL','GA','HI','ID','IL','IN','IA','KS','KY','LA','ME','MD','MA','MI','MN','MS','MO','MT','NE','NV','NH','NJ','NM','NY','NC','ND','OH','OK','OR','PA','RI','SC','SD','TN','TX','UT','VT','VA','WA','WV','WI','WY'],
-				'0-0':					[1215708.024,2189884.978,1315891.528,1205523.824,1739013.951,1464172.463,1754057.572,2002346.26,1749106.141,1237114.337,1344263.065,1442518.422,1138426.396,1460715.333,1276879.959,1245995.233,1230979.801,1180049.369,1574453.769,1071970.409,1568241.964,1578454.681,1244691.039,1321508.268,1099833.45,1209514.64,1140440.999,1318262.979,1338128.312,1262590.874,1631023.448,1348614.777,1754405.748,1364673.556,1436516.401,1269943.46,1311211.456,1528144.655,1316942.323,1331956.239,1159279.036,1284330.814,1235140.066,1618204.52,1310456.213,1130884.536,1447902.151,1654927.404,1148039.072,1190983.198,1760831.926],
-				'1-44':					[1692784.134,3049253.992,1832282.305,1678603.383,2421449.203,2038752.617,2442396.34,2788120.102,2435501.836,1722590.853,1871787.586,2008600.955,1585175.143,2033938.817,1777961.56,1734956.848,1714048.962,1643132.075,2192311.235,1492640.062,2183661.753,2197882.212,1733140.853,1840103.203,1531437.3,1684160.302,1587980.33,1835584.377,1863245.394,1758065.059,2271080.359,1877847.026,2442881.149,1900207.697,2000243.582,1768302.995,1825765.649,2127829.195,1833745.46,1854651.235,1614210.912,1788336.328,1719841.825,2253230.943,1824714.028,1574673.657,2016097.402,2304364.861,1598560.088,1658356.63,2451829.13],
-				'45-64':				[745347.9633,1342613.749,806770.2533,739104.0521,1066185.697,897680.9742,1075408.908,1227634.167,1072373.197,758472.1277,824164.7809,884404.9285,697966.7641,895561.4153,782852.3442,763916.9857,754711.0569,723485.7188,965294.2046,657222.7422,961485.7606,967747.1552,763117.387,810213.8643,674305.5122,741550.813,699201.913,808224.1848,820403.5777,774091.7371,999976.9528,826832.8065,1075622.374,836678.4094,880725.1025,778599.5921,803900.9113,936902.1869,807414.4934,816619.4927,710751.4725,787420.4473,757261.7062,992117.6958,803437.8731,693342.8663,887705.6811,1014632.416,703860.275,730189.2259,1079562.25],
-				'65-inf':				[44115.48141,79466.30944,47750.92958,43745.91824,63105.15034,53131.73212,63651.05164,72660.92472,63471.37464,44892.27138,48780.47282,52345.95262,41311.09403,53006.28017,46335.28195,45214.54037,44669.662,42821.50397,57133.60823,38899.54637,56908.19494,57278.7929,45167.21391,47954.74922,39910.63738,43890.73656,41384.19974,47836.98453,48557.8556,45816.76118,59186.40265,48938.3873,63663.68619,49521.12655,52128.15194,46083.57105,47581.09963,55453.14811,47789.06071,48333.88406,42067.79237,46605.65778,44820.62924,58721.23077,47553.69344,41037.41585,52541.3168,60053.8268,41659.91778,43218.26959,63896.87865],
-						}, dtype='float64').set_index('state_abbrev')}
-
-
-	#########################################
-	#  Mirrored tables calculated elsewhere #
-	#########################################
-
-	#	cohort population calculated for the midwest regions directly, for comparison against the calculated totals
-	midwest_cluster_cohort_population = pd.DataFrame({
-		'region':		['IA_DesMoines','IL_Chicago','IN_Indianapolis','MI_Detroit','MN_Minneapolis','MO_KansasCity','MO_StLouis','OH_ClevelandToledo','OH_ColumbusCinDayton','WI_MilwaukeeMadison','Rest of US'],
-		'0-0':			[16367.07336,132574.8972,44149.95153,76546.98753,68495.74351,35028.09077,40516.46374,61579.48223,81158.8229,42856.72733,3344115.65],
-		'1-44':			[737286.9266,6298776.103,2073987.048,3844780.012,3129748.256,1583415.909,1916458.536,3007989.518,3776391.177,2032829.273,155568691.3],
-		'45-64':		[330852,2737645,901091,1921207,1460987,700911,937351,1585560,1744935,977976,69556425],
-		'65-inf':		[188158,1294657,456106,970743,722376,354743,491433,887752,872055,496072,36411261]}, dtype='float64').set_index('region')
-
-
+	#		Source tables, defined in sourcetables.py and loaded from the compiled artifact on first access
+
+	_tables = tablecache.TableArtifact(SOURCE_TABLE_ARTIFACT,SOURCE_TABLE_SOURCES,_build_source_tables)
+
+	LABOR_PARTICIPATION_DATA = tablecache.LazyTable(_tables,'LABOR_PARTICIPATION_DATA')
+	US_MORTALITY_DATA = tablecache.LazyTable(_tables,'US_MORTALITY_DATA')
+	cohort_population = tablecache.LazyTable(_tables,'cohort_population')
+	state_value_added = tablecache.LazyTable(_tables,'state_value_added')
+	state_fte_employment = tablecache.LazyTable(_tables,'state_fte_employment')
+	statePop = tablecache.LazyTable(_tables,'statePop')
+	county_cohort_population = tablecache.LazyTable(_tables,'county_cohort_population')
+	county_total_population = tablecache.LazyTable(_tables,'county_total_population')
+	county_fte_employment = tablecache.LazyTable(_tables,'county_fte_employment')
+	cluster_value_added = tablecache.LazyTable(_tables,'cluster_value_added')
+	state_fte_by_county = tablecache.LazyTable(_tables,'state_fte_by_county')
+	offline_lab_validation_data = tablecache.LazyTable(_tables,'offline_lab_validation_data')
+	offline_mort_validation_data = tablecache.LazyTable(_tables,'offline_mort_validation_data')
+	offline_lost_labor_data = tablecache.LazyTable(_tables,'offline_lost_labor_data')
+	offline_cohort_mort_value = tablecache.LazyTable(_tables,'offline_cohort_mort_value')
+	midwest_cluster_cohort_population = tablecache.LazyTable(_tables,'midwest_cluster_cohort_population')
 
 
 	@classmethod
@@ -0,0 +1,113 @@
+import numpy as np, pandas as pd, os, re, csv, zipfile
+
+#	Impact CSVs are parsed once and cached, so that runs with new discount rates or deflators
+#	never reparse them. Parsed columns are kept in memory for the life of the process, and
+#	written as arrays to CACHE_DIRNAME in the impact directory, keyed by each file's size and
+#	modification time. If the impact directory cannot be written to, only the memory cache is used.
+
+CACHE_DIRNAME = '.impactcache'
+
+_parsed = {}
+
+
+def read_impact_file(filepath,pattern=None,cache=True):
+#	Read an impact CSV as a DataFrame, parsing only the columns whose header matches pattern (all columns if None)
+#	The header is read from the same open file as the data, so each file is opened and read once.
+
+	filepath = os.path.abspath(filepath)
+	stat = os.stat(filepath)
+	key = (filepath,pattern)
+
+	if cache:
+		cached = _parsed.get(key)
+		if cached is None:
+			cached = _read_cache(filepath,pattern,stat)
+			if cached is not None:
+				_parsed[key] = cached
+
+		if cached is not None and cached[0] == (stat.st_size,stat.st_mtime):
+			return cached[1].copy()
+
+	with open(filepath,'r') as impactfile:
+		header = next(csv.reader([impactfile.readline()]))
+		usecols = [i for i, h in enumerate(header) if pattern is None or re.search(pattern,h)]
+		data = pd.read_csv(impactfile,header=None,names=[header[i] for i in usecols],usecols=usecols)
+
+	if cache:
+		_parsed[key] = ((stat.st_size,stat.st_mtime),data)
+		_write_cache(filepath,pattern,stat,data)
+		data = data.copy()
+
+	return data
+
+
+def _cache_path(filepath,pattern):
+	suffix = '' if pattern is None else '-' + re.sub(r'[^0-9a-zA-Z]+','_',pattern)
+	return os.path.join(os.path.dirname(filepath),CACHE_DIRNAME,os.path.basename(filepath) + suffix + '.npz')
+
+
+def _read_cache(filepath,pattern,stat):
+#	Return ((size, mtime), DataFrame) from the array cache, or None if it is missing or stale
+
+	cachefile = _cache_path(filepath,pattern)
+	if not os.path.exists(cachefile):
+		return None
+
+	#	A cache that cannot be read is a miss: the CSV is parsed again and the cache rewritten
+	try:
+		arrays = dict(np.load(cachefile))
+		if (int(arrays['size']),float(arrays['mtime'])) != (stat.st_size,stat.st_mtime):
+			return None
+
+		columns = arrays['columns'].tolist()
+		data = pd.DataFrame({i:_from_cache_array(arrays['col_{}'.format(i)]) for i in range(len(columns))},columns=range(len(columns)))
+
+	except (IOError,OSError,EOFError,KeyError,ValueError,zipfile.BadZipfile):
+		return None
+
+	data.columns = columns
+	return (stat.st_size,stat.st_mtime), data
+
+
+def _to_cache_array(values):
+#	Column values as an array that np.load reads without pickling: string columns are stored as fixed-width 
+#	strings. Returns None for object columns holding anything else (e.g. strings and missing values).
+
+	if values.dtype != object:
+		return values
+
+	if all(isinstance(v,str) for v in values):
+		return np.array(values,dtype=str)
+	if all(isinstance(v,unicode) for v in values):
+		return np.array(values,dtype=unicode)
+
+	return None
+
+
+def _from_cache_array(values):
+	return values.astype(object) if values.dtype.kind in 'SU' else values
+
+
+def _write_cache(filepath,pattern,stat,data):
+	cachefile = _cache_path(filepath,pattern)
+
+	try:
+		if not os.path.isdir(os.path.dirname(cachefile)):
+			os.makedirs(os.path.dirname(cachefile))
+
+		arrays = {'col_{}'.format(i):_to_cache_array(data.iloc[:,i].values) for i in range(data.shape[1])}
+		if any(values is None for values in arrays.values()):
+			return
+
+		#	Write to a temporary file unique to this process first, so a cache is never partial
+		tmpfile = '{}.{}.tmp'.format(cachefile,os.getpid())
+		try:
+			with open(tmpfile,'wb') as fp:
+				np.savez(fp,columns=np.array(list(data.columns)),size=stat.st_size,mtime=stat.st_mtime,**arrays)
+			os.rename(tmpfile,cachefile)
+		finally:
+			if os.path.exists(tmpfile):
+				os.remove(tmpfile)
+
+	except (IOError,OSError):
+		pass
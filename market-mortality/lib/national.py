@@ -1,11 +1,33 @@
-import numpy as np, pandas as pd
+import numpy as np, pandas as pd, os
 import data, config
+from regions import tablecache
+
+NATIONAL_TABLE_SOURCES = [
+	os.path.join(data.ROOT_DIR,'lib','national.py'),
+	os.path.join(data.ROOT_DIR,'lib','config.py'),
+	os.path.join(data.ROOT_DIR,'lib','sourcetables.py')]
+
+NATIONAL_TABLE_ARTIFACT = os.path.join(data.ROOT_DIR,'data','nationaltables.pkl')
+
+def _build_national_tables():
+	return NationalData.compute_tables()
 
 
 class NationalData(object):
 
 	config_data = config.ConfigData
 
+	#	National tables, computed and validated once from the source data, saved to NATIONAL_TABLE_ARTIFACT and 
+	#	shared by all StaticData instances. Recomputed when national.py, config.py or sourcetables.py change.
+
+	_tables = tablecache.TableArtifact(NATIONAL_TABLE_ARTIFACT,NATIONAL_TABLE_SOURCES,_build_national_tables)
+
+	labor_participation = tablecache.LazyTable(_tables,'labor_participation')
+	mortality_share_by_cohort = tablecache.LazyTable(_tables,'mortality_share_by_cohort')
+	lost_participation_years = tablecache.LazyTable(_tables,'lost_participation_years')
+
+	_npv = {}
+
 	@staticmethod
 	def _get_and_validate_labor_participation():
 	
@@ -24,75 +46,91 @@ class NationalData(object):
 	def _get_mortality():
 	#	Computes probability of death at each age given membership of each of the four impact data cohorts using US_MORTALITY_DATA, assuming a
 	#	uniform distribution of mortality within each cohort.
+	#	For example, p(death at 20 | death at 1-44) = p(death at 20-25) / (sum_(i=1-44) p(death at i)) / (5 years in range 20-25)
 
-		cohort_mortality_total = {}						#	Total mortality for each US_MORTALITY_DATA 5-year cohort
-		cohort_mortality_share_tuples = []		#	List of tuples of age, [p(mortality|c) for c in cohorts], to be converted to a DataFrame
+		def age_bounds(rng):
+		#	First and last+1 age in the age range rng
+			ages = config.ConfigData.get_age_range_from_cohort(rng)
+			return ages[0], ages[-1]+1
 
+		#	US_MORTALITY_DATA 5-year cohorts, sorted by first year, and mortality cohorts, in order of age
+		us_cohorts = sorted(data.SourceData.US_MORTALITY_DATA.keys(), key=lambda x: x[0])
+		us_mortality = np.array([data.SourceData.US_MORTALITY_DATA[c] for c in us_cohorts],dtype='float64')
+		us_bounds = np.array([age_bounds(c) for c in us_cohorts])
+		mort_bounds = np.array([age_bounds(c) for c in config.ConfigData.mort_cohort_tuples])
 
-		#	CALCULATE TOTAL MORTALITY BY IMPACT COHORT (0-0, 1-44, 45-64, 65-inf)
-		# ---------------------------------------------------------------------
+		#	[us_cohort x mort_cohort] indicator of each US data cohort lying within each mortality cohort
+		within = (us_bounds[:,np.newaxis,0] >= mort_bounds[np.newaxis,:,0]) & (us_bounds[:,np.newaxis,1] <= mort_bounds[np.newaxis,:,1])
 
-		#	Loop through mortality cohort, cohort age range pairs, sorted by cohort list (in order of age)
-		for cohort, rng in sorted(config.ConfigData.get_mort_cohort_tuple.items(), key = lambda x: config.ConfigData.mort_cohort_names.index(x[0])):
+		#	Total mortality by impact cohort (0-0, 1-44, 45-64, 65-inf)
+		cohort_mortality_total = (us_mortality[:,np.newaxis] * within).sum(axis=0)
 
-			#	Create a set that enumerates the ages within each cohort
-			mort_set = set(config.ConfigData.get_age_range_from_cohort(rng))
+		#	Share of total cohort mortality occurring at each single year of age, spread uniformly within each US data cohort
+		us_years = us_bounds[:,1] - us_bounds[:,0]
+		mort_share = np.where(within, us_mortality[:,np.newaxis] / cohort_mortality_total[np.newaxis,:] / us_years[:,np.newaxis], 0)
 
-			#	Calculate cohort mortality totals by adding all data.SourceData.US_MORTALITY_DATA for which the age range is within mort_set
-			cohort_mortality_total[rng] = 0
-			for us_data_cohort in sorted(data.SourceData.US_MORTALITY_DATA.keys(), key=lambda x: x[0]):	#	Sort by first year in each 5-year age cohort range
-				if set(config.ConfigData.get_age_range_from_cohort(us_data_cohort)) <= mort_set:
-					cohort_mortality_total[rng] += data.SourceData.US_MORTALITY_DATA[us_data_cohort]
+		#	Repeat each US data cohort's row for every age it contains
+		ages = np.concatenate([np.arange(*bounds) for bounds in us_bounds])
+		mortality_share_by_cohort = pd.DataFrame(mort_share[np.repeat(np.arange(len(us_cohorts)),us_years)],columns=config.ConfigData.mort_cohort_names,index=pd.Index(ages,name='age'))
+		return mortality_share_by_cohort
 
 
-		#	DIVIDE MORTALITY AT EACH SINGLE YEAR OF AGE BY TOTAL MORTALITY FOR IMPACT COHORT TO ARRIVE AT P(death at age|cohort)
-		#	--------------------------------------------------------------------------------------------------------------------
+	@classmethod
+	def get_lost_participation_years(cls,labor_participation,mortality_share_by_cohort):
 
-		#	Calculate share of total cohort mortality occurring at each age
-		for us_data_cohort in sorted(data.SourceData.US_MORTALITY_DATA.keys(), key=lambda x: x[0]):	#	Sort by first year in each 5-year age cohort range
-			rng = config.ConfigData.get_mort_cohort_by_age(config.ConfigData.get_age_range_from_cohort(us_data_cohort)[0])
-			cohort_ages = config.ConfigData.get_age_range_from_cohort(us_data_cohort)
+		#	Lost participation-years is the expected number of participation-years that would have been worked by a person at every year after death given a death in 
+		#	each cohort, assuming they would live to 80, but accounting for actual labor-force participation rates at each year of age
+		max_age = cls.config_data.max_age
+		years_since_death = labor_participation.index.values
 
-			#	Probability of mortality at a specific age given a death within each cohort
-			#	For example, p(death at 20 | death at 1-44) = p(death at 20-25) / (sum_(i=1-44) p(death at i)) / (5 years in range 20-25)
-			mort_value = [np.float64(data.SourceData.US_MORTALITY_DATA[us_data_cohort])/cohort_mortality_total[rng]/len(cohort_ages) 
-															if set(config.ConfigData.get_age_range_from_cohort(us_data_cohort)) <= set(config.ConfigData.get_age_range_from_cohort(rng)) else 0 
-															for rng in config.ConfigData.mort_cohort_tuples]
+		#	Shift matrix of participation rates: row s holds labor_participation shifted by s years (zero past the last age), 
+		#	so that the expected lost labor for every years_since_death is a single product with mortality_share_by_cohort
+		offsets = years_since_death[:,np.newaxis] + np.arange(max_age)[np.newaxis,:]
+		shifted_participation = labor_participation['rate'].reindex(range(offsets.max()+1),fill_value=0).values[offsets]
 
-			#	Build data frame structure out of tuples of age and probability of mortality in each cohort
-			cohort_mortality_share_tuples.extend([tuple([a] + mort_value) for a in cohort_ages])
+		expected_lost_labor = shifted_participation.dot(mortality_share_by_cohort.reindex(range(max_age),fill_value=0).values)
 
+		lost_participation_years = pd.DataFrame(expected_lost_labor,columns=cls.config_data.mort_cohort_names,index=pd.Index(years_since_death,name='years_since_death'))
+		return lost_participation_years
 
-		#	CONVERT LIST cohort_mortality_share_tuples TO pandas.DataFrame
-		# --------------------------------------------------------------
 
-		#	Convert data to pandas.DataFrame, indexed by age and mort_cohort
-		mortality_share_by_cohort = pd.DataFrame(cohort_mortality_share_tuples,columns=(['age'] + config.ConfigData.mort_cohort_names)).set_index('age')
-		return mortality_share_by_cohort
+	@classmethod
+	def compute_tables(cls):
+	#	Compute and validate the national tables stored in the artifact
+		labor_participation = cls._get_and_validate_labor_participation()
+
+		mortality_share_by_cohort = cls._get_mortality()
+		data.SourceData.validate_mortality_share_by_cohort(mortality_share_by_cohort)
+
+		lost_participation_years = cls.get_lost_participation_years(labor_participation,mortality_share_by_cohort)
+		data.SourceData.validate_lost_labor_participation(lost_participation_years)
+
+		return {
+			'labor_participation':				labor_participation,
+			'mortality_share_by_cohort':	mortality_share_by_cohort,
+			'lost_participation_years':		lost_participation_years}
 
 
 	@classmethod
-	def get_lost_participation_years(cls,labor_participation,mortality_share_by_cohort):
+	def get_discount_factors(cls,discount_rates):
+	#	[discount_rate x year] divisors applied by np.npv, with year 0 undiscounted
+		return (1 + np.asarray(discount_rates,dtype='float64')[:,np.newaxis]) ** np.arange(cls.config_data.max_age+1)
 
-		#	Lost participation-years is the expected number of participation-years that would have been worked by a person at every year after death given a death in 
-		#	each cohort, assuming they would live to 80, but accounting for actual labor-force participation rates at each year of agse
-		lost_participation_years = []
-		for years_since_death in labor_participation.index:
-			
-			#	Produce an 86x1 column vector identical to labor_participation but shifted by years_since_death
-			lost_labor = labor_participation.reindex(range(years_since_death,years_since_death+cls.config_data.max_age),fill_value=0)
-			lost_labor.index = range(cls.config_data.max_age)
-
-			#	Matrix multiply mortality_share_by_cohort.T by lost_labor
-			#	This results in a column vector of expected remaining working years given years_since_death
-			expected_lost_labor = mortality_share_by_cohort.T.dot(lost_labor)
-
-			#	Convert to row vector and remove vertical dimension (no actual summing involved)
-			expected_lost_labor = expected_lost_labor.T.sum()
-
-			lost_participation_years.append(tuple([years_since_death]+list(expected_lost_labor)))
-
-		lost_participation_years = pd.DataFrame(lost_participation_years)
-		lost_participation_years.columns = ['years_since_death'] + cls.config_data.mort_cohort_names
-		lost_participation_years = lost_participation_years.set_index('years_since_death')
-		return lost_participation_years
\ No newline at end of file
+
+	@classmethod
+	def get_lost_participation_npv(cls,discount_rates):
+	#	NPV of lost_participation_years for each cohort, assuming deaths occur at end of year, as a [discount_rate x cohort] array.
+	#	Memoized for each set of discount rates.
+
+		key = tuple(discount_rates)
+		if key not in cls._npv:
+
+			#	Shift lost_participation_years by 1 year to take NPV assuming deaths occur at end of year
+			shifted_lost_participation = cls.lost_participation_years.copy()
+			shifted_lost_participation.index = shifted_lost_participation.index + 1
+			shifted_lost_participation = shifted_lost_participation.reindex(range(cls.config_data.max_age+1),fill_value=0)
+
+			discount_factors = cls.get_discount_factors(discount_rates)
+			cls._npv[key] = (shifted_lost_participation.values[np.newaxis,:,:] / discount_factors[:,:,np.newaxis]).sum(axis=1)
+
+		return cls._npv[key]
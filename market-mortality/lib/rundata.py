@@ -0,0 +1,52 @@
+import pandas as pd, numpy as np, os
+import config
+
+
+class ImpactDirectoryReader(object):
+#	Finds and reads the impact runs in readdir, one for each rcp and time period. Subclasses set
+#	scenario_class to the MortRun class of their aggregation and add any of its extra arguments to run_args.
+
+	scenario_class	= None
+
+	def __init__(self,readdir):
+
+		self.config_data	= config.ConfigData
+		
+		self.impactfiles	= None
+		self.readdir			= readdir
+		self.run_args			= {}
+
+	def get_impact_run(self):
+
+		if self.impactfiles is None:
+			self.search_for_impactfiles()
+
+		for rcp in self.config_data.rcps:
+			for tp in self.config_data.tps:
+				yield rcp, tp, self.get_run(rcp,tp)
+
+	def get_run(self,rcp,tp):
+	#	Read the impact data for one rcp and time period
+		self.validate_impact_files(rcp,tp)
+		r = self.scenario_class(self.readdir,rcp,tp,**self.run_args)
+		r.read_data()
+		return r
+
+	def search_for_impactfiles(self):
+	#	retrieve list of files in mort_dir
+		self.impactfiles = os.listdir(self.readdir)
+
+	def validate_impact_files(self,rcp,tp):
+		if self.impactfiles is None:
+			self.search_for_impactfiles()
+
+		missing = []
+		for cohort in self.config_data.mort_cohort_names:
+			filename = 'health-mortage-{c}-{r}-{y}b.csv'.format(c=cohort,r=rcp,y=tp)
+			if not filename in self.impactfiles:
+				missing.append(filename)
+
+		if len(missing) > 0:
+			raise OSError('files missing from impactdir for scenario {s} {t}:\n\t{f}'.format(s=rcp,t=tp,f='\n\t'.join(missing)))
+
+		return True
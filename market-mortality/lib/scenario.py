@@ -0,0 +1,45 @@
+import pandas as pd, numpy as np, os
+import config, impactfiles
+
+
+class MortRun(object):
+
+	#	Impact columns read from each file (all columns if None), and the name of the region axis of mort_data
+	IMPACT_COLUMNS = None
+	REGION_INDEX = 'region'
+
+	def __init__(self,filepath,rcp='rcp85',tp='2080'):
+		
+		self.config_data	=	config.ConfigData
+
+		self.rcp					=	rcp
+		self.tp						=	tp
+		self.filepath			=	filepath
+
+	def format_cohort_data(self,cohort_data):
+	#	Return the data read from one cohort's impact file, with its region column named REGION_INDEX
+		return cohort_data
+
+	def read_data(self):
+		data = []
+		for cohort in self.config_data.mort_cohort_names:
+			
+			#	Read the impact columns, from the impact file cache if it is up to date
+			filename = 'health-mortage-{c}-{r}-{y}b.csv'.format(c=cohort,r=self.rcp,y=self.tp)
+			cohort_data = self.format_cohort_data(impactfiles.read_impact_file(os.path.join(self.filepath,filename),self.IMPACT_COLUMNS))
+
+			#	Add cohort column
+			cohort_data['cohort'] = [cohort for _ in cohort_data.index]
+			
+			#	Set region as primary axis, cohort secondary axis, and sort by region>cohort
+			cohort_data.set_index([self.REGION_INDEX,'cohort'],inplace=True)
+			cohort_data.sortlevel(inplace=True)
+
+			#	Set cohort as primary axis, preserving sort by region
+			cohort_data.index = cohort_data.index.swaplevel(1,0)
+
+			#	Add formatted DataFrame to list of data indexed by cohort
+			data.append(cohort_data)
+
+		#	Concatenate dataframes along cohort axis
+		self.mort_data = pd.concat(data)
@@ -0,0 +1,94 @@
+import os, types, hashlib, cPickle
+
+#	Lazily loaded lookup tables
+#
+#	Tables written as large literals (or read from data files) are slow to build at import time. A
+#	TableArtifact builds them once from their canonical definitions and saves them as a binary pickle,
+#	keyed by a hash of the definition files. The tables are read from the artifact the first time any
+#	LazyTable attribute is accessed, and rebuilt automatically whenever a definition file changes. If
+#	the artifact cannot be written, the tables are built from the definitions once per process.
+
+
+class TableArtifact(object):
+
+	def __init__(self,artifact,sources,build):
+	#	artifact:	path of the pickle holding the compiled tables
+	#	sources:	paths of the files defining the tables. A change to any of these rebuilds the artifact.
+	#	build:		function returning the tables as a dictionary of {name: table}
+
+		self.artifact = artifact
+		self.sources = sources
+		self.build = build
+		self._tables = None
+
+	def source_hash(self):
+		md5 = hashlib.md5()
+		for source in self.sources:
+			with open(source,'rb') as fp:
+				md5.update(fp.read())
+		return md5.hexdigest()
+
+	def load(self):
+		if self._tables is None:
+			key = self.source_hash()
+			tables = self._read(key)
+
+			if tables is None:
+				tables = self.build()
+				self._write(key,tables)
+
+			self._tables = tables
+
+		return self._tables
+
+	def _read(self,key):
+	#	Return the tables stored in the artifact, or None if it is missing, stale or unreadable
+
+		if not os.path.exists(self.artifact):
+			return None
+
+		try:
+			with open(self.artifact,'rb') as fp:
+				if cPickle.load(fp) != key:
+					return None
+				return cPickle.load(fp)
+
+		except (EOFError,ImportError,AttributeError,ValueError,TypeError,cPickle.UnpicklingError):
+			return None
+
+	def _write(self,key,tables):
+		#	Write to a temporary file unique to this process first, so an artifact is never partial
+		tmpfile = '{}.{}.tmp'.format(self.artifact,os.getpid())
+		try:
+			try:
+				with open(tmpfile,'wb') as fp:
+					cPickle.dump(key,fp,cPickle.HIGHEST_PROTOCOL)
+					cPickle.dump(tables,fp,cPickle.HIGHEST_PROTOCOL)
+				os.rename(tmpfile,self.artifact)
+			finally:
+				if os.path.exists(tmpfile):
+					os.remove(tmpfile)
+
+		except (IOError,OSError):
+			pass
+
+
+class LazyTable(object):
+#	Class attribute returning the table name from a TableArtifact, which is loaded on first access
+
+	def __init__(self,artifact,name):
+		self.artifact = artifact
+		self.name = name
+
+	def __get__(self,instance,owner):
+		return self.artifact.load()[self.name]
+
+
+def module_tables(module):
+#	Public attributes of a definitions module, excluding the modules and classes it imports
+	tables = {}
+	for name in dir(module):
+		value = getattr(module,name)
+		if not (name.startswith('_') or isinstance(value,(types.ModuleType,type))):
+			tables[name] = value
+	return tables
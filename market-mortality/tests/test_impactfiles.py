@@ -0,0 +1,68 @@
+import os, sys, shutil, tempfile, subprocess, unittest
+import numpy as np
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib import impactfiles
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#	Read an impact file in a new process, printing the parsed frame
+READ_SCRIPT = '''
+import sys
+sys.path.insert(0,sys.argv[1])
+from lib import impactfiles
+data = impactfiles.read_impact_file(sys.argv[2],pattern=sys.argv[3] or None)
+print(repr(data.to_dict()))
+print(repr([str(dtype) for dtype in data.dtypes]))
+'''
+
+
+class ImpactCacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.tmpdir = tempfile.mkdtemp()
+		self.filepath = os.path.join(self.tmpdir,'health-mortage-0-0-state.csv')
+		with open(self.filepath,'w') as fp:
+			fp.write('region,state,q0.5,q0.83\n')
+			fp.write('AL,Alabama,0.25,1.5\n')
+			fp.write('AK,Alaska,-0.75,2.0\n')
+
+	def tearDown(self):
+		shutil.rmtree(self.tmpdir)
+
+	def read_in_process(self,pattern=''):
+		return subprocess.check_output([sys.executable,'-c',READ_SCRIPT,ROOT_DIR,self.filepath,pattern])
+
+	def test_string_columns_read_from_separate_processes(self):
+		first = self.read_in_process()
+		cachefile = impactfiles._cache_path(os.path.abspath(self.filepath),None)
+		self.assertTrue(os.path.exists(cachefile))
+
+		second = self.read_in_process()
+		self.assertEqual(first,second)
+
+	def test_pattern_cache_read_from_separate_processes(self):
+		self.assertEqual(self.read_in_process(r'^q'),self.read_in_process(r'^q'))
+
+	def test_unreadable_cache_is_parsed_again(self):
+		expected = self.read_in_process()
+		cachefile = impactfiles._cache_path(os.path.abspath(self.filepath),None)
+		with open(cachefile,'wb') as fp:
+			fp.write('not a zip file')
+
+		self.assertEqual(self.read_in_process(),expected)
+
+	def test_cache_matches_parsed_file(self):
+		parsed = impactfiles.read_impact_file(self.filepath,cache=False)
+		impactfiles.read_impact_file(self.filepath)
+		impactfiles._parsed.clear()
+		cached = impactfiles.read_impact_file(self.filepath)
+
+		self.assertEqual(list(cached.columns),list(parsed.columns))
+		self.assertEqual(list(cached.dtypes),list(parsed.dtypes))
+		self.assertEqual(list(cached['state']),list(parsed['state']))
+		np.testing.assert_array_equal(cached['q0.5'].values,parsed['q0.5'].values)
+
+
+if __name__ == '__main__':
+	unittest.main()
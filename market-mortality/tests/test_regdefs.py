@@ -0,0 +1,91 @@
+import os, sys, unittest
+import numpy as np, pandas as pd
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from regions.regdefs import RegionDefinitions
+
+
+class AggregateSumTest(unittest.TestCase):
+#	aggregate_sum against the aggregate_dataframe(...).sum(level='region') it replaces
+
+	def setUp(self):
+		rs = np.random.RandomState(0)
+		counties = rs.choice(sorted(RegionDefinitions.ANSI),2000)
+		self.data = pd.DataFrame({'count':rs.randint(0,100,len(counties)),'value':rs.normal(size=len(counties))},index=pd.Index(counties,name='county'),columns=['count','value'])
+		self.data.iloc[:10,1] = np.nan
+
+	def test_matches_sum_by_level(self):
+		for agglev in ['county','state','midwest','california','national']:
+			expected = RegionDefinitions.aggregate_dataframe(self.data,agglev=agglev,sort=False).sum(level='region').sort_index()
+			summed = RegionDefinitions.aggregate_sum(self.data,agglev=agglev)
+
+			self.assertEqual(list(summed.index.names),['region'])
+			self.assertTrue(summed.index.equals(expected.index),agglev)
+			self.assertEqual(list(summed.dtypes),list(expected.dtypes))
+			np.testing.assert_allclose(summed.values,expected.values,rtol=1e-12)
+
+	def test_all_missing_region_sums_to_zero(self):
+		data = self.data.copy()
+		data.loc[RegionDefinitions.get_state_from_county_vec(data.index.values) == 1,'value'] = np.nan
+
+		summed = RegionDefinitions.aggregate_sum(data,agglev='state')
+		self.assertEqual(summed.loc[1,'value'],0)
+
+
+class WeightedAverageTest(unittest.TestCase):
+#	weighted_avg against a groupby of the weighted values and weights
+
+	def setUp(self):
+		rs = np.random.RandomState(1)
+		size = 500
+		self.data = pd.DataFrame({
+			'state'		:	rs.randint(0,5,size),
+			'cohort'	:	rs.choice(['a','b','c'],size),
+			'weight'	:	rs.randint(1,10,size).astype(float),
+			'x'				:	rs.normal(size=size),
+			'y'				:	rs.normal(size=size)},columns=['state','cohort','weight','x','y'])
+		self.data.iloc[:20,3] = np.nan
+
+	@staticmethod
+	def expected(data,by=None,level=None,weights=None):
+		weights = data['weight'] if weights is None else pd.Series(weights,index=data.index)
+		weighted = data[['x','y']].mul(weights,axis=0)
+		return weighted.groupby(by=by,level=level).sum().div(weights.groupby(by=by,level=level).sum(),axis=0)
+
+	def check(self,averages,expected):
+		self.assertEqual(list(averages.index.names),list(expected.index.names))
+		self.assertTrue(averages.index.equals(expected.index))
+		np.testing.assert_allclose(averages[['x','y']].values,expected[['x','y']].values,rtol=1e-12)
+
+	def test_group_by_column(self):
+		averages = RegionDefinitions.weighted_avg(self.data,['x','y'],group_by='state',weight_col='weight')
+		self.check(averages,self.expected(self.data,self.data['state']))
+
+	def test_group_by_columns(self):
+		averages = RegionDefinitions.weighted_avg(self.data,['x','y'],group_by=['state','cohort'],weight_col='weight')
+		self.check(averages,self.expected(self.data,[self.data['state'],self.data['cohort']]))
+
+	def test_group_by_function(self):
+		data = self.data.set_index('state')
+		averages = RegionDefinitions.weighted_avg(data,['x','y'],group_by=lambda state: state % 2,weight_col='weight')
+		self.check(averages,self.expected(data,lambda state: state % 2))
+
+	def test_group_index(self):
+		data = self.data.set_index(['state','cohort'])
+		averages = RegionDefinitions.weighted_avg(data,['x','y'],group_index='state',weight_col='weight')
+		self.check(averages,self.expected(data,level='state'))
+
+	def test_group_index_levels(self):
+		data = self.data.set_index(['state','cohort'])
+		averages = RegionDefinitions.weighted_avg(data,['x','y'],group_index=['state','cohort'],weight_col='weight')
+		self.assertEqual(list(averages.index.names),['state','cohort'])
+		self.check(averages,self.expected(data,level=['state','cohort']))
+
+	def test_weight_index_and_function(self):
+		data = self.data.set_index(['state','weight'])
+		averages = RegionDefinitions.weighted_avg(data,['x','y'],group_index='state',weight_index='weight',weight_func=np.sqrt)
+		self.check(averages,self.expected(data,level='state',weights=np.sqrt(data.index.get_level_values('weight').values)))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -1,6 +1,7 @@
 
-import shutil, subprocess, csv, os, re, tarfile
-import pandas as pd
+import shutil, subprocess, csv, os, re, tarfile, multiprocessing
+from contextlib import closing
+import numpy as np
 import writegams
 
 class ImpactHandler(object):
@@ -30,56 +31,106 @@ class ImpactHandler(object):
 		prfxmatch = re.search(r'(?P<origprefix>[a-zA-Z\-0-9_]+(?=\.))',filepath)
 		self.origprefix = prfxmatch.group('origprefix')
 
+IMPACT_COLUMNS = ('relative','addlrate','fraction')
+
+#	First year of the model. Tarfile impacts are relative to this year, and earlier years are dropped.
+BASE_YEAR = 2011
+
+
+def read_state_csv(text, filename=''):
+	'''
+	Parse the year and first impact column of a state impact CSV
+
+	A minimal parser for the numeric files in impact tarballs: returns arrays 
+	of years and values, with NaN for empty values.
+	'''
+
+	lines = text.splitlines()
+	header = lines[0].strip().split(',')
+
+	assert header[0].upper() == 'YEAR', 'Index {} in {} not recognized'.format(header[0], filename)
+	assert header[1] in IMPACT_COLUMNS, 'Column 0: {} in {} not recognized'.format(header[1], filename)
+
+	years = []
+	values = []
+	for line in lines[1:]:
+		if not line.strip():
+			continue
+		fields = line.split(',', 2)
+		years.append(int(fields[0]))
+		values.append(float(fields[1]) if fields[1].strip() else np.nan)
+
+	return np.array(years, dtype=int), np.array(values, dtype=np.float64)
+
+
 class Tarfile(ImpactHandler):
 	def __init__(self, *args, **kwargs):
 		ImpactHandler.__init__(self, *args, **kwargs)
 
 	@staticmethod
-	def operator(df):
-		''' Generic operator intended to be overloaded '''
-		raise NotImplemented('Tarfile operator not implemented. Use through subclasses TarSubtractor or TarDivider')
+	def operator(values, base):
+		''' Generic operator intended to be overloaded: values [state x year] relative to base [state] '''
+		raise NotImplementedError('Tarfile operator not implemented. Use through subclasses TarSubtractor or TarDivider')
 
-	def run(self, remove=False, thread=1):
+	def read(self):
+		'''
+		Read the state CSVs of the tarball into a [state x year] array
 
-		tarball = tarfile.open(self.filepath, 'r:gz')
-		data = {}
+		Returns (states, years, values, found), where found marks the (state, 
+		year) values present in the tarball.
+		'''
 
 		parser = re.search(r'^(?P<impact>[^.]+)\.tar\.gz$', os.path.basename(self.filepath))
 		assert parser is not None, 'File name not understood: {}'.format(self.filepath)
 		fileprefix = parser.group('impact')
-		assert fileprefix in tarball.getnames(), "{} not found in {} - {}".format(fileprefix, self.filepath, tarball.getnames())
 
-		for state_file in tarball:
-			if state_file.name == fileprefix:
-				assert state_file.isdir(), "What? I really thought this would be a directory... I dunno, ask James?"
-				continue
+		state_data = {}
+
+		with closing(tarfile.open(self.filepath, 'r:gz')) as tarball:
+			members = tarball.getmembers()
+			assert fileprefix in [m.name for m in members], "{} not found in {} - {}".format(fileprefix, self.filepath, tarball.getnames())
+
+			for state_file in members:
+				if state_file.name == fileprefix:
+					assert state_file.isdir(), "What? I really thought this would be a directory... I dunno, ask James?"
+					continue
+
+				assert state_file.isfile(), "Unexpected file type found: {}".format(state_file.name)
 
-			assert state_file.isfile(), "Unexpected file type found: {}".format(state_file.name)
-			
-			parser = re.search(r'^{}/(?P<state>[0-9]{{2}}).csv$'.format(re.escape(fileprefix)), state_file.name)
-			assert parser is not None, "Impact TarFile {} contains unexpected file: {}".format(self.filepath, state_file.name)
-			state = int(parser.group('state'))
+				parser = re.search(r'^{}/(?P<state>[0-9]{{2}}).csv$'.format(re.escape(fileprefix)), state_file.name)
+				assert parser is not None, "Impact TarFile {} contains unexpected file: {}".format(self.filepath, state_file.name)
 
-			st_data = pd.read_csv(tarball.extractfile(state_file), index_col=[0])
+				state_data[int(parser.group('state'))] = read_state_csv(tarball.extractfile(state_file).read(), '{}:{}'.format(self.filepath, state_file.name))
 
-			# convert index name to uppercase			
-			assert st_data.index.names[0].upper() == 'YEAR'
-			st_data.index.names = ['years']
+		states = sorted(state_data)
+		years = np.unique(np.concatenate([state_data[st][0] for st in states]))
 
-			st_data = self.operator(st_data)
+		values = np.full((len(states), len(years)), np.nan)
+		found = np.zeros(values.shape, dtype=bool)
 
-			assert st_data.columns[0] in ('relative','addlrate','fraction'), 'Column 0: {} in {}:{} not recognized'.format(st_data.columns[0], self.filepath, state_file.name)
-			
-			st_data = st_data[st_data.index.get_level_values('years') >= 2011]
-			data[state] = st_data[st_data.columns[0]]
+		for i, st in enumerate(states):
+			cols = np.searchsorted(years, state_data[st][0])
+			values[i, cols] = state_data[st][1]
+			found[i, cols] = True
 
-		data = pd.concat(data, axis=0, names=['rg'])
+		return states, years, values, found
+
+	def run(self, remove=False, thread=1):
+
+		states, years, values, found = self.read()
+
+		base = np.searchsorted(years, BASE_YEAR)
+		assert base < len(years) and years[base] == BASE_YEAR and found[:, base].all(), 'Year {} missing from states in {}'.format(BASE_YEAR, self.filepath)
+
+		values = self.operator(values, values[:, base])[:, base:]
+		found = found[:, base:]
+		years = years[base:]
 
 		gdx = writegams.PyGDX()
 
-		states = gdx.add_set('rg',sorted(data.index.get_level_values('rg').unique()), 'Regions in the data')
-		years  = gdx.add_set('years',sorted(data.index.get_level_values('years').unique()), 'Years in the data')
-		gdx.dataframe_to_param(self.impact_type, data, explanatory_text='Impact data for impact type {} (\% change from 2011)'.format(self.impact_type), domain=[states, years])
+		rg = gdx.add_set('rg', states, 'Regions in the data')
+		tp = gdx.add_set('years', years, 'Years in the data')
+		gdx.array_to_param(self.impact_type, [rg, tp], [states, years], values, explanatory_text='Impact data for impact type {} (\% change from 2011)'.format(self.impact_type), mask=found)
 
 		dest = os.path.join(self.output_dir, self.std_prefix + '.gdx')
 		gdx.export(dest)
@@ -96,8 +147,8 @@ class TarDivider(Tarfile):
 		self.action_type = 'divide'
 
 	@staticmethod
-	def operator(df):
-		return df / df.loc[2011]
+	def operator(values, base):
+		return values / base[:, np.newaxis]
 
 
 class TarSubtractor(Tarfile):
@@ -106,8 +157,8 @@ class TarSubtractor(Tarfile):
 		self.action_type = 'subtract'
 
 	@staticmethod
-	def operator(df):
-		return df - df.loc[2011]
+	def operator(values, base):
+		return values - base[:, np.newaxis]
 
 
 class GamsFile(ImpactHandler):
@@ -124,4 +175,30 @@ class GDXFile(ImpactHandler):
 	def run(self, remove=False, thread=1):
 		dest = os.path.join(self.output_dir, self.std_prefix + '.gdx')
 		shutil.copy(self.filepath, dest)
-		return dest
\ No newline at end of file
+		return dest
+
+
+def _run_handler(handler):
+	return handler.run()
+
+def start_pool(processes=None):
+	'''
+	Start a pool of processes (default: one per CPU) for run_handlers, or return None for processes=1
+
+	Start the pool before any threads are started: processes forked while 
+	other threads hold locks can deadlock.
+	'''
+
+	if processes == 1:
+		return None
+	return multiprocessing.Pool(processes)
+
+def run_handlers(handlers, pool=None):
+	'''
+	Run each of handlers in pool (from start_pool), or in this process if pool is None; returns their destination files, in order
+	'''
+
+	if pool is None or len(handlers) < 2:
+		return [handler.run() for handler in handlers]
+
+	return pool.map(_run_handler, handlers)
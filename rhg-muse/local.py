@@ -27,9 +27,9 @@ from Queue import Queue as JoinableQueue
 import Queue as QueueModule
 
 
-import re, shutil, os, argparse, sys, time, threading, hashlib, base64
+import re, shutil, os, argparse, sys, time, threading, hashlib, base64, multiprocessing
 import subprocess, traceback
-import parse, utils
+import parse, utils, impact_handler
 
 try:
     from subprocess import DEVNULL # py3k
@@ -47,9 +47,11 @@ DEFAULT_ECON_DIR = 'pmed'
 DEFAULT_ENERGY_DIR = 'energy'
 DEFAULT_COASTAL_DIR = 'slr'
 DEFAULT_HASH_DIR = 'cache'
+HASH_INDEX_DIR = '.index'
 DEFAULT_TMP_DIR = 'impacts'
 DEFAULT_RESULTS_DIR = 'results'
 DEFAULT_TRDBAL_DATASET = 'NCA'
+DEFAULT_IMPACT_WORKERS = 1      #   Processes converting the impacts of a run (1: convert in the running process)
 
 class Config(object):
     def __init__(self, **kwargs):
@@ -60,6 +62,8 @@ class Config(object):
         self.tmpdir  = DEFAULT_TMP_DIR
         self.results = DEFAULT_RESULTS_DIR
         self.dataset = DEFAULT_TRDBAL_DATASET
+        self.impact_workers = DEFAULT_IMPACT_WORKERS
+        self.impact_pool    = None  #   Pool of impact_workers processes, started by main()
 
         self.debug   = False
 
@@ -148,7 +152,26 @@ def main():
     default_dataset = 'NCA'
 
     args = getArguments(default_dataset)
-    config = Config(debug=args.debug, dataset=args.dataset)
+
+    #   By default, convert impacts on the CPUs not running GAMS threads
+    impact_workers = args.impact_workers
+    if impact_workers is None:
+        impact_workers = max(1, multiprocessing.cpu_count() - (args.threads if args.threaded else 0))
+
+    config = Config(debug=args.debug, dataset=args.dataset, impact_workers=impact_workers)
+
+    #   One pool for every run, started before the GAMS worker threads so that no process is forked while they run
+    config.impact_pool = impact_handler.start_pool(config.impact_workers)
+
+    try:
+        run_local(args, config)
+    finally:
+        if config.impact_pool is not None:
+            config.impact_pool.close()
+            config.impact_pool.join()
+
+
+def run_local(args, config):
 
     if args.debug:
         callAction = Printout
@@ -370,6 +393,13 @@ class ImpactSet(object):
     # Hashes of impact data
     tmpfiles = {}
 
+    # Hashes of impact files by (path, size, mtime, inode), and hash directories already listed
+    hashes = {}
+    hashdirs = set()
+
+    # Bytes read at a time when hashing an impact file
+    hash_chunksize = 2**20
+
     required = set([
         'yields-grains-state','yields-oilcrop-state','yields-cotton-state',
         'labor-high-productivity-state','labor-low-productivity-state',
@@ -418,10 +448,95 @@ class ImpactSet(object):
 
         self.make_dirs()
 
-    @staticmethod
-    def hashfile(filepath):
+    @classmethod
+    def hashfile(cls, filepath):
+        '''
+        Hash of the path and contents of filepath, read in chunks of hash_chunksize bytes
+        '''
+
         assert os.path.exists(filepath), 'filepath {} does not exist'.format(filepath)
-        return base64.urlsafe_b64encode(hashlib.sha256(filepath+open(filepath, 'r').read()).digest())
+
+        sha = hashlib.sha256(filepath)
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.hash_chunksize), ''):
+                sha.update(chunk)
+
+        return base64.urlsafe_b64encode(sha.digest())
+
+    def hash_impact(self, filepath):
+        '''
+        Return hashfile(filepath), from the hash index if the file is unchanged
+
+        The index holds one small file per (path, size, mtime, inode) in 
+        HASH_INDEX_DIR under the hash directory, written with an atomic rename, 
+        so that concurrent workers sharing the hash directory never read a 
+        partial entry. A changed file has a new key, and is hashed again.
+        '''
+
+        assert os.path.exists(filepath), 'filepath {} does not exist'.format(filepath)
+
+        stat = os.stat(filepath)
+        key = repr((filepath, stat.st_size, stat.st_mtime, stat.st_ino))
+
+        if key in self.hashes:
+            return self.hashes[key]
+
+        indexdir = os.path.join(self.config.hashdir, HASH_INDEX_DIR)
+        entry = os.path.join(indexdir, hashlib.sha1(key).hexdigest())
+
+        try:
+            with open(entry, 'r') as f:
+                hashed = f.read()
+        except IOError:
+            hashed = ''
+
+        if not hashed:
+            hashed = self.hashfile(filepath)
+
+            def write_entry(tmppath):
+                with open(tmppath, 'w') as f:
+                    f.write(hashed)
+
+            try:
+                if not os.path.isdir(indexdir):
+                    os.makedirs(indexdir)
+                self._write_atomic(entry, write_entry)
+            except (IOError, OSError):
+                pass    #   The index is only a cache: hash again next time
+
+        self.hashes[key] = hashed
+        return hashed
+
+    @staticmethod
+    def _write_atomic(filepath, write):
+        '''
+        Call write with a temporary path unique to this process and thread, then rename it to filepath
+        '''
+
+        tmppath = '{}.{}-{}.tmp'.format(filepath, os.getpid(), threading.current_thread().ident)
+        try:
+            write(tmppath)
+            os.rename(tmppath, filepath)
+        finally:
+            if os.path.exists(tmppath):
+                os.remove(tmppath)
+
+    def cached_impacts(self):
+        '''
+        Hashes of the impact files in the hash directory, listed once per process
+
+        Files added by this process are recorded as they are written. Files 
+        added by other workers are found by prep_impact on a miss.
+        '''
+
+        hashdir = os.path.abspath(self.config.hashdir)
+        if hashdir not in self.hashdirs:
+            for h in os.listdir(self.config.hashdir):
+                if not (h.startswith('.') or h.endswith('.tmp')):
+                    self.tmpfiles.setdefault(h, os.path.join(self.config.hashdir, h))
+            self.hashdirs.add(hashdir)
+
+        return self.tmpfiles
 
     def getimpact(self):
         impacts = []
@@ -466,14 +581,31 @@ class ImpactSet(object):
 
         print('\nPreparing job {id} '.format(id=self.runID))
 
-        for filepath in self.getimpact():
-            self.prep_impact(filepath)
+        #   Copy cached impacts, then convert the others in parallel
+        jobs = [job for job in (self.find_impact(filepath) for filepath in self.getimpact()) if job is not None]
+        finals = impact_handler.run_handlers([handler for handler, hashed, standardized in jobs], pool=self.config.impact_pool)
+
+        for (handler, hashed, standardized), final in zip(jobs, finals):
+            self.cache_impact(final, hashed, standardized)
 
     def prep_impact(self, filepath):
         '''
         Load a cached impact file or process a new impact file if not cached
         '''
 
+        job = self.find_impact(filepath)
+        if job is not None:
+            handler, hashed, standardized = job
+            self.cache_impact(handler.run(), hashed, standardized)
+
+    def find_impact(self, filepath):
+        '''
+        Copy the impact file for filepath from the cache
+
+        Returns None if the impact was cached (or is not used), and otherwise 
+        (impact handler, hash, standardized name) to process the impact with
+        '''
+
         filename = os.path.basename(filepath)
         prefix, standardized, std_prefix, impact_type, final_suffix = parse.getNewFilename(filepath)
         
@@ -483,34 +615,37 @@ class ImpactSet(object):
         id_filename, id_prefix = ('{ID}_{name}'.format(ID=self.threadID,name=f) for f in (std_prefix+final_suffix,std_prefix))
 
 
-        hashed = self.hashfile(filepath)
-
-        final = None
+        hashed = self.hash_impact(filepath)
 
         newpath = os.path.join(self.config.tmpdir,id_filename)
+        hashpath = os.path.join(self.config.hashdir, hashed)
 
-        if hashed in self.tmpfiles:
-            if os.path.exists(os.path.join(self.config.hashdir, hashed)):
-                final = self.tmpfiles[hashed]
-                shutil.copy(final, newpath)
+        cached = self.cached_impacts()
 
-        if final is None:
-            for h in os.listdir(self.config.hashdir):
-                self.tmpfiles[h] = os.path.join(self.config.hashdir, h)
+        #   Another worker may have cached this impact since the hash directory was listed
+        if hashed not in cached and os.path.exists(hashpath):
+            cached[hashed] = hashpath
 
-            if hashed in self.tmpfiles:
-                final = os.path.join(self.config.hashdir, hashed)
-                self.tmpfiles[hashed] = final
-                shutil.copy(final, newpath)
+        if hashed in cached:
+            try:
+                shutil.copy(cached[hashed], newpath)
+                print('- Impact file {f} prepared from {o}'.format(f=standardized,o=os.path.dirname(cached[hashed])))
+                return
+            except IOError:
+                cached.pop(hashed, None)  #   Removed from the hash directory: process it again
 
-            else:
-                impact_handler = parse.getFileAction(self.config.tmpdir, std_prefix,filepath,prefix,id_filename,id_prefix)  #   overload move function to keep impacts in place
-                final = impact_handler.run()
-                hashpath = os.path.join(self.config.hashdir, hashed)
-                shutil.copy(final, hashpath)
-                self.tmpfiles[hashed] = hashpath
+        handler = parse.getFileAction(self.config.tmpdir, std_prefix,filepath,prefix,id_filename,id_prefix)  #   overload move function to keep impacts in place
+        return handler, hashed, standardized
+
+    def cache_impact(self, final, hashed, standardized):
+        '''
+        Add the processed impact file final to the cache
+        '''
+
+        hashpath = os.path.join(self.config.hashdir, hashed)
+        self._write_atomic(hashpath, lambda tmppath: shutil.copy(final, tmppath))
+        self.tmpfiles[hashed] = hashpath
 
-        
         print('- Impact file {f} prepared from {o}'.format(f=standardized,o=os.path.dirname(final)))
 
     def clear(self, impacts=None):
@@ -701,7 +836,7 @@ class MedianRun(object):
                             raise OSError('Energy file not found for model {m} wdraw {w}'.format(m=model, w=wdraw))
                             continue
 
-                    impact_set = ImpactSet(threadID=None, runID=runID, econdir=wpath, energyfile=efile, slrfile=slrfile, run_impacts=run_impacts, prep_impacts=prep_impacts)
+                    impact_set = ImpactSet(config=self.config, threadID=None, runID=runID, econdir=wpath, energyfile=efile, slrfile=slrfile, run_impacts=run_impacts, prep_impacts=prep_impacts)
 
                     L = LocalRun(config=self.config, impact_set=impact_set, threadID=1, runID=runID, impactrun=True, together=self.together, iterate=self.iterate, hscen=hscen, callAction=self.callAction, skipAll=self.skipAll, years=self.years)
                     status = L.run()
@@ -794,6 +929,7 @@ def getArguments(default_dataset):
     config.add_argument('-C','--check', default=False, help='check input files, but do not execute runs', action='store_true')
     config.add_argument('-t','--threaded', default=False, help='Threaded run', action='store_true')
     config.add_argument('-n','--threads', default=1, type=int, help='Number of threads in a threaded run')
+    config.add_argument('-w','--impact-workers', default=None, type=int, help='Number of processes converting impact files (default: one per CPU not used by --threads; 1 converts them in the main process)')
     return parser.parse_args()
 
 if __name__=="__main__":
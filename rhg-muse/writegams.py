@@ -3,6 +3,7 @@ Provides utilities for writing pandas data to GAMS GDX files
 '''
 
 import os
+import numpy as np
 import gams
 
 class PyGDX(object):
@@ -10,7 +11,7 @@ class PyGDX(object):
 
 	def __init__(self, ws=None, db=None, filepath=None):
 		self.ws = ws if ws is not None else gams.GamsWorkspace()
-		self.db = db
+		self.db = db if db is not None else self.ws.add_database()
 		self.filepath = filepath
 
 	def load(self, filepath=None):
@@ -192,5 +193,30 @@ class PyGDX(object):
 		return symb
 
 
+	def array_to_param(self, name, domain, keys, values, explanatory_text='', mask=None):
+		'''
+		Add a new parameter from an array, without building a DataFrame
+
+		domain is a list of GamsSets, keys a matching list of the labels along 
+		each axis of values, and mask (default: all) selects the records to add.
+		'''
+
+		if self._get_if_exists(name, gams.GamsParameter):
+			raise ValueError('Parameter "{}" already present in database.'.format(name))
+
+		values = np.asarray(values, dtype=np.float64)
+		if len(domain) != len(keys) or values.shape != tuple(len(k) for k in keys):
+			raise ValueError("Shape of values must match the keys of each set in domain")
+
+		keys = [[str(k) for k in level] for level in keys]
+		mask = np.ones(values.shape, dtype=bool) if mask is None else mask
+
+		symb = self.db.add_parameter_dc(name, domain, explanatory_text)
+		for index in zip(*np.nonzero(mask)):
+			symb.add_record([keys[axis][i] for axis, i in enumerate(index)]).value = float(values[index])
+
+		return symb
+
+
 	def series_to_param(self, name, series, explanatory_text='', exists='update', domain=None, set_exists=None, set_text=None):
 		return self.dataframe_to_param(name, series, explanatory_text, exists, domain, set_exists, set_text)
\ No newline at end of file